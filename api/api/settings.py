@@ -39,10 +39,13 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
     'ninja',
     'corsheaders',
+    'powerSaving',
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'powerSaving.metrics.MetricsMiddleware',  # powerSaving 처리 시간 지표, Server-Timing 헤더
+    'powerSaving.compression.CompressionMiddleware',  # powerSaving 응답 압축 (gzip/br/zstd)
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -52,6 +55,14 @@ MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',  # CORS 미들웨어 추가
 ]
 
+# KEPCO OpenAPI 연동 (powerSaving.conf). 같은 이름의 KEPCO_* 환경 변수가 있으면 환경 변수 값을 사용
+# SERVICE_KEYS에 키를 여러 개 넣으면 호출을 키들에 나누어 보냄 (환경 변수는 쉼표 구분)
+KEPCO = {
+    'BASE_URL': 'https://opm.kepco.co.kr:11080/OpenAPI',
+    'SERVICE_KEYS': ['bpb89eyd7bg430vckh8t'],
+    'CUSTOMER_CSV': 'kepcolist_gg.csv',
+}
+
 # CORS 설정
 CORS_ALLOW_ALL_ORIGINS = True  # 개발용. 프로덕션에서는 특정 도메인만 허용하세요
 
@@ -17,8 +17,10 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path
 from powerSaving.api import api  # api.py에서 정의한 api 객체 임포트
+from powerSaving.metrics import metrics_view
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path("ninja-api/", api.urls),  # /api/ 경로로 API 엔드포인트 연결
+    path("metrics", metrics_view),  # Prometheus 지표 (현재 워커 기준)
 ]
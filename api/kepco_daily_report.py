@@ -6,10 +6,43 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email.mime.text import MIMEText
 from email import encoders
+import argparse
+import io
+import multiprocessing
 import os
+import sys
 import json
-from openpyxl import load_workbook
-from openpyxl.worksheet.table import Table, TableStyleInfo
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Read KEPCO settings (base URL, service keys, customer list) from the same Django settings as the API
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "api.settings")
+
+from powerSaving.customers import get_registry
+from powerSaving.fetch import fetch_all
+from powerSaving.kepco_client import get_client
+from powerSaving.parsing import daily_total, interval_frame
+from powerSaving.export import write_xlsx
+from powerSaving.checkpoint import ReportCheckpoint
+
+# Days processed in parallel by default (--workers)
+REPORT_WORKERS = 2
+
+# Workbook worker processes start from a fresh server process, never a fork of this threaded process
+# (spawn where forkserver is unavailable, e.g. Windows)
+POOL_START_METHOD = "forkserver"
+
+# Column order of the 15-minute report
+INTERVAL_COLUMNS = [
+    "Customer Number",
+    "MeterNo",
+    "Date",
+    "Time",
+    "Bonbu",
+    "Center",
+    "Team",
+    "Guksa",
+    "Power Usage",
+]
 
 
 def convert_date_format(date_str):
@@ -20,241 +53,162 @@ def convert_date_format(date_str):
         return date_str
 
 
-def generate_kepco_daily_report():
-    """Generate daily total power usage report (kepcoDailyData logic)."""
-    try:
-        # Set date to yesterday
-        today = datetime.today() - timedelta(days=1)
-        date = today.strftime("%Y%m%d")  # Format as YYYYMMDD
-
-        # Input CSV file path
-        # input_csv = "kepcolist_gg.csv"
-        input_csv = "kepcolist_gg.csv"
-
-        # API URL and static parameters
-        url = "https://opm.kepco.co.kr:11080/OpenAPI/getDayLpData.do"
-        service_key = "bpb89eyd7bg430vckh8t"
-
-        # Read customer numbers from CSV
-        customer_data = pd.read_csv(input_csv, dtype=str)
-
-        # Prepare a list to store the results
-        results = []
-
-        for _, row in customer_data.iterrows():
-            cust_no = row.get("고객번호")
-            if not cust_no:
-                continue
-            bonbu = row.get("본부명")
-            center = row.get("센터")
-            team = row.get("팀")
-            guksa = row.get("국사")
-
-            # API call
-            params = {
-                "custNo": cust_no,
-                "date": date,
-                "serviceKey": service_key,
-                "returnType": "02",
-            }
-            response = requests.get(url, params=params)
-
-            if response.status_code == 200:
-                data = response.json()
-                day_lp_data = data.get("dayLpDataInfoList", [])
-
-                if day_lp_data:
-                    total_power = 0
-                    for record in day_lp_data:
-                        total_power += sum(
-                            value
-                            for key, value in record.items()
-                            if key.startswith("pwr_qty")
-                            and isinstance(value, (int, float))
-                        )
-                    results.append(
-                        {
-                            "Customer Number": cust_no,
-                            "Date": convert_date_format(date),
-                            "Bonbu": bonbu,
-                            "Center": center,
-                            "Team": team,
-                            "Guksa": guksa,
-                            "Power Usage": total_power,
-                        }
-                    )
-                else:
-                    results.append(
-                        {
-                            "Customer Number": cust_no,
-                            "Date": convert_date_format(date),
-                            "Bonbu": bonbu,
-                            "Center": center,
-                            "Team": team,
-                            "Guksa": guksa,
-                            "Power Usage": None,
-                        }
-                    )
+def yesterday():
+    """Yesterday as YYYYMMDD (the report date)."""
+    return (datetime.today() - timedelta(days=1)).strftime("%Y%m%d")
+
+
+def fetch_day_lp_data(date, customers, checkpoint=None):
+    """
+    Fetch getDayLpData.do once per customer for date (shared by both reports).
+    Returns [(customer record, response dict or the RequestException)] in CSV order.
+    With a checkpoint, responses saved by an earlier (interrupted) run are reused and
+    every new response with data is saved as soon as it arrives.
+    """
+    # KEPCO API client (process-wide pooled session)
+    client = get_client()
+    saved = checkpoint.load(date) if checkpoint is not None else {}
+
+    def fetch_customer(row):
+        if row.cust_no in saved:
+            return row, saved[row.cust_no]
+        try:
+            data = client.get_day_lp_data(row.cust_no, date)
+        except requests.RequestException as e:
+            print(f"API Error for Customer Number {row.cust_no}: {str(e)}")
+            return row, e
+        # Empty responses may be published later, so they are fetched again on resume
+        if checkpoint is not None and data.get("dayLpDataInfoList"):
+            checkpoint.save(date, row.cust_no, data)
+        return row, data
+
+    # Call the API for all customers concurrently (results keep CSV order)
+    return fetch_all(fetch_customer, customers)
+
+
+def daily_report_frame(date, fetched):
+    """Daily total power usage per customer (kepcoDailyData logic)."""
+    results = []
+    for row, data in fetched:
+        # Keep Power Usage numeric; failures are reported in the Status column
+        power_usage = None
+        if isinstance(data, Exception):
+            status = f"error: {str(data)}"
+        else:
+            day_lp_data = data.get("dayLpDataInfoList", [])
+            if day_lp_data:
+                power_usage = daily_total(day_lp_data)
+                status = "ok"
             else:
-                results.append(
-                    {
-                        "Customer Number": cust_no,
-                        "Date": convert_date_format(date),
-                        "Bonbu": bonbu,
-                        "Center": center,
-                        "Team": team,
-                        "Guksa": guksa,
-                        "Power Usage": "API Error",
-                    }
-                )
-
-        # Convert results to a DataFrame
-        df = pd.DataFrame(results)
-
-        # Generate timestamped Excel filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        excel_filename = f"kepco_daily_report_{timestamp}.xlsx"
-
-        # Save DataFrame to Excel
-        df.to_excel(excel_filename, index=False, engine="openpyxl")
-
-        # Load the workbook and add a table
-        wb = load_workbook(excel_filename)
-        ws = wb.active
-        # Define table range (from A1 to last column and row)
-        table_range = f"A1:{chr(65 + len(df.columns) - 1)}{len(df) + 1}"
-        table = Table(displayName="DailyReportTable", ref=table_range)
-        # Apply table style
-        style = TableStyleInfo(
-            name="TableStyleMedium2",
-            showFirstColumn=False,
-            showLastColumn=False,
-            showRowStripes=True,
-            showColumnStripes=False,
+                status = "no data"
+
+        results.append({
+            "Customer Number": row.cust_no,
+            "Date": convert_date_format(date),
+            "Bonbu": row.bonbu,
+            "Center": row.center,
+            "Team": row.team,
+            "Guksa": row.guksa,
+            "Power Usage": power_usage,
+            "Status": status,
+        })
+    return pd.DataFrame(results)
+
+
+def min15_report_frame(date, fetched):
+    """15-minute interval power usage rows (kepcoDailyData15min logic). Customers without data are skipped."""
+    frames = []
+    for row, data in fetched:
+        if isinstance(data, Exception):
+            continue
+        day_lp_data = data.get("dayLpDataInfoList", [])
+        if not day_lp_data:
+            print(f"No data found for Customer Number {row.cust_no}")
+            continue
+
+        # Expand pwr_qtyHHMM values into 15-minute rows (Time: HHMM)
+        rows = interval_frame(day_lp_data).assign(
+            **{
+                "Customer Number": row.cust_no,
+                "Date": convert_date_format(date),
+                "Bonbu": row.bonbu,
+                "Center": row.center,
+                "Team": row.team,
+                "Guksa": row.guksa,
+            }
         )
-        table.tableStyleInfo = style
-        ws.add_table(table)
-        wb.save(excel_filename)
+        frames.append(rows[INTERVAL_COLUMNS])
 
-        return excel_filename, True
+    # Concatenate per-customer frames
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
 
-        return excel_filename, True
 
-    except Exception as e:
-        print(f"Error generating daily report: {str(e)}")
-        return None, False
+# (file name prefix, frame builder, Excel table name)
+REPORTS = (
+    ("kepco_daily_report", daily_report_frame, "DailyReportTable"),
+    ("kepco_15min_report", min15_report_frame, "Min15ReportTable"),
+)
 
 
-def generate_kepco_15min_report():
-    """Generate 15-minute interval power usage report (kepcoDailyData15min logic)."""
-    try:
-        # Set date to yesterday
-        today = datetime.today() - timedelta(days=1)
-        date = today.strftime("%Y%m%d")  # Format as YYYYMMDD
-
-        # Input CSV file path
-        input_csv = "kepcolist_gg.csv"
-
-        # API URL and static parameters
-        url = "https://opm.kepco.co.kr:11080/OpenAPI/getDayLpData.do"
-        service_key = "bpb89eyd7bg430vckh8t"
-
-        # Read customer numbers from CSV
-        customer_data = pd.read_csv(input_csv, dtype=str)
-
-        # Prepare a list to store the results
-        results = []
-
-        for _, row in customer_data.iterrows():
-            cust_no = row.get("고객번호")
-            if not cust_no:
-                continue
-            bonbu = row.get("본부명")
-            center = row.get("센터")
-            team = row.get("팀")
-            guksa = row.get("국사")
-
-            # API call
-            params = {
-                "custNo": cust_no,
-                "date": date,
-                "serviceKey": service_key,
-                "returnType": "02",
-            }
-            response = requests.get(url, params=params)
-
-            if response.status_code == 200:
-                data = response.json()
-                day_lp_data = data.get("dayLpDataInfoList", [])
-
-                if day_lp_data:
-                    for record in day_lp_data:
-                        # Iterate over pwr_qtyXXXX keys
-                        for key, value in record.items():
-                            if key.startswith("pwr_qty") and isinstance(
-                                value, (int, float)
-                            ):
-                                # Extract time from key (e.g., pwr_qty0015 → 00:15)
-                                time_str = key[-4:]  # Last 4 characters (HHMM)
-                                results.append(
-                                    {
-                                        "Customer Number": cust_no,
-                                        "MeterNo": record.get("meterNo"),
-                                        "Date": convert_date_format(date),
-                                        "Time": time_str,
-                                        "Bonbu": bonbu,
-                                        "Center": center,
-                                        "Team": team,
-                                        "Guksa": guksa,
-                                        "Power Usage": value,
-                                    }
-                                )
-                else:
-                    print(f"No data found for Customer Number {cust_no}")
-                    continue
-            else:
-                print(
-                    f"API Error for Customer Number {cust_no}: {response.status_code}"
-                )
-                continue
-
-        # Convert results to a DataFrame
-        df = pd.DataFrame(results)
-
-        # Generate timestamped Excel filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        excel_filename = f"kepco_15min_report_{timestamp}.xlsx"
-
-        # Save DataFrame to Excel
-        df.to_excel(excel_filename, index=False, engine="openpyxl")
-
-        # Load the workbook and add a table
-        wb = load_workbook(excel_filename)
-        ws = wb.active
-        # Define table range (from A1 to last column and row)
-        table_range = f"A1:{chr(65 + len(df.columns) - 1)}{len(df) + 1}"
-        table = Table(displayName="Min15ReportTable", ref=table_range)
-        # Apply table style
-        style = TableStyleInfo(
-            name="TableStyleMedium2",
-            showFirstColumn=False,
-            showLastColumn=False,
-            showRowStripes=True,
-            showColumnStripes=False,
-        )
-        table.tableStyleInfo = style
-        ws.add_table(table)
-        wb.save(excel_filename)
+def workbook_bytes(df, table_name):
+    """Build the styled Excel workbook for df in memory and return its bytes."""
+    output = io.BytesIO()
+    write_xlsx(df, output, table_name=table_name)
+    return output.getvalue()
 
-        return excel_filename, True
 
-    except Exception as e:
-        print(f"Error generating 15min report: {str(e)}")
-        return None, False
+def report_pool(max_workers=len(REPORTS)):
+    """Process pool for building workbooks (openpyxl is CPU bound)."""
+    method = POOL_START_METHOD if POOL_START_METHOD in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context(method))
 
 
-def send_email_with_attachments(excel_files):
-    """Send email with multiple Excel file attachments."""
+def generate_reports(date=None, customers=None, checkpoint=None, pool=None):
+    """
+    Generate both reports for date (default: yesterday) from a single fetch per customer.
+    Workbooks are built in parallel in pool (default: a report_pool() for this call) and kept in memory.
+    Returns [(filename, xlsx bytes)] for the reports that were built.
+    """
+    date = date or yesterday()
+    try:
+        # Customer records from the configured customer list (loaded once per process)
+        customers = get_registry().all() if customers is None else customers
+        fetched = fetch_day_lp_data(date, customers, checkpoint)
+    except Exception as e:
+        print(f"Error fetching report data: {str(e)}")
+        return []
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    jobs = []
+    for prefix, build_frame, table_name in REPORTS:
+        try:
+            jobs.append((f"{prefix}_{date}_{timestamp}.xlsx", build_frame(date, fetched), table_name))
+        except Exception as e:
+            print(f"Error generating {prefix}: {str(e)}")
+
+    attachments = []
+    if not jobs:
+        return attachments
+    if pool is None:
+        with report_pool(len(jobs)) as pool:
+            return build_workbooks(pool, jobs)
+    return build_workbooks(pool, jobs)
+
+
+def build_workbooks(pool, jobs):
+    """Build [(filename, frame, table name)] in pool. Returns [(filename, xlsx bytes)] for the ones that succeeded."""
+    attachments = []
+    futures = [(filename, pool.submit(workbook_bytes, df, table_name)) for filename, df, table_name in jobs]
+    for filename, future in futures:
+        try:
+            attachments.append((filename, future.result()))
+        except Exception as e:
+            print(f"Error building {filename}: {str(e)}")
+    return attachments
+
+
+def send_email_with_attachments(attachments, date=None):
+    """Send email with in-memory Excel attachments [(filename, bytes)]. date: report date (YYYYMMDD) for backfills."""
     try:
         # Email configuration
         smtp_server = "smtp.gmail.com"  # e.g., "smtp.gmail.com"
@@ -275,24 +229,22 @@ def send_email_with_attachments(excel_files):
         msg["Subject"] = (
             f"KEPCO 일일 및 15분 간격 보고서 - {datetime.now().strftime('%Y-%m-%d')}"
         )
+        if date and date != yesterday():
+            msg["Subject"] += f" ({convert_date_format(date)} 데이터)"
 
         # Email body
         body = "첨부된 파일은 KEPCO 일일 전력 사용량 보고서와 15분 간격 전력 사용량 보고서입니다."
         msg.attach(MIMEText(body, "plain"))
 
-        # Attach Excel files
-        for excel_filename in excel_files:
-            if excel_filename and os.path.exists(excel_filename):
-                with open(excel_filename, "rb") as attachment:
-                    part = MIMEBase("application", "octet-stream")
-                    part.set_payload(attachment.read())
-                encoders.encode_base64(part)
-                part.add_header(
-                    "Content-Disposition", f"attachment; filename= {excel_filename}"
-                )
-                msg.attach(part)
-            else:
-                print(f"Attachment file not found: {excel_filename}")
+        # Attach Excel workbooks
+        for excel_filename, content in attachments:
+            part = MIMEBase("application", "octet-stream")
+            part.set_payload(content)
+            encoders.encode_base64(part)
+            part.add_header(
+                "Content-Disposition", f"attachment; filename= {excel_filename}"
+            )
+            msg.attach(part)
 
         # Send email
         with smtplib.SMTP(smtp_server, smtp_port) as server:
@@ -300,7 +252,7 @@ def send_email_with_attachments(excel_files):
             server.login(sender_email, sender_password)
             server.send_message(msg)
 
-        print(f"이메일 전송 성공: {', '.join(excel_files)}")
+        print(f"이메일 전송 성공: {', '.join(filename for filename, _ in attachments)}")
         return True
 
     except Exception as e:
@@ -308,38 +260,107 @@ def send_email_with_attachments(excel_files):
         return False
 
 
-def main():
-    # Generate daily report
-    daily_excel, daily_success = generate_kepco_daily_report()
+def report_dates(args):
+    """Report dates (YYYYMMDD, oldest first) selected by the command line options."""
+    if args.date:
+        return [args.date]
+    end = datetime.strptime(args.end, "%Y%m%d") if args.end else datetime.today() - timedelta(days=1)
+    if args.backfill:
+        start = end - timedelta(days=args.backfill - 1)
+    elif args.start:
+        start = datetime.strptime(args.start, "%Y%m%d")
+    else:
+        start = end
+    if start > end:
+        raise ValueError(f"start date {start:%Y%m%d} is after end date {end:%Y%m%d}")
+    return [(start + timedelta(days=n)).strftime("%Y%m%d") for n in range((end - start).days + 1)]
+
+
+def run_day(date, args, checkpoint=None, pool=None):
+    """
+    Generate and deliver the reports for one day. Returns True when the day is done.
+    With a checkpoint (range mode) completed days are skipped and a day is marked done
+    only after its reports were saved and, unless --no-email, sent.
+    """
+    if checkpoint is not None:
+        if checkpoint.is_done(date) and not args.force:
+            print(f"{date}: 이미 완료된 날짜입니다 (--force로 다시 실행).")
+            return True
+        if args.force:
+            checkpoint.reset(date)
+
+    attachments = generate_reports(date, checkpoint=checkpoint, pool=pool)
+    if len(attachments) < len(REPORTS):
+        print(f"{date}: 보고서 생성 실패.")
+        return False
+
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+        for filename, content in attachments:
+            with open(os.path.join(args.output_dir, filename), "wb") as output:
+                output.write(content)
+        print(f"{date}: 보고서 저장: {args.output_dir}")
+
+    if not args.no_email:
+        if not send_email_with_attachments(attachments, date):
+            print(f"{date}: 보고서 생성 성공, 이메일 전송 실패.")
+            return False
+        print(f"{date}: 보고서 생성 및 이메일 전송 성공.")
+
+    if checkpoint is not None:
+        checkpoint.mark_done(date, [filename for filename, _ in attachments])
+    return True
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="KEPCO daily / 15-minute power usage reports (default: yesterday, sent by email).",
+    )
+    parser.add_argument("--date", help="report date YYYYMMDD")
+    parser.add_argument("--start", help="first report date YYYYMMDD (with --end, default end: yesterday)")
+    parser.add_argument("--end", help="last report date YYYYMMDD")
+    parser.add_argument("--backfill", type=int, help="report the last N days up to --end (default: yesterday)")
+    parser.add_argument("--workers", type=int, default=REPORT_WORKERS, help=f"days processed in parallel (default: {REPORT_WORKERS})")
+    parser.add_argument("--output-dir", help="also save the workbooks into this directory")
+    parser.add_argument("--no-email", action="store_true", help="do not send email (use with --output-dir)")
+    parser.add_argument("--force", action="store_true", help="with --start/--end/--backfill, run days that were already completed again")
+    args = parser.parse_args(argv)
+
+    if args.date and (args.start or args.end or args.backfill):
+        parser.error("--date cannot be combined with --start, --end or --backfill")
+    if args.start and args.backfill:
+        parser.error("--start cannot be combined with --backfill")
+    if args.backfill is not None and args.backfill < 1:
+        parser.error("--backfill must be at least 1")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    try:
+        args.dates = report_dates(args)
+    except ValueError as e:
+        parser.error(str(e))
+    # Date-range runs resume from the checkpoint; a single-day run always generates and sends again
+    args.resume = bool(args.start or args.end or args.backfill)
+    return args
+
 
-    # Generate 15-minute report
-    min15_excel, min15_success = generate_kepco_15min_report()
+def main(argv=None):
+    args = parse_args(argv)
+    # Per (customer, day) progress so an interrupted range run resumes where it left off
+    checkpoint = ReportCheckpoint() if args.resume else None
 
-    # Collect Excel files to attach
-    excel_files = []
-    if daily_success and daily_excel:
-        excel_files.append(daily_excel)
-    if min15_success and min15_excel:
-        excel_files.append(min15_excel)
+    workers = min(args.workers, len(args.dates))
+    # One workbook pool for all days, created before any fetch threads start
+    with report_pool(workers * len(REPORTS)) as pool:
+        # Days run in parallel (bounded); KEPCO calls still share the client's rate limit
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            done = dict(zip(args.dates, executor.map(lambda date: run_day(date, args, checkpoint, pool), args.dates)))
 
-    # Send email with attachments
-    if excel_files:
-        email_success = send_email_with_attachments(excel_files)
-        if email_success:
-            print("보고서 생성 및 이메일 전송 성공.")
-        else:
-            print("보고서 생성 성공, 이메일 전송 실패.")
-
-        # Clean up Excel files
-        for excel_file in excel_files:
-            try:
-                os.remove(excel_file)
-                print(f"임시 파일 삭제: {excel_file}")
-            except Exception as e:
-                print(f"임시 파일 삭제 오류: {str(e)}")
-    else:
-        print("보고서 생성 실패.")
+    failed = [date for date, ok in done.items() if not ok]
+    if failed:
+        print(f"실패한 날짜: {', '.join(failed)}" + (" (다시 실행하면 이어서 진행합니다)" if args.resume else ""))
+        return 1
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -1,3 +1,41 @@
 from django.contrib import admin
 
+from .models import Alert, Customer, DayStat, LoadProfile, Rollup
+
 # Register your models here.
+
+
+@admin.register(Customer)
+class CustomerAdmin(admin.ModelAdmin):
+    list_display = ("cust_no", "bonbu", "center", "team", "guksa")
+    list_filter = ("bonbu", "center", "team")
+    search_fields = ("cust_no", "guksa")
+
+
+@admin.register(LoadProfile)
+class LoadProfileAdmin(admin.ModelAdmin):
+    list_display = ("customer", "meter_no", "date", "time", "power_usage")
+    date_hierarchy = "date"
+    raw_id_fields = ("customer",)
+
+
+@admin.register(Rollup)
+class RollupAdmin(admin.ModelAdmin):
+    list_display = ("granularity", "level", "period", "bonbu", "center", "team", "guksa", "cust_no", "power_sum", "power_peak")
+    list_filter = ("granularity", "level")
+    date_hierarchy = "start_date"
+
+
+@admin.register(DayStat)
+class DayStatAdmin(admin.ModelAdmin):
+    list_display = ("customer", "date", "power_sum", "power_peak", "load_factor", "sum_score", "peak_score")
+    date_hierarchy = "date"
+    raw_id_fields = ("customer",)
+
+
+@admin.register(Alert)
+class AlertAdmin(admin.ModelAdmin):
+    list_display = ("period", "kind", "severity", "source", "level", "guksa", "cust_no", "message")
+    list_filter = ("kind", "severity", "source", "level")
+    date_hierarchy = "date"
+    search_fields = ("guksa", "cust_no")
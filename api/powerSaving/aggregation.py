@@ -0,0 +1,171 @@
+"""
+전력 사용량 서버 측 집계 (/powerSaving/aggregate).
+
+(고객, 날짜)별 15분 구간 합계를 long-format 프레임으로 쌓은 뒤
+고객 목록의 조직 계층(본부 → 센터 → 팀 → 국사 → 고객)과 시간 단위(15min, hour, day, week, month)로
+pandas groupby 벡터 연산으로 집계합니다.
+
+집계 값 (그룹 기준)
+    - Power Usage Sum: 기간(Period) 내 사용량 합계
+    - Power Usage Peak: 그룹 전체의 15분 사용량이 가장 큰 구간의 값, Peak Time은 그 구간의 종료 시각
+    - Power Usage Avg: 기간 내 15분 구간당 평균 사용량
+    - Customers: 기간 내 데이터가 있는 고객 수
+"""
+import numpy as np
+import pandas as pd
+
+from .parsing import SLOT_TIMES
+
+# groupBy → 그룹 컬럼 (상위 계층을 함께 표시해 이름이 같은 팀/국사를 구분)
+GROUP_LEVELS = {
+    "all": [],
+    "bonbu": ["Bonbu"],
+    "center": ["Bonbu", "Center"],
+    "team": ["Bonbu", "Center", "Team"],
+    "guksa": ["Bonbu", "Center", "Team", "Guksa"],
+    "customer": ["Bonbu", "Center", "Team", "Guksa", "Customer Number"],
+}
+
+# bucket → Period 표시 형식 (Period는 구간 시작 시각)
+BUCKETS = {
+    "15min": "%Y-%m-%d %H:%M",
+    "hour": "%Y-%m-%d %H:%M",
+    "day": "%Y-%m-%d",
+    "week": "%Y-%m-%d",
+    "month": "%Y-%m",
+}
+
+VALUE_COLUMNS = ["Customers", "Power Usage Sum", "Power Usage Peak", "Peak Time", "Power Usage Avg"]
+
+# 15분 구간 시작 시각 오프셋 (SLOT_TIMES는 구간 종료 시각)
+_SLOT_OFFSETS = np.arange(len(SLOT_TIMES)) * np.timedelta64(15, "m")
+_SLOT_LENGTH = pd.Timedelta(minutes=15)
+
+
+def interval_long(days):
+    """
+    [(CustomerRecord, YYYYMMDD, 길이 96 구간 합계 배열)]을
+    (Customer Number, Bonbu, Center, Team, Guksa, Slot(구간 시작), Power Usage) long-format으로 변환합니다.
+    값이 없는 구간(NaN)은 제외합니다.
+    """
+    if not days:
+        return pd.DataFrame(columns=["Customer Number", "Bonbu", "Center", "Team", "Guksa", "Slot", "Power Usage"])
+
+    records, dates, vectors = zip(*days)
+    values = np.vstack(vectors)
+    starts = np.array([np.datetime64(f"{d[:4]}-{d[4:6]}-{d[6:8]}", "m") for d in dates])[:, None] + _SLOT_OFFSETS
+    mask = ~np.isnan(values)
+    row_idx = np.nonzero(mask)[0]
+
+    def column(attr):
+        return pd.Categorical(np.asarray([getattr(r, attr) or "" for r in records], dtype=object)[row_idx])
+
+    return pd.DataFrame({
+        "Customer Number": column("cust_no"),
+        "Bonbu": column("bonbu"),
+        "Center": column("center"),
+        "Team": column("team"),
+        "Guksa": column("guksa"),
+        "Slot": starts[mask],
+        "Power Usage": values[mask],
+    })
+
+
+def bucket_start(slots, bucket):
+    """구간 시작 시각(Series)을 bucket의 시작 시각으로 내림합니다."""
+    if bucket == "15min":
+        return slots
+    if bucket == "hour":
+        return slots.dt.floor("h")
+    if bucket == "day":
+        return slots.dt.floor("D")
+    if bucket == "week":
+        # 월요일 시작
+        return slots.dt.to_period("W-SUN").dt.start_time
+    return slots.dt.to_period("M").dt.start_time
+
+
+def summarize(frame, group_by="team", bucket="day"):
+    """
+    interval_long 프레임을 group_by(GROUP_LEVELS) × bucket으로 집계합니다.
+    반환 컬럼: 그룹 컬럼, Period(구간 시작 Timestamp), Customers, Power Usage Sum, Power Usage Peak,
+    Peak Time, Intervals(값이 있는 15분 구간 수)
+    """
+    keys = GROUP_LEVELS[group_by]
+    period_keys = keys + ["Period"]
+    if frame.empty:
+        return pd.DataFrame(columns=period_keys + ["Customers", "Power Usage Sum", "Power Usage Peak", "Peak Time", "Intervals"])
+
+    frame = frame.assign(Period=bucket_start(frame["Slot"], bucket))
+
+    # 그룹 전체의 15분 구간별 사용량
+    per_slot = (
+        frame.groupby(period_keys + ["Slot"], observed=True, sort=False)["Power Usage"]
+        .sum()
+        .reset_index()
+    )
+    grouped = per_slot.groupby(period_keys, observed=True, sort=False)["Power Usage"]
+    result = grouped.agg(["sum", "count"]).rename(columns={"sum": "Power Usage Sum", "count": "Intervals"})
+
+    # 피크 구간: 값이 가장 큰 행을 그룹별로 하나씩 (동률이면 이른 구간)
+    peaks = (
+        per_slot.sort_values(["Power Usage", "Slot"], ascending=[False, True], kind="stable")
+        .drop_duplicates(period_keys)
+        .set_index(period_keys)
+    )
+    result["Power Usage Peak"] = peaks["Power Usage"]
+    result["Peak Time"] = (peaks["Slot"] + _SLOT_LENGTH).dt.strftime("%Y-%m-%d %H:%M")
+    result["Customers"] = frame.groupby(period_keys, observed=True, sort=False)["Customer Number"].nunique()
+
+    result = result.reset_index()
+    for key in keys:
+        result[key] = result[key].astype(object)
+    return result
+
+
+def combine(summary, customer_summary, group_by, bucket):
+    """
+    작은 단위 집계(summarize 결과, 예: day)를 더 큰 bucket(week, month)으로 다시 집계합니다.
+    피크는 작은 단위 피크 중 최댓값이므로 원본 15분 값 없이도 정확합니다.
+    customer_summary: 같은 기간의 customer 레벨 집계 (기간 내 고객 수 계산용)
+    """
+    keys = GROUP_LEVELS[group_by]
+    period_keys = keys + ["Period"]
+    summary = summary.assign(Period=bucket_start(summary["Period"], bucket))
+
+    result = summary.groupby(period_keys, sort=False)[["Power Usage Sum", "Intervals"]].sum()
+    peaks = (
+        summary.sort_values(["Power Usage Peak", "Peak Time"], ascending=[False, True], kind="stable")
+        .drop_duplicates(period_keys)
+        .set_index(period_keys)
+    )
+    result["Power Usage Peak"] = peaks["Power Usage Peak"]
+    result["Peak Time"] = peaks["Peak Time"]
+
+    customer_summary = customer_summary.assign(Period=bucket_start(customer_summary["Period"], bucket))
+    result["Customers"] = customer_summary.groupby(period_keys, sort=False)["Customer Number"].nunique()
+    return result.reset_index()
+
+
+def finalize(summary, group_by, bucket):
+    """summarize/combine 결과를 API 출력 형태(Period 문자열, Power Usage Avg)로 정리합니다."""
+    keys = GROUP_LEVELS[group_by]
+    columns = ["Period"] + keys + VALUE_COLUMNS
+    if summary.empty:
+        return pd.DataFrame(columns=columns)
+
+    result = summary.sort_values(["Period"] + keys, kind="stable")
+    result = result.assign(**{
+        "Period": result["Period"].dt.strftime(BUCKETS[bucket]),
+        "Power Usage Avg": result["Power Usage Sum"] / result["Intervals"],
+        "Customers": result["Customers"].astype(int),
+    })
+    return result[columns].reset_index(drop=True)
+
+
+def aggregate(frame, group_by="team", bucket="day"):
+    """
+    interval_long 프레임을 group_by(GROUP_LEVELS) × bucket(BUCKETS)으로 집계합니다.
+    반환 컬럼: Period, 그룹 컬럼, VALUE_COLUMNS (Period → 그룹 순 정렬)
+    """
+    return finalize(summarize(frame, group_by, bucket), group_by, bucket)
@@ -0,0 +1,403 @@
+"""
+15분 사용량 분석과 임계치 알림 (DayStat / Alert 모델, /powerSaving/analysis, /powerSaving/alerts).
+
+고객 x 날짜 지표 (pandas 벡터 연산)
+    - 일 사용량(kWh), 15분 최대 사용량과 최대수요전력(kW = 15분 사용량 x DEMAND_FACTOR), Peak Time
+    - Load Factor: 평균 수요 / 최대 수요 (0~1)
+    - 기준선(Baseline): 직전 BASELINE_DAYS일 값의 중앙값 (값이 MIN_BASELINE_DAYS일 이상일 때)
+    - 이상 점수(Score): (값 - 기준선) / (IQR / 1.349) (강건 z-score, 일 사용량과 최대 사용량 각각)
+
+알림 (Alert)
+    - contract_peak: 국사/고객의 최대수요전력이 계약전력의 CONTRACT_WARNING_RATIO 이상(warning), 초과(critical)
+    - usage_anomaly / peak_anomaly: 이상 점수의 절댓값이 ANOMALY_THRESHOLD 이상이고 기준선과 ANOMALY_MIN_CHANGE 이상 차이 (warning)
+계약전력(kW)은 고객 목록 CSV의 계약전력 컬럼이며, 국사의 계약전력은 소속 고객 계약전력의 합입니다.
+계약전력이 없는 고객/국사는 contract_peak를 검사하지 않습니다. 기본 kepcolist_gg.csv에는 이 컬럼이 없으므로
+contract_peak 알림을 쓰려면 고객 목록 CSV에 계약전력 컬럼을 추가해야 합니다.
+
+증분 실행
+    store.ingest가 날짜를 저장하면(롤업 갱신 후) update_analysis가 그 날짜의 15분 값만 읽어 지표를 계산하고,
+    기준선과 이상 점수는 저장된 DayStat(일 지표)만 읽어 계산합니다 (과거 15분 값을 다시 읽지 않음).
+    과거 날짜를 backfill하면 그 뒤 BASELINE_DAYS일의 기준선/점수와 이상 알림도 DayStat으로 다시 계산합니다.
+    실시간 폴러(live)가 새 15분 구간을 받으면 LiveDemandCheck가 구간별 국사/고객 수요를 계약전력과 비교합니다.
+"""
+import math
+import threading
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import pandas as pd
+from django.db import transaction
+from django.utils import timezone
+
+from .aggregation import summarize
+from .customers import get_registry
+from .metrics import stage
+from .models import Alert, Customer, DayStat
+from .rollups import stored_frame
+from .store import BATCH_SIZE
+
+# 15분 사용량(kWh) → 수요전력(kW)
+DEMAND_FACTOR = 4
+
+# 기준선 기간(일)과 기준선을 계산하는 최소 이력 일수
+BASELINE_DAYS = 28
+MIN_BASELINE_DAYS = 7
+# 정규분포에서 IQR / 1.349 = 표준편차
+IQR_SCALE = 1.349
+
+# 이상 점수 알림 기준 (|score|), 변동이 작은 고객의 사소한 차이는 제외하도록 기준선 대비 최소 변화율도 함께 적용
+ANOMALY_THRESHOLD = 3.5
+ANOMALY_MIN_CHANGE = 0.1
+# 계약전력 대비 최대수요전력 warning 비율 (1 초과는 critical)
+CONTRACT_WARNING_RATIO = 0.9
+
+# 실시간 수요 합계를 유지하는 시간
+LIVE_SPAN = timedelta(hours=24)
+
+# 알림 대상 계층 컬럼 (Alert 필드 → 집계 프레임 컬럼)
+_GROUP_FIELDS = {
+    "bonbu": "Bonbu",
+    "center": "Center",
+    "team": "Team",
+    "guksa": "Guksa",
+    "cust_no": "Customer Number",
+}
+
+STAT_COLUMNS = [
+    "Customer Number", "Bonbu", "Center", "Team", "Guksa", "Date",
+    "Power Usage Sum", "Power Usage Peak", "Peak Demand", "Peak Time", "Load Factor",
+    "Baseline Sum", "Sum Score", "Baseline Peak", "Peak Score", "Contract Power",
+]
+ALERT_COLUMNS = [
+    "Period", "Kind", "Severity", "Source", "Level", "Bonbu", "Center", "Team", "Guksa", "Customer Number",
+    "Value", "Threshold", "Message", "Raised At",
+]
+
+
+def _days(dates):
+    return sorted({d if not isinstance(d, str) else datetime.strptime(d, "%Y%m%d").date() for d in dates})
+
+
+def _contract(value):
+    try:
+        value = float(str(value).replace(",", ""))
+    except (TypeError, ValueError):
+        return None
+    return value if value > 0 and not math.isnan(value) else None
+
+
+def contracts():
+    """
+    ({고객번호: 계약전력 kW}, {(본부, 센터, 팀, 국사): 계약전력 합계 kW})를 고객 목록 CSV에서 만듭니다.
+    기본 kepcolist_gg.csv에는 계약전력 컬럼이 없으므로 두 dict 모두 비어 있고 contract_peak 알림은 만들어지지 않습니다.
+    (알림을 쓰려면 CSV에 계약전력 컬럼을 추가)
+    """
+    customers = {}
+    guksas = defaultdict(float)
+    for record in get_registry().all():
+        contract = _contract(getattr(record, "contract_power", None))
+        if contract is None or record.cust_no in customers:
+            continue
+        customers[record.cust_no] = contract
+        guksas[(record.bonbu or "", record.center or "", record.team or "", record.guksa or "")] += contract
+    return customers, dict(guksas)
+
+
+def day_stats(frame):
+    """stored_frame(long-format) 프레임의 고객 x 날짜 지표 (summarize 결과 + Load Factor)."""
+    summary = summarize(frame, "customer", "day")
+    if summary.empty:
+        return summary.assign(**{"Load Factor": pd.Series(dtype=float)})
+    average = summary["Power Usage Sum"] / summary["Intervals"]
+    peak = summary["Power Usage Peak"].where(summary["Power Usage Peak"] > 0)
+    return summary.assign(**{"Load Factor": average / peak})
+
+
+def baselines(history):
+    """
+    history(cust_no, date, power_sum, power_peak 컬럼의 DataFrame)에 기준선과 이상 점수 컬럼
+    (baseline_sum, sum_score, baseline_peak, peak_score)을 추가해 반환합니다.
+    (날짜 x 고객) 피벗에 rolling 중앙값/사분위수를 적용해 전체 고객을 한 번에 계산합니다.
+    """
+    if history.empty:
+        return history.assign(baseline_sum=None, sum_score=None, baseline_peak=None, peak_score=None)
+
+    history = history.assign(date=pd.to_datetime(history["date"]))
+    calendar = pd.date_range(history["date"].min(), history["date"].max(), freq="D")
+    result = history.set_index(["date", "cust_no"])
+    for value, baseline, score in (("power_sum", "baseline_sum", "sum_score"), ("power_peak", "baseline_peak", "peak_score")):
+        # 빠진 날짜는 NaN 행으로 채워 달력 기준 BASELINE_DAYS일 창을 만듦 (당일 제외)
+        pivot = history.pivot(index="date", columns="cust_no", values=value).reindex(calendar)
+        window = pivot.shift(1).rolling(BASELINE_DAYS, min_periods=MIN_BASELINE_DAYS)
+        median = window.median()
+        spread = (window.quantile(0.75) - window.quantile(0.25)) / IQR_SCALE
+        scores = (pivot - median) / spread.where(spread > 0)
+        result[baseline] = median.stack(future_stack=True).reindex(result.index)
+        result[score] = scores.stack(future_stack=True).reindex(result.index)
+    return result.reset_index()
+
+
+def _nullable(value):
+    return None if value is None or (isinstance(value, float) and math.isnan(value)) else float(value)
+
+
+def _alert(kind, severity, source, level, group, period, date, value, threshold, message, now):
+    return Alert(
+        kind=kind, severity=severity, source=source, level=level,
+        period=period, date=date, value=value, threshold=threshold, message=message, raised_at=now,
+        **{field: group.get(field) or "" for field in _GROUP_FIELDS},
+    )
+
+
+def _name(level, group):
+    return group["guksa"] if level == "guksa" else f"{group['guksa']} {group['cust_no']}"
+
+
+def contract_alert(level, group, demand, contract, source, period, date, now):
+    """최대수요전력(kW)이 계약전력의 CONTRACT_WARNING_RATIO 이상이면 contract_peak 알림을, 아니면 None을 반환합니다."""
+    if contract is None or demand < contract * CONTRACT_WARNING_RATIO:
+        return None
+    severity = "critical" if demand > contract else "warning"
+    message = f"{_name(level, group)} 최대수요 {demand:.1f}kW (계약전력 {contract:.1f}kW의 {demand / contract:.0%})"
+    return _alert("contract_peak", severity, source, level, group, period, date, demand, contract, message, now)
+
+
+def anomaly_alerts(rows, now):
+    """DayStat 행(dict: 계층 컬럼, date, 값, 기준선, 점수)의 usage_anomaly/peak_anomaly 알림 목록."""
+    alerts = []
+    checks = (
+        ("usage_anomaly", "power_sum", "baseline_sum", "sum_score", "일 사용량", "kWh"),
+        ("peak_anomaly", "power_peak", "baseline_peak", "peak_score", "15분 최대 사용량", "kWh"),
+    )
+    for row in rows:
+        for kind, value, baseline, score, label, unit in checks:
+            if row[score] is None or abs(row[score]) < ANOMALY_THRESHOLD:
+                continue
+            if abs(row[value] - row[baseline]) < abs(row[baseline]) * ANOMALY_MIN_CHANGE:
+                continue
+            direction = "높음" if row[score] > 0 else "낮음"
+            message = (
+                f"{_name('customer', row)} {label} {row[value]:.1f}{unit}, "
+                f"기준선 {row[baseline]:.1f}{unit}보다 {direction} (점수 {row[score]:.1f})"
+            )
+            alerts.append(_alert(
+                kind, "warning", "daily", "customer", row, row["date"].strftime("%Y-%m-%d"), row["date"],
+                row[value], row[baseline], message, now,
+            ))
+    return alerts
+
+
+def save_alerts(alerts):
+    """알림을 저장합니다. 같은 (kind, 그룹, period) 알림이 있으면 값/등급/메시지를 갱신합니다."""
+    if alerts:
+        Alert.objects.bulk_create(
+            alerts,
+            batch_size=BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["kind", "level", *_GROUP_FIELDS, "period"],
+            update_fields=["severity", "source", "date", "value", "threshold", "message", "raised_at"],
+        )
+    return len(alerts)
+
+
+def _save_stats(stats, days):
+    """새 날짜의 지표로 DayStat을 교체합니다 (기준선/점수는 _score_range에서 계산)."""
+    cust_nos = stats["Customer Number"].astype(str).unique().tolist() if not stats.empty else []
+    customers = {c.cust_no: c for c in Customer.objects.filter(cust_no__in=cust_nos)}
+    objects = [
+        DayStat(
+            customer=customers[record["Customer Number"]],
+            date=record["Period"].date(),
+            intervals=record["Intervals"],
+            power_sum=record["Power Usage Sum"],
+            power_peak=record["Power Usage Peak"],
+            peak_time=record["Peak Time"],
+            load_factor=_nullable(record["Load Factor"]),
+        )
+        for record in stats.to_dict("records")
+        if record["Customer Number"] in customers
+    ]
+    with transaction.atomic():
+        DayStat.objects.filter(date__in=days).delete()
+        DayStat.objects.bulk_create(objects, batch_size=BATCH_SIZE)
+    return len(objects)
+
+
+def _score_range(first, last, now):
+    """first~last 날짜 DayStat의 기준선/점수를 다시 계산하고 그 기간의 이상 알림을 교체합니다. 갱신한 행 수를 반환합니다."""
+    fields = ["id", "customer__cust_no", "customer__bonbu", "customer__center", "customer__team", "customer__guksa",
+              "date", "power_sum", "power_peak"]
+    rows = DayStat.objects.filter(date__gte=first - timedelta(days=BASELINE_DAYS), date__lte=last).values_list(*fields)
+    history = pd.DataFrame.from_records(
+        list(rows), columns=["id", "cust_no", "bonbu", "center", "team", "guksa", "date", "power_sum", "power_peak"],
+    )
+    scored = baselines(history)
+    if not scored.empty:
+        scored = scored[scored["date"] >= pd.Timestamp(first)]
+    score_fields = ["baseline_sum", "sum_score", "baseline_peak", "peak_score"]
+
+    records = []
+    for record in scored.to_dict("records") if not scored.empty else []:
+        record.update({field: _nullable(record[field]) for field in score_fields})
+        record["date"] = record["date"].date()
+        records.append(record)
+
+    with transaction.atomic():
+        DayStat.objects.bulk_update(
+            [DayStat(id=record["id"], **{field: record[field] for field in score_fields}) for record in records],
+            score_fields,
+            batch_size=BATCH_SIZE,
+        )
+        Alert.objects.filter(
+            source="daily", kind__in=["usage_anomaly", "peak_anomaly"], date__gte=first, date__lte=last,
+        ).delete()
+        save_alerts(anomaly_alerts(records, now))
+    return len(records)
+
+
+def _contract_alerts(frame, stats, days, now):
+    """새 날짜의 고객/국사 일 최대수요전력을 계약전력과 비교해 contract_peak 알림을 교체합니다."""
+    customer_contracts, guksa_contracts = contracts()
+    alerts = []
+    if customer_contracts:
+        guksa_days = summarize(frame, "guksa", "day")
+        for level, summary, lookup in (
+            ("customer", stats, lambda group: customer_contracts.get(group["cust_no"])),
+            ("guksa", guksa_days, lambda group: guksa_contracts.get((group["bonbu"], group["center"], group["team"], group["guksa"]))),
+        ):
+            for record in summary.to_dict("records"):
+                group = {field: record.get(column) or "" for field, column in _GROUP_FIELDS.items() if column in record}
+                day = record["Period"].date()
+                alert = contract_alert(
+                    level, group, record["Power Usage Peak"] * DEMAND_FACTOR, lookup(group),
+                    "daily", day.strftime("%Y-%m-%d"), day, now,
+                )
+                if alert is not None:
+                    alerts.append(alert)
+    with transaction.atomic():
+        Alert.objects.filter(source="daily", kind="contract_peak", date__in=days).delete()
+        save_alerts(alerts)
+    return len(alerts)
+
+
+@stage("analysis")
+def update_analysis(dates, log=None):
+    """
+    dates(YYYYMMDD 또는 date)의 일 지표와 알림을 저장된 15분 값으로 다시 계산합니다.
+    기준선/점수는 dates부터 마지막 날짜 + BASELINE_DAYS까지 DayStat으로 갱신합니다. 저장한 DayStat 행 수를 반환합니다.
+    """
+    days = _days(dates)
+    if not days:
+        return 0
+    now = timezone.now()
+
+    frame = stored_frame(days)
+    stats = day_stats(frame)
+    saved = _save_stats(stats, days)
+    scored = _score_range(days[0], days[-1] + timedelta(days=BASELINE_DAYS), now)
+    alerts = _contract_alerts(frame, stats, days, now)
+
+    if log:
+        log(f"analysis: {len(days)} days, {saved} day stats, {scored} scores updated, {alerts} contract alerts")
+    return saved
+
+
+class LiveDemandCheck:
+    """
+    실시간 폴러(live.LivePoller)가 새로 받은 15분 구간 레코드로 국사/고객의 구간 수요를 누적하고
+    계약전력과 비교해 contract_peak 알림(source=live, period=구간 종료 시각)을 저장합니다.
+    고객 레코드가 회차마다 나뉘어 도착해도 국사 합계는 늘기만 하므로 도착할 때마다 다시 비교합니다.
+    """
+
+    def __init__(self):
+        # (level, 그룹 키, 구간 종료 시각) → 15분 사용량 합계(kWh)
+        self._sums = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def __call__(self, items):
+        """items: [(구간 종료 시각, live 레코드)]. 저장한 알림 목록을 반환합니다."""
+        customer_contracts, guksa_contracts = contracts()
+        if not customer_contracts:
+            return []
+
+        touched = set()
+        with self._lock:
+            for slot_end, record in items:
+                value = record.get("Power Usage")
+                if not isinstance(value, (int, float)):
+                    continue
+                guksa = (record["Bonbu"] or "", record["Center"] or "", record["Team"] or "", record["Guksa"] or "")
+                for key in (("customer", guksa + (record["Customer Number"],)), ("guksa", guksa)):
+                    self._sums[key + (slot_end,)] += value
+                    touched.add(key + (slot_end,))
+            sums = {key: self._sums[key] for key in touched}
+            # 오래된 구간 정리
+            if items:
+                cutoff = max(slot_end for slot_end, _ in items) - LIVE_SPAN
+                for key in [key for key in self._sums if key[-1] < cutoff]:
+                    del self._sums[key]
+
+        now = timezone.now()
+        alerts = []
+        for (level, group_key, slot_end), value in sums.items():
+            group = dict(zip(["bonbu", "center", "team", "guksa", "cust_no"], group_key))
+            contract = customer_contracts.get(group["cust_no"]) if level == "customer" else guksa_contracts.get(group_key)
+            alert = contract_alert(
+                level, group, value * DEMAND_FACTOR, contract,
+                "live", slot_end.strftime("%Y-%m-%d %H:%M"), (slot_end - timedelta(minutes=15)).date(), now,
+            )
+            if alert is not None:
+                alerts.append(alert)
+        save_alerts(alerts)
+        return alerts
+
+
+def _group_filter(customers):
+    """선택한 고객과 그 국사의 알림만 고르는 조건 (cust_no 목록, 국사 키 집합)."""
+    cust_nos = {record.cust_no for record in customers}
+    guksas = {(record.bonbu or "", record.center or "", record.team or "", record.guksa or "") for record in customers}
+    return cust_nos, guksas
+
+
+def stats_frame(customers, dates):
+    """customers × dates의 DayStat을 STAT_COLUMNS 형태의 DataFrame으로 반환합니다."""
+    customer_contracts, _ = contracts()
+    rows = (
+        DayStat.objects
+        .filter(customer__cust_no__in=[record.cust_no for record in customers], date__in=_days(dates))
+        .order_by("date", "customer_id")
+        .values_list(
+            "customer__cust_no", "customer__bonbu", "customer__center", "customer__team", "customer__guksa", "date",
+            "power_sum", "power_peak", "peak_time", "load_factor", "baseline_sum", "sum_score", "baseline_peak", "peak_score",
+        )
+    )
+    frame = pd.DataFrame.from_records(
+        list(rows),
+        columns=[column for column in STAT_COLUMNS if column not in ("Peak Demand", "Contract Power")],
+    )
+    frame["Date"] = frame["Date"].astype(str)
+    frame["Peak Demand"] = frame["Power Usage Peak"] * DEMAND_FACTOR
+    frame["Contract Power"] = frame["Customer Number"].map(customer_contracts)
+    return frame[STAT_COLUMNS]
+
+
+def alerts_frame(customers, dates, kind=None, severity=None, source=None):
+    """customers(와 그 국사) × dates의 알림을 ALERT_COLUMNS 형태의 DataFrame으로 반환합니다 (최근 순)."""
+    cust_nos, guksas = _group_filter(customers)
+    alerts = Alert.objects.filter(date__in=_days(dates))
+    if kind:
+        alerts = alerts.filter(kind__in=kind.split(","))
+    if severity:
+        alerts = alerts.filter(severity__in=severity.split(","))
+    if source:
+        alerts = alerts.filter(source__in=source.split(","))
+    rows = [
+        [
+            alert.period, alert.kind, alert.severity, alert.source, alert.level,
+            alert.bonbu, alert.center, alert.team, alert.guksa, alert.cust_no,
+            alert.value, alert.threshold, alert.message, timezone.localtime(alert.raised_at).strftime("%Y-%m-%d %H:%M:%S"),
+        ]
+        for alert in alerts.order_by("-period", "kind", "id")
+        if (alert.cust_no in cust_nos if alert.level == "customer" else (alert.bonbu, alert.center, alert.team, alert.guksa) in guksas)
+    ]
+    return pd.DataFrame(rows, columns=ALERT_COLUMNS)
@@ -1,19 +1,38 @@
-from ninja import NinjaAPI, Router
+from ninja import NinjaAPI, Router, Query, Schema
 
-from django.http import JsonResponse, HttpResponse
+from django.http import HttpResponseRedirect, JsonResponse
+from asgiref.sync import sync_to_async
 import requests
 import json
 from datetime import date, timedelta, datetime
 import pandas as pd
 
-from io import BytesIO
+
+from .fetch import fetch_all, fetch_iter, gather_limited, afetch_iter
+from .kepco_client import get_client
+from .kepco_async_client import FETCH_ERRORS, get_async_client
+from .cache import get_cache
+from .customers import get_registry
+from .store import load_days
+from .planner import RangeTooLarge, plan_range
+from .parsing import daily_total, interval_frame, slot_totals
+from .aggregation import BUCKETS, GROUP_LEVELS, aggregate, interval_long
+from .rollups import day_totals, rollup_aggregate
+from .streaming import ndjson_response
+from .export import EXPORT_FORMATS, export_response
+from .http_cache import cached_render
+from .metrics import observe_rows, stage
+from .analysis import alerts_frame, stats_frame
+from .live import LONG_POLL_TIMEOUT, MAX_LONG_POLL, asse_events, get_poller, last_event_id, sse_response
 
 api = NinjaAPI(csrf=False, docs_url='/docs/')
 
 powerSaving_router = Router()
+powerSaving_async_router = Router()
 test_router = Router()
 api.add_router("/test", test_router, tags=["Testing"])
 api.add_router("/powerSaving", powerSaving_router, tags=["Power Saving"])
+api.add_router("/powerSaving/async", powerSaving_async_router, tags=["Power Saving (async)"])
 
 @test_router.get("/hello")
 def hello(request, name:str="World"):
@@ -24,6 +43,22 @@ def get_datetime(request):
     now = datetime.now()
     return {"datetime": now.strftime("%Y-%m-%d %H:%M:%S")}
 
+@powerSaving_router.get("/cacheStats")
+def cacheStats(request):
+    """
+    KEPCO 응답 캐시의 hit/miss 카운터(현재 워커 기준)와 저장 항목 수를 반환합니다.
+    """
+    return {"returnCode": "ok", "data": get_cache().stats()}
+
+# 15분 단위 결과 컬럼 순서
+INTERVAL_COLUMNS = ["Customer Number", "MeterNo", "Date", "Time", "Bonbu", "Center", "Team", "Guksa", "Power Usage", "Status"]
+
+# 고객별 조회 상태 (Status 컬럼). 조회 실패는 "error: <오류 메시지>"
+STATUS_OK = "ok"
+STATUS_NO_DATA = "no data"
+
+INVALID_RETURN_TYPE = "Invalid returnType. Use 'json', 'compact', 'ndjson', 'xlsx', 'csv', 'parquet' or 'arrow'."
+
 def convert_date_format(date_str):
     if len(date_str) == 8 and date_str.isdigit():
         return f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:]}"
@@ -33,13 +68,189 @@ def convert_time_format(time_str):
     if len(time_str) == 4 and time_str.isdigit():
         return f"{time_str[:2]}:{time_str[2:]}"
     return "Invalid format"
-        
+
+def default_date(date):
+    """date가 없으면 어제 날짜(YYYYMMDD)를, 있으면 문자열로 반환합니다."""
+    if date is None:
+        yesterday = datetime.today() - timedelta(days=1)
+        return yesterday.strftime("%Y%m%d")  # Format as YYYYMMDD
+    # Ensure the date is in string format
+    return str(date)
+
+def date_range(startDate, endDate):
+    """startDate~endDate(YYYYMMDD) 날짜 리스트를 반환합니다. 미입력시 어제~어제."""
+    if startDate is None or endDate is None:
+        startDate = endDate = default_date(None)
+    start_dt = datetime.strptime(str(startDate), "%Y%m%d")
+    end_dt = datetime.strptime(str(endDate), "%Y%m%d")
+    return [(start_dt + timedelta(days=i)).strftime("%Y%m%d") for i in range((end_dt - start_dt).days + 1)]
+
+class CustomerFilter(Schema):
+    """조회 대상 고객 필터 (쉼표로 여러 값 지정 가능, 미입력시 전체)."""
+    custNo: str = None
+    bonbu: str = None
+    center: str = None
+    team: str = None
+    guksa: str = None
+
+def select_customers(filters):
+    """필터에 맞는 고객 레코드를 CSV 순서대로 반환합니다."""
+    customers = get_registry().filter(**filters.dict())
+    if not customers:
+        raise ValueError("No customers match the given filters")
+    return customers
+
+def fetch_status(data, list_key):
+    """
+    고객 1건의 조회 결과(응답 dict 또는 조회 중 발생한 예외)에서 (레코드 목록, Status)를 반환합니다.
+    한 고객의 조회 실패가 다른 고객의 결과나 Power Usage 컬럼 dtype에 영향을 주지 않도록
+    실패는 예외 대신 Status 값으로 기록합니다.
+    """
+    if isinstance(data, Exception):
+        return [], f"error: {str(data)}"
+    records = data.get(list_key, [])
+    return records, (STATUS_OK if records else STATUS_NO_DATA)
+
+def daily_record(row, date, data):
+    """고객 1건의 일 합계 행을 만듭니다. data: getDayLpData 응답 또는 조회 중 발생한 예외."""
+    day_lp_data, status = fetch_status(data, "dayLpDataInfoList")
+    power_usage = daily_total(day_lp_data) if day_lp_data else None
+    return daily_row(row, date, power_usage, status)
+
+def daily_row(row, date, power_usage, status=STATUS_OK):
+    return {
+        "Customer Number": row.cust_no,
+        "Date": convert_date_format(date),
+        "Bonbu": row.bonbu,
+        "Center": row.center,
+        "Team": row.team,
+        "Guksa": row.guksa,
+        "Power Usage": power_usage,
+        "Status": status
+    }
+
+def status_rows(row, date, time, status):
+    """15분 데이터가 없는 고객의 Status 행(Power Usage는 NaN)을 만듭니다."""
+    return pd.DataFrame([{
+        "Customer Number": row.cust_no,
+        "MeterNo": None,
+        "Date": convert_date_format(date),
+        "Time": time,
+        "Bonbu": row.bonbu,
+        "Center": row.center,
+        "Team": row.team,
+        "Guksa": row.guksa,
+        "Power Usage": float("nan"),
+        "Status": status
+    }], columns=INTERVAL_COLUMNS)
+
+def interval_rows(row, date, data):
+    """고객 1건의 getDayLpData 응답(또는 조회 예외)을 15분 단위 행(DataFrame)으로 변환합니다."""
+    day_lp_data, status = fetch_status(data, "dayLpDataInfoList")
+    if not day_lp_data:
+        return status_rows(row, date, None, status)
+
+    # pwr_qtyHHMM 값을 15분 단위 행으로 변환 (Time: HHMM)
+    rows = interval_frame(day_lp_data).assign(**{
+        "Customer Number": row.cust_no,
+        "Date": convert_date_format(date),
+        "Bonbu": row.bonbu,
+        "Center": row.center,
+        "Team": row.team,
+        "Guksa": row.guksa,
+        "Status": status,
+    })
+    return rows[INTERVAL_COLUMNS]
+
+def minute_rows(row, date_time, data):
+    """고객 1건의 getMinuteLpData 응답(또는 조회 예외)을 15분 행(DataFrame)으로 변환합니다."""
+    minute_lp_data, status = fetch_status(data, "minuteLpDataInfoList")
+    date_time = str(date_time)
+    if not minute_lp_data:
+        return status_rows(row, date_time[:8], date_time[8:], status)
+
+    rows = []
+    for record in minute_lp_data:
+        value = record.get("pwr_qty")
+        if isinstance(value, (int, float)):
+            rows.append({
+                "Customer Number": row.cust_no,
+                "MeterNo": record.get("meterNo"),
+                "Date": convert_date_format(record.get("mr_ymd")),
+                "Time": record.get("mr_hhmi"),
+                "Bonbu": row.bonbu,
+                "Center": row.center,
+                "Team": row.team,
+                "Guksa": row.guksa,
+                "Power Usage": value,
+                "Status": status
+            })
+    if not rows:
+        return status_rows(row, date_time[:8], date_time[8:], STATUS_NO_DATA)
+    return pd.DataFrame(rows, columns=INTERVAL_COLUMNS)
+
+def concat_rows(results):
+    """고객별 행(DataFrame)을 CSV 순서대로 합칩니다."""
+    frames = list(results)
+    with stage("frame"):
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=INTERVAL_COLUMNS)
+
+def frame_records(rows):
+    """DataFrame을 레코드(dict) 목록으로 변환합니다. NaN은 null이 되도록 None으로 바꿉니다."""
+    if rows.isna().values.any():
+        rows = rows.astype(object).where(rows.notna(), None)
+    return rows.to_dict(orient="records")
+
+def stream_rows(results):
+    """고객별 행(DataFrame)을 레코드 목록으로 변환합니다. ndjson_response는 고객 한 명의 행을 한 chunk로 보냅니다."""
+    for rows in results:
+        yield frame_records(rows)
+
+async def astream_rows(results):
+    """stream_rows의 비동기 버전."""
+    async for rows in results:
+        yield frame_records(rows)
+
+def compact_json(df):
+    """df를 {"columns": 컬럼명 목록, "data": 행 배열 목록} 형태로 변환합니다."""
+    split = json.loads(df.to_json(orient="split", index=False, force_ascii=False))
+    return {"columns": split["columns"], "data": split["data"]}
+
+def render_result(df, returnType, basename):
+    """결과 DataFrame을 returnType(json, compact, xlsx, csv, parquet, arrow)에 맞는 응답으로 반환합니다."""
+    if returnType == "json":
+        # Convert DataFrame to JSON
+        json_result = df.to_json(orient="records", force_ascii=False)
+
+        # Return JSON response
+        return JsonResponse({"returnCode": "ok", "data": json.loads(json_result)}, json_dumps_params={'ensure_ascii': False})
+    elif returnType == "compact":
+        # 행마다 키를 반복하지 않는 형태: {"columns": [...], "data": [[...], ...]}
+        return JsonResponse({"returnCode": "ok", **compact_json(df)}, json_dumps_params={'ensure_ascii': False})
+    elif returnType in EXPORT_FORMATS:
+        # Return xlsx/csv/parquet/arrow file as a downloadable response
+        return export_response(df, returnType, basename)
+    else:
+        return JsonResponse({"returnCode": "le", "error": INVALID_RETURN_TYPE}, json_dumps_params={'ensure_ascii': False})
+
+def error_response(error):
+    return JsonResponse({"returnCode": "le", "error": error}, json_dumps_params={'ensure_ascii': False})
+
+def async_redirect(request):
+    """같은 경로의 /powerSaving/async/ 엔드포인트로 쿼리를 유지한 채 이동합니다."""
+    url = request.path.replace("/powerSaving/", "/powerSaving/async/", 1)
+    query = request.META.get("QUERY_STRING")
+    return HttpResponseRedirect(f"{url}?{query}" if query else url)
+
 @powerSaving_router.get("/kepcoDailyData")
-def kepcoDailyData(request, date:int=None, returnType:str="json"):
+def kepcoDailyData(request, filters: Query[CustomerFilter], date:int=None, returnType:str="json"):
     """
     강북/강원 권역 고압국가 35개에 대해 일단위 합계 전력 사용량 데이터를 KEPCO API에서 가져옵니다.\n
     date 입력 포멧: YYYYMMDD(미입력시 어제 날짜).\n
-    returnType 입력 포멧: json(기본값), xlsx.\n
+    returnType 입력 포멧: json(기본값), compact(컬럼명 목록 + 행 배열), xlsx, csv, parquet, arrow(Arrow IPC stream), ndjson(고객별로 조회되는 대로 한 줄에 레코드 하나씩 스트리밍).\n
+    custNo, bonbu, center, team, guksa 입력시 해당 고객만 조회합니다(쉼표로 여러 값 지정 가능, 미입력시 전체).\n
+    Status는 고객별 조회 결과입니다: ok, no data, error: 오류 메시지 (조회에 실패한 고객은 Power Usage가 null이며 다른 고객의 결과는 그대로 반환합니다).\n
+    json/파일 응답에는 ETag와 Cache-Control(확정된 날짜는 장기, 어제/오늘은 단기)을 붙이며 If-None-Match가 일치하면 304를 반환합니다.\n
     출력 형태는 아래와 같습니다.\n
     {
         "returnCode": "ok",
@@ -51,7 +262,8 @@ def kepcoDailyData(request, date:int=None, returnType:str="json"):
                 "Center": "Center Name",
                 "Team": "Team Name",
                 "Guksa": "Guksa Name",
-                "Power Usage": 12345.67
+                "Power Usage": 12345.67,
+                "Status": "ok"
             },
             ...
         ]
@@ -64,125 +276,47 @@ def kepcoDailyData(request, date:int=None, returnType:str="json"):
     """
     if (request.method == 'GET') :
         try:
-            #Get the 'date' parameter from the request
-            date = request.GET.get('date', None)
-
-            # If 'date' is not provided, use yesterday's date
-            if date is None:
-                today = datetime.today() - timedelta(days=1)
-                date = today.strftime("%Y%m%d")  # Format as YYYYMMDD
-            else:
-                # Ensure the date is in string format
-                date = str(date)
-
-            # Input CSV file path
-            input_csv = "kepcolist_gg.csv"
-
-            # API URL and static parameters
-            # https://opm.kepco.co.kr:11080/OpenAPI/getDayLpData.do?custNo=0135338560&date=20241001&serviceKey=bpb89eyd7bg430vckh8t&returnType=02
-            url = "https://opm.kepco.co.kr:11080/OpenAPI/getDayLpData.do"
-            service_key = "bpb89eyd7bg430vckh8t"
-
-            # Read customer numbers from CSV
-            customer_data = pd.read_csv(input_csv, dtype=str)
-
-            # Prepare a list to store the results
-            results = []
-
-            for _, row in customer_data.iterrows():
-                cust_no = row.get("고객번호")
-                if not cust_no:
-                    continue
-                bonbu = row.get("본부명")
-                center = row.get("센터")
-                team = row.get("팀")
-                guksa = row.get("국사")
-
-                # API call
-                params = {
-                    "custNo": cust_no,
-                    "date": date,
-                    "serviceKey": service_key,
-                    "returnType": "02"
-                }
-                response = requests.get(url, params=params)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    day_lp_data = data.get("dayLpDataInfoList", [])
-
-                    if day_lp_data:
-                        total_power = 0
-                        for record in day_lp_data:
-                            total_power += sum(
-                                value for key, value in record.items() if key.startswith("pwr_qty") and isinstance(value, (int, float))
-                            )
-                        results.append({
-                            "Customer Number": cust_no,
-                            "Date": convert_date_format(date),
-                            "Bonbu": bonbu,
-                            "Center": center,
-                            "Team": team,
-                            "Guksa": guksa,
-                            "Power Usage": total_power
-                        })
-                    else:
-                        results.append({
-                            "Customer Number": cust_no,
-                            "Date": convert_date_format(date),
-                            "Bonbu": bonbu,
-                            "Center": center,
-                            "Team": team,
-                            "Guksa": guksa,
-                            "Power Usage": None
-                        })
-                else:
-                    results.append({
-                        "Customer Number": cust_no,
-                        "Date": convert_date_format(date),
-                        "Bonbu": bonbu,
-                        "Center": center,
-                        "Team": team,
-                        "Guksa": guksa,
-                        "Power Usage": "API Error"
-                    })
-
-            # Convert results to a DataFrame
-            df = pd.DataFrame(results)
-
-            if returnType == "json":
-                # Convert DataFrame to JSON
-                json_result = df.to_json(orient="records", force_ascii=False)
-
-                # Return JSON response
-                return JsonResponse({"returnCode": "ok", "data": json.loads(json_result)}, json_dumps_params={'ensure_ascii': False})
-            elif returnType == "xlsx":
-                # Create a BytesIO buffer to store the Excel file
-                output = BytesIO()
-                # Convert DataFrame to Excel
-                df.to_excel(output, index=False, engine='openpyxl')
-                output.seek(0)
-
-                # Return Excel file as a downloadable response
-                response = HttpResponse(
-                    content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-                    content=output.getvalue()
-                )
-                response['Content-Disposition'] = f'attachment; filename="kepco_daily_data_{date}.xlsx"'
-                return response
-            else:
-                return JsonResponse({"returnCode": "le", "error": "Invalid returnType. Use 'json' or 'xlsx'."}, json_dumps_params={'ensure_ascii': False})
+            # Get the 'date' parameter from the request (default: yesterday)
+            date = default_date(request.GET.get('date', None))
+
+            # KEPCO API client (process-wide pooled session)
+            client = get_client()
+            customers = select_customers(filters)
+
+            # 로컬 저장소에 하루치가 모두 저장된(complete) 날짜는 KEPCO를 호출하지 않음
+            stored = load_days([row.cust_no for row in customers], [date])
+
+            def fetch_customer(row):
+                cust_no = row.cust_no
+                try:
+                    data = stored.get((cust_no, date)) or client.get_day_lp_data(cust_no, date)
+                except requests.RequestException as e:
+                    print(f"API Error for Customer Number {cust_no}: {str(e)}")
+                    data = e
+                return daily_record(row, date, data)
+
+            if returnType == "ndjson":
+                return ndjson_response(fetch_iter(fetch_customer, customers))
+
+            # 고객별 API 호출을 동시에 수행 (결과는 CSV 순서 유지)
+            results = fetch_all(fetch_customer, customers)
+            with stage("frame"):
+                df = pd.DataFrame(results)
+            return cached_render(request, df, [date], returnType, lambda: render_result(df, returnType, f"kepco_daily_data_{date}"))
 
         except Exception as e:
             print(str(e))
-            return JsonResponse({"returnCode": "le", "error": str(e)}, json_dumps_params={'ensure_ascii': False})
-        
+            return error_response(str(e))
+
 @powerSaving_router.get("/kepcoDailyData15min")
-def kepcoDailyData15min(request, date:int=None, returnType:str="json"):
+def kepcoDailyData15min(request, filters: Query[CustomerFilter], date:int=None, returnType:str="json"):
     """
     강북/강원 권역 고압국가 35개에 대해 일단위 15분간 전력 사용량 데이터를 KEPCO API에서 가져옵니다.\n
     date 입력 포멧: YYYYMMDD(미입력시 어제 날짜).\n
-    returnType 입력 포멧: json(기본값), xlsx.\n
+    returnType 입력 포멧: json(기본값), compact(컬럼명 목록 + 행 배열), xlsx, csv, parquet, arrow(Arrow IPC stream), ndjson(고객별로 조회되는 대로 한 줄에 레코드 하나씩 스트리밍).\n
+    custNo, bonbu, center, team, guksa 입력시 해당 고객만 조회합니다(쉼표로 여러 값 지정 가능, 미입력시 전체).\n
+    Status는 고객별 조회 결과입니다: ok, no data, error: 오류 메시지 (조회에 실패한 고객은 Power Usage가 null이며 다른 고객의 결과는 그대로 반환합니다).\n
+    json/파일 응답에는 ETag와 Cache-Control(확정된 날짜는 장기, 어제/오늘은 단기)을 붙이며 If-None-Match가 일치하면 304를 반환합니다.\n
     출력 형태는 아래와 같습니다.\n
     {
         "returnCode": "ok",
@@ -196,7 +330,8 @@ def kepcoDailyData15min(request, date:int=None, returnType:str="json"):
                 "Center": "Center Name",
                 "Team": "Team Name",
                 "Guksa": "Guksa Name",
-                "Power Usage": 123.45
+                "Power Usage": 123.45,
+                "Status": "ok"
             },
             ...
         ]
@@ -209,117 +344,46 @@ def kepcoDailyData15min(request, date:int=None, returnType:str="json"):
     """
     if (request.method == 'GET') :
         try:
-            #Get the 'date' parameter from the request
-            date = request.GET.get('date', None)
-
-            # If 'date' is not provided, use yesterday's date
-            if date is None:
-                today = datetime.today() - timedelta(days=1)
-                date = today.strftime("%Y%m%d")  # Format as YYYYMMDD
-            else:
-                # Ensure the date is in string format
-                date = str(date)
-                
-            # Input CSV file path
-            input_csv = "kepcolist_gg.csv"
-
-            # API URL and static parameters
-            url = "https://opm.kepco.co.kr:11080/OpenAPI/getDayLpData.do"
-            service_key = "bpb89eyd7bg430vckh8t"
-    
-            # Read customer numbers from CSV
-            customer_data = pd.read_csv(input_csv, dtype=str)
-
-            # Prepare a list to store the results
-            results = []
-
-            for _, row in customer_data.iterrows():
-                cust_no = row.get("고객번호")
-                if not cust_no:
-                    continue
-                bonbu = row.get("본부명")
-                center = row.get("센터")
-                team = row.get("팀")
-                guksa = row.get("국사")
-
-                # API call
-                params = {
-                    "custNo": cust_no,
-                    "date": date,
-                    "serviceKey": service_key,
-                    "returnType": "02"
-                }
-                response = requests.get(url, params=params)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    day_lp_data = data.get("dayLpDataInfoList", [])
+            # Get the 'date' parameter from the request (default: yesterday)
+            date = default_date(request.GET.get('date', None))
 
-                    if day_lp_data:
-                        for record in day_lp_data:
-                            # pwr_qtyXXXX 형식의 키를 순회
-                            for key, value in record.items():
-                                if key.startswith("pwr_qty") and isinstance(value, (int, float)):
-                                    # 키에서 시간 추출 (예: pwr_qty0015 → 00:15)
-                                    time_str = key[-4:]  # 마지막 4자리 (HHMM)
-                                    results.append({
-                                        "Customer Number": cust_no,
-                                        "MeterNo": record.get("meterNo"),
-                                        "Date": convert_date_format(date),
-                                        "Time": time_str,
-                                        "Bonbu": bonbu,
-                                        "Center": center,
-                                        "Team": team,
-                                        "Guksa": guksa,
-                                        "Power Usage": value
-                                    })
-                    else:
-                        return JsonResponse({
-                            "returnCode": "le",
-                            "error": f"No data found for Customer Number {cust_no}"
-                        }, json_dumps_params={'ensure_ascii': False})
-                else:
-                    return JsonResponse({
-                        "returnCode": "le",
-                        "error": f"API Error for Customer Number {cust_no}: {response.status_code}"
-                    }, json_dumps_params={'ensure_ascii': False})
-
-            # Convert results to a DataFrame
-            df = pd.DataFrame(results)
+            # KEPCO API client (process-wide pooled session)
+            client = get_client()
+            customers = select_customers(filters)
 
-            if returnType == "json":
-                # Convert DataFrame to JSON
-                json_result = df.to_json(orient="records", force_ascii=False)
-
-                # Return JSON response
-                return JsonResponse({"returnCode": "ok", "data": json.loads(json_result)}, json_dumps_params={'ensure_ascii': False})
-            elif returnType == "xlsx":
-                # Create a BytesIO buffer to store the Excel file
-                output = BytesIO()
-                # Convert DataFrame to Excel
-                df.to_excel(output, index=False, engine='openpyxl')
-                output.seek(0)
-
-                # Return Excel file as a downloadable response
-                response = HttpResponse(
-                    content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-                    content=output.getvalue()
-                )
-                response['Content-Disposition'] = f'attachment; filename="kepco_daily_15min_data_{date}.xlsx"'
-                return response
-            else:
-                return JsonResponse({"returnCode": "le", "error": "Invalid returnType. Use 'json' or 'xlsx'."}, json_dumps_params={'ensure_ascii': False})
+            # 로컬 저장소에 하루치가 모두 저장된(complete) 날짜는 KEPCO를 호출하지 않음
+            stored = load_days([row.cust_no for row in customers], [date])
+
+            def fetch_customer(row):
+                cust_no = row.cust_no
+                try:
+                    data = stored.get((cust_no, date)) or client.get_day_lp_data(cust_no, date)
+                except requests.RequestException as e:
+                    print(f"API Error for Customer Number {cust_no}: {str(e)}")
+                    data = e
+                return interval_rows(row, date, data)
+
+            if returnType == "ndjson":
+                # 고객별 행을 완료되는 대로(CSV 순서) 스트리밍
+                return ndjson_response(stream_rows(fetch_iter(fetch_customer, customers)))
+
+            # 고객별 API 호출을 동시에 수행 (조회에 실패한 고객은 Status 행으로 표시)
+            df = concat_rows(fetch_all(fetch_customer, customers))
+            return cached_render(request, df, [date], returnType, lambda: render_result(df, returnType, f"kepco_daily_15min_data_{date}"))
 
         except Exception as e:
             print(str(e))
-            return JsonResponse({"returnCode": "le", "error": str(e)}, json_dumps_params={'ensure_ascii': False})
-        
+            return error_response(str(e))
+
 @powerSaving_router.get("/kepco15minData")
-def kepco15minData(request, dateTime:int, returnType:str="json"):
+def kepco15minData(request, dateTime:int, filters: Query[CustomerFilter], returnType:str="json"):
     """
     강북/강원 권역 고압국가 35개에 대해 15분간 전력 사용량 데이터를 KEPCO API에서 가져옵니다.\n
     dateTime 입력 포멧: YYYYMMDDHHMM.\n
-    returnType 입력 포멧: json(기본값), xlsx.\n
+    returnType 입력 포멧: json(기본값), compact(컬럼명 목록 + 행 배열), xlsx, csv, parquet, arrow(Arrow IPC stream), ndjson(고객별로 조회되는 대로 한 줄에 레코드 하나씩 스트리밍).\n
+    custNo, bonbu, center, team, guksa 입력시 해당 고객만 조회합니다(쉼표로 여러 값 지정 가능, 미입력시 전체).\n
+    Status는 고객별 조회 결과입니다: ok, no data, error: 오류 메시지 (조회에 실패한 고객은 Power Usage가 null이며 다른 고객의 결과는 그대로 반환합니다).\n
+    json/파일 응답에는 ETag와 Cache-Control(확정된 날짜는 장기, 어제/오늘은 단기)을 붙이며 If-None-Match가 일치하면 304를 반환합니다.\n
     출력 형태는 아래와 같습니다.\n
     {
         "returnCode": "ok",
@@ -333,7 +397,8 @@ def kepco15minData(request, dateTime:int, returnType:str="json"):
                 "Center": "Center Name",
                 "Team": "Team Name",
                 "Guksa": "Guksa Name",
-                "Power Usage": 123.45
+                "Power Usage": 123.45,
+                "Status": "ok"
             },
             ...
         ]
@@ -346,199 +411,508 @@ def kepco15minData(request, dateTime:int, returnType:str="json"):
     """
     if (request.method == 'GET') :
         try:
-            # Input CSV file path
-            input_csv = "kepcolist_gg.csv"
-
-            # API URL and static parameters
-            url = "https://opm.kepco.co.kr:11080/OpenAPI/getMinuteLpData.do"
-            service_key = "bpb89eyd7bg430vckh8t"
-
-            # Read customer numbers from CSV
-            customer_data = pd.read_csv(input_csv, dtype=str)
-
-            # Prepare a list to store the results
-            results = []
-
-            for _, row in customer_data.iterrows():
-                cust_no = row.get("고객번호")
-                if not cust_no:
-                    continue
-                bonbu = row.get("본부명")
-                center = row.get("센터")
-                team = row.get("팀")
-                guksa = row.get("국사")
-
-                # API call
-                params = {
-                    "custNo": cust_no,
-                    "dateTime": dateTime,
-                    "serviceKey": service_key,
-                    "returnType": "02"
-                }
-                response = requests.get(url, params=params)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    minute_lp_data = data.get("minuteLpDataInfoList", [])
-
-                    if minute_lp_data:
-                        for record in minute_lp_data:
-                            for key, value in record.items():
-                                if key=="pwr_qty" and isinstance(value, (int, float)):
-                                    results.append({
-                                        "Customer Number": cust_no,
-                                        "MeterNo": record.get("meterNo"),
-                                        "Date": convert_date_format(record.get("mr_ymd")),
-                                        "Time": record.get("mr_hhmi"),
-                                        "Bonbu": bonbu,
-                                        "Center": center,
-                                        "Team": team,
-                                        "Guksa": guksa,
-                                        "Power Usage": value
-                                    })
-                    else:
-                        return JsonResponse({
-                            "returnCode": "le",
-                            "error": f"No data found for Customer Number {cust_no}"
-                        }, json_dumps_params={'ensure_ascii': False})
-                else:
-                    return JsonResponse({
-                        "returnCode": "le",
-                        "error": f"API Error for Customer Number {cust_no}: {response.status_code}"
-                    }, json_dumps_params={'ensure_ascii': False})
-
-            # Convert results to a DataFrame
-            df = pd.DataFrame(results)
-
-            if returnType == "json":
-                # Convert DataFrame to JSON
-                json_result = df.to_json(orient="records", force_ascii=False)
-
-                # Return JSON response
-                return JsonResponse({"returnCode": "ok", "data": json.loads(json_result)}, json_dumps_params={'ensure_ascii': False})
-            elif returnType == "xlsx":
-                # Create a BytesIO buffer to store the Excel file
-                output = BytesIO()
-                # Convert DataFrame to Excel
-                df.to_excel(output, index=False, engine='openpyxl')
-                output.seek(0)
-
-                # Return Excel file as a downloadable response
-                response = HttpResponse(
-                    content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-                    content=output.getvalue()
-                )
-                response['Content-Disposition'] = f'attachment; filename="kepco_15min_data_{dateTime}.xlsx"'
-                return response
-            else:
-                return JsonResponse({"returnCode": "le", "error": "Invalid returnType. Use 'json' or 'xlsx'."}, json_dumps_params={'ensure_ascii': False})
+            # KEPCO API client (process-wide pooled session)
+            client = get_client()
+            customers = select_customers(filters)
+
+            def fetch_customer(row):
+                cust_no = row.cust_no
+                try:
+                    data = client.get_minute_lp_data(cust_no, dateTime)
+                except requests.RequestException as e:
+                    print(f"API Error for Customer Number {cust_no}: {str(e)}")
+                    data = e
+                return minute_rows(row, dateTime, data)
+
+            if returnType == "ndjson":
+                return ndjson_response(stream_rows(fetch_iter(fetch_customer, customers)))
+
+            # 고객별 API 호출을 동시에 수행 (조회에 실패한 고객은 Status 행으로 표시)
+            df = concat_rows(fetch_all(fetch_customer, customers))
+            return cached_render(request, df, [str(dateTime)[:8]], returnType, lambda: render_result(df, returnType, f"kepco_15min_data_{dateTime}"))
         except Exception as e:
             print(str(e))
-            return JsonResponse({"returnCode": "le", "error": str(e)}, json_dumps_params={'ensure_ascii': False})
+            return error_response(str(e))
 
 @powerSaving_router.get("/kepcoDailyRangeData")
-def kepcoDailyRangeData(request, startDate: int = None, endDate: int = None, returnType: str = "json"):
+def kepcoDailyRangeData(request, filters: Query[CustomerFilter], startDate: int = None, endDate: int = None, returnType: str = "json"):
     """
     강북/강원 권역 고압국가 35개에 대해 기간 내 일단위 합계 전력 사용량 데이터를 KEPCO API에서 가져옵니다.
     startDate, endDate 입력 포멧: YYYYMMDD (미입력시 어제~어제).
-    returnType 입력 포멧: json(기본값), xlsx.
+    returnType 입력 포멧: json(기본값), compact(컬럼명 목록 + 행 배열), xlsx, csv, parquet, arrow(Arrow IPC stream), ndjson.
+    custNo, bonbu, center, team, guksa 입력시 해당 고객만 조회합니다(쉼표로 여러 값 지정 가능, 미입력시 전체).
+    Status는 (고객, 날짜)별 조회 결과입니다: ok, no data, error: 오류 메시지.
+    json/파일 응답에는 ETag와 Cache-Control을 붙이며 If-None-Match가 일치하면 304를 반환합니다.
+    ndjson은 한 줄에 레코드 하나씩 (날짜, 고객) 순서로 조회되는 대로 스트리밍합니다.
+    기간은 최대 92일이며, 로컬 저장소/캐시에 없어 KEPCO를 호출해야 하는 건수가 1500건을 넘으면
+    returnCode "le"와 예상 호출 수를 반환합니다. (ingest_lp로 미리 저장해 두면 긴 기간도 조회 가능)
     """
     if request.method == 'GET':
         try:
-            # 날짜 파라미터 처리
-            if startDate is None or endDate is None:
-                yesterday = datetime.today() - timedelta(days=1)
-                startDate = endDate = yesterday.strftime("%Y%m%d")
-            else:
-                startDate = str(startDate)
-                endDate = str(endDate)
-
             # 날짜 리스트 생성
-            start_dt = datetime.strptime(startDate, "%Y%m%d")
-            end_dt = datetime.strptime(endDate, "%Y%m%d")
-            date_list = [(start_dt + timedelta(days=i)).strftime("%Y%m%d") for i in range((end_dt - start_dt).days + 1)]
-
-            input_csv = "kepcolist_gg.csv"
-            url = "https://opm.kepco.co.kr:11080/OpenAPI/getDayLpData.do"
-            service_key = "bpb89eyd7bg430vckh8t"
-            customer_data = pd.read_csv(input_csv, dtype=str)
-            results = []
-
-            for date in date_list:
-                for _, row in customer_data.iterrows():
-                    cust_no = row.get("고객번호")
-                    if not cust_no:
-                        continue
-                    bonbu = row.get("본부명")
-                    center = row.get("센터")
-                    team = row.get("팀")
-                    guksa = row.get("국사")
-
-                    params = {
-                        "custNo": cust_no,
-                        "date": date,
-                        "serviceKey": service_key,
-                        "returnType": "02"
-                    }
-                    response = requests.get(url, params=params)
-
-                    if response.status_code == 200:
-                        data = response.json()
-                        day_lp_data = data.get("dayLpDataInfoList", [])
-                        if day_lp_data:
-                            total_power = 0
-                            for record in day_lp_data:
-                                total_power += sum(
-                                    value for key, value in record.items() if key.startswith("pwr_qty") and isinstance(value, (int, float))
-                                )
-                            results.append({
-                                "Customer Number": cust_no,
-                                "Date": convert_date_format(date),
-                                "Bonbu": bonbu,
-                                "Center": center,
-                                "Team": team,
-                                "Guksa": guksa,
-                                "Power Usage": total_power
-                            })
+            date_list = date_range(startDate, endDate)
+
+            client = get_client()
+            customers = select_customers(filters)
+
+            # (고객번호, 날짜) 작업 계획: 저장소에 있는 작업은 호출하지 않고, 기간/예상 호출 수 상한을 넘으면 거절
+            plan = plan_range([row.cust_no for row in customers], date_list, cache=client.cache)
+
+            def fetch_task(task):
+                cust_no, date = task
+                try:
+                    return client.get_day_lp_data(cust_no, date)
+                except requests.RequestException as e:
+                    print(f"API Error for Customer Number {cust_no} ({date}): {str(e)}")
+                    return e
+
+            # 저장소에 있는 작업은 일 롤업 합계를 사용 (15분 원본 값을 읽지 않음)
+            totals = day_totals(plan.stored)
+
+            def iter_records():
+                """일 합계 행을 (날짜, 고객) 순서로 생성합니다. 저장소에 없는 작업은 기간 전체에 걸쳐 동시에 호출됩니다."""
+                for date, day in plan.iter_days(fetch_task, skip=totals):
+                    for row in customers:
+                        key = (row.cust_no, date)
+                        if key in totals:
+                            yield daily_row(row, date, totals[key])
                         else:
-                            results.append({
-                                "Customer Number": cust_no,
-                                "Date": convert_date_format(date),
-                                "Bonbu": bonbu,
-                                "Center": center,
-                                "Team": team,
-                                "Guksa": guksa,
-                                "Power Usage": None
-                            })
+                            yield daily_record(row, date, day[row.cust_no])
+
+            if returnType == "ndjson":
+                # (날짜, 고객) 행을 완료되는 대로 스트리밍
+                return ndjson_response(iter_records())
+
+            records = list(iter_records())
+            with stage("frame"):
+                df = pd.DataFrame(records)
+            return cached_render(request, df, date_list, returnType, lambda: render_result(df, returnType, f"kepco_daily_range_data_{date_list[0]}_{date_list[-1]}"))
+
+        except RangeTooLarge as e:
+            return error_response(str(e))
+        except Exception as e:
+            print(str(e))
+            return error_response(str(e))
+
+def render_aggregate(df, missing, returnType, basename):
+    """집계 결과를 반환합니다. json은 집계에서 제외된 고객/날짜(missing)를 함께 반환합니다."""
+    if returnType != "ndjson":
+        # ndjson은 ndjson_response가 행 수를 기록
+        observe_rows(len(df))
+    with stage("serialize"):
+        if returnType == "json":
+            json_result = df.to_json(orient="records", force_ascii=False)
+            return JsonResponse({"returnCode": "ok", "data": json.loads(json_result), "missing": missing}, json_dumps_params={'ensure_ascii': False})
+        elif returnType == "compact":
+            return JsonResponse({"returnCode": "ok", **compact_json(df), "missing": missing}, json_dumps_params={'ensure_ascii': False})
+        elif returnType == "ndjson":
+            return ndjson_response(json.loads(df.to_json(orient="records", force_ascii=False)))
+        return render_result(df, returnType, basename)
+
+@powerSaving_router.get("/aggregate")
+def aggregateData(request, filters: Query[CustomerFilter], startDate: int = None, endDate: int = None, groupBy: str = "team", bucket: str = "day", returnType: str = "json"):
+    """
+    기간 내 15분 전력 사용량을 조직 계층과 시간 단위로 서버에서 집계합니다.
+    startDate, endDate 입력 포멧: YYYYMMDD (미입력시 어제~어제, kepcoDailyRangeData와 같은 기간 상한 적용).
+    요청한 고객/날짜가 모두 저장소(ingest_lp)에 있으면 15min을 제외한 bucket은 롤업 테이블에서 바로 집계하며 기간 상한이 없습니다.
+    groupBy: all, bonbu, center, team(기본값), guksa, customer (상위 계층 컬럼을 함께 반환).
+    bucket: 15min, hour, day(기본값), week(월요일 시작), month. Period는 구간 시작 시각입니다.
+    returnType 입력 포멧: json(기본값), compact(컬럼명 목록 + 행 배열), ndjson, xlsx, csv, parquet, arrow(Arrow IPC stream).
+    custNo, bonbu, center, team, guksa 입력시 해당 고객만 집계합니다(쉼표로 여러 값 지정 가능, 미입력시 전체).
+    출력 형태는 아래와 같습니다. (missing: 조회 실패 또는 데이터가 없어 집계에서 제외된 고객/날짜)
+    {
+        "returnCode": "ok",
+        "data": [
+            {
+                "Period": "2024-10-01",
+                "Bonbu": "Bonbu Name",
+                "Center": "Center Name",
+                "Team": "Team Name",
+                "Customers": 3,
+                "Power Usage Sum": 12345.67,
+                "Power Usage Peak": 234.5,
+                "Peak Time": "2024-10-01 14:15",
+                "Power Usage Avg": 128.6
+            },
+            ...
+        ],
+        "missing": [{"Customer Number": "1234567890", "Date": "2024-10-01"}, ...]
+    }
+    """
+    if request.method == 'GET':
+        try:
+            if groupBy not in GROUP_LEVELS:
+                return error_response(f"Invalid groupBy. Use {', '.join(repr(k) for k in GROUP_LEVELS)}.")
+            if bucket not in BUCKETS:
+                return error_response(f"Invalid bucket. Use {', '.join(repr(k) for k in BUCKETS)}.")
+
+            date_list = date_range(startDate, endDate)
+
+            # 고객번호가 중복된 행은 한 번만 집계
+            customers = list({row.cust_no: row for row in select_customers(filters)}.values())
+            basename = f"kepco_aggregate_{groupBy}_{bucket}_{date_list[0]}_{date_list[-1]}"
+
+            # 모든 고객/날짜가 저장되어 있고 그룹 단위로 선택한 경우 롤업 테이블에서 바로 집계 (기간 상한 없음)
+            with stage("aggregate"):
+                df = rollup_aggregate(customers, date_list, groupBy, bucket)
+            if df is not None:
+                return render_aggregate(df, [], returnType, basename)
+
+            client = get_client()
+            plan = plan_range([row.cust_no for row in customers], date_list, cache=client.cache)
+
+            def fetch_task(task):
+                cust_no, date = task
+                try:
+                    return client.get_day_lp_data(cust_no, date)
+                except requests.RequestException as e:
+                    print(f"API Error for Customer Number {cust_no} ({date}): {str(e)}")
+                    return None
+
+            # (고객, 날짜)별 15분 구간 합계
+            days = []
+            missing = []
+            for date, day in plan.iter_days(fetch_task):
+                for row in customers:
+                    data = day[row.cust_no]
+                    day_lp_data = data.get("dayLpDataInfoList", []) if data is not None else []
+                    if day_lp_data:
+                        days.append((row, date, slot_totals(day_lp_data)))
                     else:
-                        results.append({
-                            "Customer Number": cust_no,
-                            "Date": convert_date_format(date),
-                            "Bonbu": bonbu,
-                            "Center": center,
-                            "Team": team,
-                            "Guksa": guksa,
-                            "Power Usage": "API Error"
-                        })
+                        missing.append({"Customer Number": row.cust_no, "Date": convert_date_format(date)})
 
-            df = pd.DataFrame(results)
+            with stage("aggregate"):
+                df = aggregate(interval_long(days), groupBy, bucket)
+            return render_aggregate(df, missing, returnType, basename)
 
-            if returnType == "json":
-                json_result = df.to_json(orient="records", force_ascii=False)
-                return JsonResponse({"returnCode": "ok", "data": json.loads(json_result)}, json_dumps_params={'ensure_ascii': False})
-            elif returnType == "xlsx":
-                output = BytesIO()
-                df.to_excel(output, index=False, engine='openpyxl')
-                output.seek(0)
-                response = HttpResponse(
-                    content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-                    content=output.getvalue()
-                )
-                response['Content-Disposition'] = f'attachment; filename="kepco_daily_range_data_{startDate}_{endDate}.xlsx"'
-                return response
-            else:
-                return JsonResponse({"returnCode": "le", "error": "Invalid returnType. Use 'json' or 'xlsx'."}, json_dumps_params={'ensure_ascii': False})
+        except RangeTooLarge as e:
+            return error_response(str(e))
+        except Exception as e:
+            print(str(e))
+            return error_response(str(e))
+
+def render_frame(df, returnType, basename):
+    """DB에서 읽은 결과 DataFrame을 반환합니다 (render_result + ndjson)."""
+    if returnType != "ndjson":
+        observe_rows(len(df))
+    with stage("serialize"):
+        if returnType == "ndjson":
+            return ndjson_response(json.loads(df.to_json(orient="records", force_ascii=False)))
+        return render_result(df, returnType, basename)
+
+@powerSaving_router.get("/analysis")
+def analysisData(request, filters: Query[CustomerFilter], startDate: int = None, endDate: int = None, returnType: str = "json"):
+    """
+    저장소(ingest_lp)에 저장된 15분 데이터의 고객 x 날짜 분석 지표를 반환합니다 (ingest_lp/analyze_lp가 증분 계산).\n
+    startDate, endDate 입력 포멧: YYYYMMDD (미입력시 어제~어제).\n
+    returnType 입력 포멧: json(기본값), compact(컬럼명 목록 + 행 배열), ndjson, xlsx, csv, parquet, arrow(Arrow IPC stream).\n
+    custNo, bonbu, center, team, guksa 입력시 해당 고객만 반환합니다(쉼표로 여러 값 지정 가능, 미입력시 전체).\n
+    Power Usage Sum: 일 사용량(kWh), Power Usage Peak: 15분 최대 사용량(kWh), Peak Demand: 최대수요전력(kW, 15분 사용량 x 4), Load Factor: 평균 수요 / 최대 수요.\n
+    Baseline Sum/Peak: 직전 28일 값의 중앙값, Sum/Peak Score: 기준선 대비 강건 z-score (이력이 7일 미만이면 null). Contract Power: 고객 목록 CSV의 계약전력(kW).\n
+    출력 형태는 아래와 같습니다.\n
+    {
+        "returnCode": "ok",
+        "data": [
+            {
+                "Customer Number": "1234567890",
+                "Bonbu": "Bonbu Name",
+                "Center": "Center Name",
+                "Team": "Team Name",
+                "Guksa": "Guksa Name",
+                "Date": "2024-10-01",
+                "Power Usage Sum": 2345.6,
+                "Power Usage Peak": 45.2,
+                "Peak Demand": 180.8,
+                "Peak Time": "2024-10-01 14:15",
+                "Load Factor": 0.54,
+                "Baseline Sum": 2210.3,
+                "Sum Score": 0.8,
+                "Baseline Peak": 41.7,
+                "Peak Score": 1.2,
+                "Contract Power": 300.0
+            },
+            ...
+        ]
+    }
+    """
+    if request.method == 'GET':
+        try:
+            date_list = date_range(startDate, endDate)
+            with stage("store"):
+                df = stats_frame(select_customers(filters), date_list)
+            return render_frame(df, returnType, f"kepco_analysis_{date_list[0]}_{date_list[-1]}")
+        except Exception as e:
+            print(str(e))
+            return error_response(str(e))
 
+@powerSaving_router.get("/alerts")
+def alertData(request, filters: Query[CustomerFilter], startDate: int = None, endDate: int = None, kind: str = None, severity: str = None, source: str = None, returnType: str = "json"):
+    """
+    임계치 알림을 최근 구간 순으로 반환합니다.\n
+    startDate, endDate 입력 포멧: YYYYMMDD (미입력시 최근 7일, 오늘 포함).\n
+    kind: contract_peak(최대수요전력이 계약전력의 90% 이상: warning, 초과: critical), usage_anomaly(일 사용량 이상), peak_anomaly(15분 최대 사용량 이상). 쉼표로 여러 값 지정 가능.\n
+    severity: warning, critical. source: daily(저장된 일 데이터 분석), live(실시간 폴러의 15분 구간, Period는 구간 종료 시각).\n
+    custNo, bonbu, center, team, guksa 입력시 해당 고객과 그 국사의 알림만 반환합니다(쉼표로 여러 값 지정 가능, 미입력시 전체).\n
+    returnType 입력 포멧: json(기본값), compact, ndjson, xlsx, csv, parquet, arrow.\n
+    출력 형태는 아래와 같습니다. (Level: guksa면 Customer Number는 빈 문자열, Value/Threshold: 최대수요전력/계약전력(kW) 또는 값/기준선)
+    {
+        "returnCode": "ok",
+        "data": [
+            {
+                "Period": "2024-10-01",
+                "Kind": "contract_peak",
+                "Severity": "critical",
+                "Source": "daily",
+                "Level": "guksa",
+                "Bonbu": "Bonbu Name",
+                "Center": "Center Name",
+                "Team": "Team Name",
+                "Guksa": "Guksa Name",
+                "Customer Number": "",
+                "Value": 512.4,
+                "Threshold": 500.0,
+                "Message": "Guksa Name 최대수요 512.4kW (계약전력 500.0kW의 102%)",
+                "Raised At": "2024-10-02 06:10:00"
+            },
+            ...
+        ]
+    }
+    """
+    if request.method == 'GET':
+        try:
+            if startDate is None and endDate is None:
+                today = datetime.today()
+                startDate, endDate = (today - timedelta(days=6)).strftime("%Y%m%d"), today.strftime("%Y%m%d")
+            date_list = date_range(startDate, endDate)
+            with stage("store"):
+                df = alerts_frame(select_customers(filters), date_list, kind, severity, source)
+            return render_frame(df, returnType, f"kepco_alerts_{date_list[0]}_{date_list[-1]}")
         except Exception as e:
             print(str(e))
-            return JsonResponse({"returnCode": "le", "error": str(e)}, json_dumps_params={'ensure_ascii': False})
\ No newline at end of file
+            return error_response(str(e))
+
+@powerSaving_router.get("/liveData")
+def liveData(request):
+    """
+    /powerSaving/async/liveData로 이동합니다(302, 쿼리 그대로). long-poll은 기다리는 동안 동기 워커 스레드를 점유하므로 비동기 엔드포인트에서만 제공합니다.
+    """
+    return async_redirect(request)
+
+@powerSaving_router.get("/liveStream")
+def liveStream(request):
+    """
+    /powerSaving/async/liveStream으로 이동합니다(302, 쿼리 그대로). SSE는 연결마다 동기 워커 스레드를 점유하므로 비동기 엔드포인트에서만 제공합니다.
+    """
+    return async_redirect(request)
+
+@powerSaving_router.get("/liveStatus")
+def liveStatus(request):
+    """
+    실시간 폴러 상태(현재 워커 기준)를 반환합니다: KEPCO를 조회하는 leader 워커인지, 마지막 회차 시각, seq, 보관 행 수, 고객별 마지막 수집 구간(YYYYMMDDHHMM), 고객별 마지막 조회 오류.\n
+    leader가 아닌 워커의 lastPoll, latest, errors는 이 워커가 leader였던 마지막 시점 기준입니다.
+    """
+    return {"returnCode": "ok", "data": get_poller().status()}
+
+# ---------------------------------------------------------------------------
+# 비동기 엔드포인트 (/powerSaving/async/*)
+# 동기 엔드포인트와 같은 입력/출력이며, KEPCO 호출을 httpx 비동기 클라이언트로 수행합니다.
+# ASGI(api/asgi.py, uvicorn 워커)로 실행하면 한 워커가 KEPCO 응답을 기다리는 여러 요청을 동시에 처리합니다.
+# ---------------------------------------------------------------------------
+
+@powerSaving_async_router.get("/kepcoDailyData")
+async def kepcoDailyDataAsync(request, filters: Query[CustomerFilter], date:int=None, returnType:str="json"):
+    """
+    kepcoDailyData의 비동기 버전입니다. 입력과 출력 형태는 kepcoDailyData와 같습니다.
+    """
+    try:
+        date = default_date(request.GET.get('date', None))
+
+        client = get_async_client()
+        customers = await sync_to_async(select_customers)(filters)
+        stored = await sync_to_async(load_days)([row.cust_no for row in customers], [date])
+
+        async def fetch_customer(row):
+            cust_no = row.cust_no
+            try:
+                data = stored.get((cust_no, date)) or await client.get_day_lp_data(cust_no, date)
+            except FETCH_ERRORS as e:
+                print(f"API Error for Customer Number {cust_no}: {str(e)}")
+                data = e
+            return daily_record(row, date, data)
+
+        if returnType == "ndjson":
+            return ndjson_response(afetch_iter(fetch_customer, customers))
+
+        results = await gather_limited(fetch_customer, customers)
+        with stage("frame"):
+            df = pd.DataFrame(results)
+        return await sync_to_async(cached_render)(request, df, [date], returnType, lambda: render_result(df, returnType, f"kepco_daily_data_{date}"))
+
+    except Exception as e:
+        print(str(e))
+        return error_response(str(e))
+
+@powerSaving_async_router.get("/kepcoDailyData15min")
+async def kepcoDailyData15minAsync(request, filters: Query[CustomerFilter], date:int=None, returnType:str="json"):
+    """
+    kepcoDailyData15min의 비동기 버전입니다. 입력과 출력 형태는 kepcoDailyData15min과 같습니다.
+    """
+    try:
+        date = default_date(request.GET.get('date', None))
+
+        client = get_async_client()
+        customers = await sync_to_async(select_customers)(filters)
+        stored = await sync_to_async(load_days)([row.cust_no for row in customers], [date])
+
+        async def fetch_customer(row):
+            cust_no = row.cust_no
+            try:
+                data = stored.get((cust_no, date)) or await client.get_day_lp_data(cust_no, date)
+            except FETCH_ERRORS as e:
+                print(f"API Error for Customer Number {cust_no}: {str(e)}")
+                data = e
+            return interval_rows(row, date, data)
+
+        if returnType == "ndjson":
+            return ndjson_response(astream_rows(afetch_iter(fetch_customer, customers)))
+
+        df = concat_rows(await gather_limited(fetch_customer, customers))
+        return await sync_to_async(cached_render)(request, df, [date], returnType, lambda: render_result(df, returnType, f"kepco_daily_15min_data_{date}"))
+
+    except Exception as e:
+        print(str(e))
+        return error_response(str(e))
+
+@powerSaving_async_router.get("/kepco15minData")
+async def kepco15minDataAsync(request, dateTime:int, filters: Query[CustomerFilter], returnType:str="json"):
+    """
+    kepco15minData의 비동기 버전입니다. 입력과 출력 형태는 kepco15minData와 같습니다.
+    """
+    try:
+        client = get_async_client()
+        customers = await sync_to_async(select_customers)(filters)
+
+        async def fetch_customer(row):
+            cust_no = row.cust_no
+            try:
+                data = await client.get_minute_lp_data(cust_no, dateTime)
+            except FETCH_ERRORS as e:
+                print(f"API Error for Customer Number {cust_no}: {str(e)}")
+                data = e
+            return minute_rows(row, dateTime, data)
+
+        if returnType == "ndjson":
+            return ndjson_response(astream_rows(afetch_iter(fetch_customer, customers)))
+
+        df = concat_rows(await gather_limited(fetch_customer, customers))
+        return await sync_to_async(cached_render)(request, df, [str(dateTime)[:8]], returnType, lambda: render_result(df, returnType, f"kepco_15min_data_{dateTime}"))
+
+    except Exception as e:
+        print(str(e))
+        return error_response(str(e))
+
+@powerSaving_async_router.get("/kepcoDailyRangeData")
+async def kepcoDailyRangeDataAsync(request, filters: Query[CustomerFilter], startDate: int = None, endDate: int = None, returnType: str = "json"):
+    """
+    kepcoDailyRangeData의 비동기 버전입니다. 입력과 출력 형태는 kepcoDailyRangeData와 같습니다.
+    """
+    try:
+        date_list = date_range(startDate, endDate)
+
+        client = get_async_client()
+        customers = await sync_to_async(select_customers)(filters)
+        plan = await sync_to_async(plan_range)([row.cust_no for row in customers], date_list, cache=client.cache)
+
+        async def fetch_task(task):
+            cust_no, date = task
+            try:
+                return await client.get_day_lp_data(cust_no, date)
+            except FETCH_ERRORS as e:
+                print(f"API Error for Customer Number {cust_no} ({date}): {str(e)}")
+                return e
+
+        totals = await sync_to_async(day_totals)(plan.stored)
+
+        async def iter_records():
+            """일 합계 행을 (날짜, 고객) 순서로 생성합니다."""
+            async for date, day in plan.aiter_days(fetch_task, skip=totals):
+                for row in customers:
+                    key = (row.cust_no, date)
+                    if key in totals:
+                        yield daily_row(row, date, totals[key])
+                    else:
+                        yield daily_record(row, date, day[row.cust_no])
+
+        if returnType == "ndjson":
+            return ndjson_response(iter_records())
+
+        records = [record async for record in iter_records()]
+        with stage("frame"):
+            df = pd.DataFrame(records)
+        return await sync_to_async(cached_render)(request, df, date_list, returnType, lambda: render_result(df, returnType, f"kepco_daily_range_data_{date_list[0]}_{date_list[-1]}"))
+
+    except RangeTooLarge as e:
+        return error_response(str(e))
+    except Exception as e:
+        print(str(e))
+        return error_response(str(e))
+
+@powerSaving_async_router.get("/liveData")
+async def liveDataAsync(request, filters: Query[CustomerFilter], since: int = None, timeout: int = LONG_POLL_TIMEOUT):
+    """
+    실시간 15분 전력 사용량(최근 24시간, 서버가 새 구간만 계속 조회해 메모리에 유지)을 long-poll로 반환합니다.\n
+    since 미입력시 현재 보관 중인 전체 행을 바로 반환합니다.\n
+    since(이전 응답의 seq) 입력시 그 이후 새 구간이 수집될 때까지 최대 timeout초(기본값 25, 최대 60) 기다렸다가 새 행만 반환합니다(없으면 빈 data).\n
+    custNo, bonbu, center, team, guksa 입력시 해당 고객만 반환합니다(쉼표로 여러 값 지정 가능, 미입력시 전체).\n
+    seq는 모든 워커가 같은 값을 사용하므로 다음 요청이 다른 워커로 가도 이어받을 수 있습니다.\n
+    출력 형태는 아래와 같습니다. (seq: 다음 요청의 since로 사용, truncated: since 이후 행 일부가 이미 보관 기간을 지나 빠진 경우)
+    {
+        "returnCode": "ok",
+        "seq": 42,
+        "truncated": false,
+        "data": [
+            {
+                "Customer Number": "1234567890",
+                "MeterNo": "Meter123",
+                "Date": "2024-10-01",
+                "Time": "1415",
+                "Bonbu": "Bonbu Name",
+                "Center": "Center Name",
+                "Team": "Team Name",
+                "Guksa": "Guksa Name",
+                "Power Usage": 123.45,
+                "Status": "ok"
+            },
+            ...
+        ]
+    }
+    """
+    try:
+        customers = await sync_to_async(select_customers)(filters)
+        cust_nos = {row.cust_no for row in customers}
+        window = (await sync_to_async(get_poller)()).window
+        if since is None:
+            seq, records, truncated = window.since(0, cust_nos)
+        else:
+            seq, records, truncated = await window.acollect(since, cust_nos, max(0, min(timeout, MAX_LONG_POLL)))
+        return JsonResponse({"returnCode": "ok", "seq": seq, "truncated": truncated, "data": records}, json_dumps_params={'ensure_ascii': False})
+    except Exception as e:
+        print(str(e))
+        return error_response(str(e))
+
+@powerSaving_async_router.get("/liveStream")
+async def liveStreamAsync(request, filters: Query[CustomerFilter], since: int = None):
+    """
+    /powerSaving/async/liveData와 같은 실시간 15분 전력 사용량을 Server-Sent Events(text/event-stream)로 보냅니다.\n
+    연결하면 보관 중인 전체 행(since 입력시 그 이후 행)을 먼저 보내고, 새 구간이 수집될 때마다 event: interval을 보냅니다.\n
+    이벤트 id는 seq이며, 연결이 끊기면 브라우저(EventSource)가 Last-Event-ID로 다시 연결해 놓친 행부터 이어받습니다.\n
+    각 이벤트의 data는 liveData 응답에서 returnCode를 뺀 {"seq", "truncated", "data"}입니다.
+    """
+    try:
+        customers = await sync_to_async(select_customers)(filters)
+        cust_nos = {row.cust_no for row in customers}
+        window = (await sync_to_async(get_poller)()).window
+        return sse_response(asse_events(window, last_event_id(request, since), cust_nos))
+    except Exception as e:
+        print(str(e))
+        return error_response(str(e))
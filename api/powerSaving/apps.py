@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class PowersavingConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'powerSaving'
+
+    def ready(self):
+        from django.test.signals import setting_changed
+
+        from .conf import reset_settings
+
+        # override_settings(KEPCO=...) 적용 시 KEPCO 설정을 다시 읽음
+        setting_changed.connect(reset_settings, dispatch_uid="powerSaving.conf.reset_settings")
@@ -0,0 +1,221 @@
+"""
+powerSaving 엔드포인트와 kepco_daily_report.py 벤치마크 (bench_kepco 관리 명령).
+
+fake_kepco 대역 서버를 띄우고, 고객 수(예: 34, 500, 5000)별로 kepcolist_gg.csv의 조직 구성을 반복한
+가상 고객 목록을 만든 뒤 케이스마다 새 프로세스에서 실행합니다.
+(캐시 파일과 프로세스 메모리가 케이스끼리 섞이지 않도록 프로세스와 캐시를 케이스마다 새로 만듭니다.)
+
+측정값
+    - cold: 빈 캐시에서 첫 요청의 end-to-end 시간 (미들웨어, 렌더링 포함)
+    - warm: 같은 요청을 한 번 더 보낸 시간 (응답 캐시 사용)
+    - calls: cold/warm 동안 대역 서버가 받은 KEPCO 호출 수
+    - rows: 응답 행 수 (report 케이스는 만든 첨부 파일 수)
+    - throughput: cold 기준 초당 처리 고객 수
+    - peak RSS: 케이스 프로세스(또는 그 자식 프로세스)의 최대 RSS (Django/pandas 로딩 포함)
+케이스마다 빈 임시 DB를 migrate해서 쓰고, 어제/그제 날짜만 조회하므로 로컬 저장소(LoadProfile)가 아닌 KEPCO 호출 경로를 측정합니다.
+"""
+import asyncio
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+from django.conf import settings
+
+from . import fake_kepco
+from .conf import get_settings
+
+DEFAULT_SIZES = (34, 500, 5000)
+
+# 케이스 이름 → (종류, 경로 또는 보고서 함수)
+CASES = {
+    "daily": ("http", "/ninja-api/powerSaving/kepcoDailyData?date={date}"),
+    "daily15min": ("http", "/ninja-api/powerSaving/kepcoDailyData15min?date={date}"),
+    "15min": ("http", "/ninja-api/powerSaving/kepco15minData?dateTime={date}1200"),
+    "range": ("http", "/ninja-api/powerSaving/kepcoDailyRangeData?startDate={start}&endDate={date}"),
+    "aggregate": ("http", "/ninja-api/powerSaving/aggregate?startDate={start}&endDate={date}&groupBy=team&bucket=hour"),
+    "async-daily": ("async", "/ninja-api/powerSaving/async/kepcoDailyData?date={date}"),
+    "async-daily15min": ("async", "/ninja-api/powerSaving/async/kepcoDailyData15min?date={date}"),
+    "async-15min": ("async", "/ninja-api/powerSaving/async/kepco15minData?dateTime={date}1200"),
+    "async-range": ("async", "/ninja-api/powerSaving/async/kepcoDailyRangeData?startDate={start}&endDate={date}"),
+    "report": ("report", "generate_reports"),
+}
+
+
+def write_roster(size, path, template=None):
+    """template(기본값: 설정의 고객 목록) 고객 목록의 본부/센터/팀/국사 구성을 반복해 size명의 가상 고객 목록 CSV를 만듭니다."""
+    template = pd.read_csv(template or get_settings().customer_csv, dtype=str)
+    rows = template.iloc[[i % len(template) for i in range(size)]].reset_index(drop=True)
+    rows["고객번호"] = [f"9{i:09d}" for i in range(size)]
+    rows.to_csv(path, index=False, encoding="utf-8")
+    return path
+
+
+def _peak_rss_mb():
+    # Linux: KB 단위. 보고서 워크북을 만드는 자식 프로세스 포함 (자식 중 최대값)
+    return max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    ) / 1024
+
+
+def _body(response):
+    if response.streaming:
+        return b"".join(response.streaming_content)
+    return response.content
+
+
+async def _abody(response):
+    if response.streaming:
+        return b"".join([chunk async for chunk in response.streaming_content])
+    return response.content
+
+
+def _summary(body):
+    """응답 본문에서 (returnCode, 행 수)를 반환합니다."""
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return "ok", None
+    return data.get("returnCode"), len(data.get("data", []))
+
+
+def run_case(case):
+    """
+    케이스 하나를 현재 프로세스에서 실행하고 결과(dict)를 반환합니다.
+    bench_kepco --case로 실행되는 자식 프로세스에서 호출됩니다 (환경 변수는 부모가 설정).
+    """
+    from django.core.management import call_command
+    from django.db import connections
+    from django.test import AsyncClient, Client
+
+    from . import fetch
+    from .kepco_client import get_client
+
+    if case.get("max_rate"):
+        get_client().keys.set_rate(case["max_rate"])
+    if case.get("workers"):
+        fetch.MAX_IN_FLIGHT = case["workers"]
+
+    # 테스트 클라이언트의 Host(testserver) 허용 (Django 테스트 러너와 같은 방식)
+    settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, "testserver"]
+    # 케이스별 빈 DB (운영 db.sqlite3는 건드리지 않음)
+    connections["default"].settings_dict["NAME"] = case["database"]
+    call_command("migrate", verbosity=0)
+
+    kind, target = CASES[case["name"]]
+    result = {"base_rss_mb": _peak_rss_mb()}
+    timings = []
+
+    if kind == "report":
+        import kepco_daily_report
+
+        for _ in range(2):
+            started = time.perf_counter()
+            attachments = getattr(kepco_daily_report, target)()
+            timings.append(time.perf_counter() - started)
+            # 보고서 중 일부가 만들어지지 않으면 missing
+            result.update(
+                status="ok" if len(attachments) == len(kepco_daily_report.REPORTS) else "missing",
+                rows=len(attachments),
+                bytes=sum(len(content) for _, content in attachments),
+            )
+    else:
+        path = target.format(**case["dates"])
+        if kind == "http":
+            client = Client()
+            for _ in range(2):
+                started = time.perf_counter()
+                body = _body(client.get(path))
+                timings.append(time.perf_counter() - started)
+        else:
+            async def run():
+                client = AsyncClient()
+                for _ in range(2):
+                    started = time.perf_counter()
+                    body = await _abody(await client.get(path))
+                    timings.append(time.perf_counter() - started)
+                return body
+
+            body = asyncio.run(run())
+        status, rows = _summary(body)
+        result.update(status=status, rows=rows, bytes=len(body))
+
+    result.update(cold_s=timings[0], warm_s=timings[1], peak_rss_mb=_peak_rss_mb())
+    return result
+
+
+def run_benchmark(sizes=DEFAULT_SIZES, names=None, range_days=2, latency=fake_kepco.DEFAULT_LATENCY,
+                  error_rate=0.0, meters=1, max_rate=None, workers=None, log=print):
+    """
+    대역 서버를 띄우고 sizes × names 케이스를 각각 새 프로세스에서 실행합니다.
+    결과 dict 목록을 반환합니다.
+    """
+    names = names or list(CASES)
+    server = fake_kepco.start(latency=latency, error_rate=error_rate, meters=meters)
+    today = datetime.today()
+    dates = {
+        "date": (today - timedelta(days=1)).strftime("%Y%m%d"),
+        "start": (today - timedelta(days=range_days)).strftime("%Y%m%d"),
+    }
+    results = []
+    try:
+        with tempfile.TemporaryDirectory(prefix="kepco-bench-") as workdir:
+            workdir = Path(workdir)
+            for size in sizes:
+                roster = write_roster(size, workdir / f"roster_{size}.csv")
+                for name in names:
+                    case = {
+                        "name": name,
+                        "dates": dates,
+                        "max_rate": max_rate,
+                        "workers": workers,
+                        "database": str(workdir / f"db_{size}_{name}.sqlite3"),
+                        "result_path": str(workdir / "result.json"),
+                    }
+                    case_path = workdir / "case.json"
+                    case_path.write_text(json.dumps(case))
+                    cache_path = workdir / f"cache_{size}_{name}.sqlite3"
+                    env = dict(
+                        os.environ,
+                        KEPCO_BASE_URL=server.base_url,
+                        KEPCO_CUSTOMER_CSV=str(roster),
+                        KEPCO_CACHE_PATH=str(cache_path),
+                    )
+
+                    calls_before = server.counts["requests"]
+                    completed = subprocess.run(
+                        [sys.executable, str(Path(settings.BASE_DIR) / "manage.py"), "bench_kepco", "--case", str(case_path)],
+                        cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+                    )
+                    if completed.returncode != 0:
+                        result = {"status": "failed", "error": completed.stderr.strip().splitlines()[-1:]}
+                    else:
+                        result = json.loads(Path(case["result_path"]).read_text())
+                    result.update(case=name, customers=size, calls=server.counts["requests"] - calls_before)
+                    if result.get("cold_s"):
+                        result["customers_per_s"] = size / result["cold_s"]
+                    results.append(result)
+                    log(format_result(result))
+    finally:
+        server.shutdown()
+        server.server_close()
+    return results
+
+
+def format_result(result):
+    if result["status"] == "failed":
+        return f"{result['case']:<18} {result['customers']:>6} failed: {result.get('error')}"
+    return (
+        f"{result['case']:<18} {result['customers']:>6} "
+        f"cold {result['cold_s']:8.2f}s  warm {result['warm_s']:7.3f}s  "
+        f"{result.get('customers_per_s', 0):8.1f} cust/s  calls {result['calls']:>6}  "
+        f"rows {result.get('rows') if result.get('rows') is not None else '-':>7}  "
+        f"{result['bytes'] / 1024:9.1f} KB  peak RSS {result['peak_rss_mb']:7.1f} MB  {result['status']}"
+    )
@@ -0,0 +1,247 @@
+"""
+KEPCO OpenAPI 응답 캐시.
+
+(endpoint, custNo, date) 키로 KEPCO 응답(JSON)을 로컬 SQLite 파일에 저장합니다.
+Django 없이 실행되는 kepco_daily_report.py에서도 같은 캐시를 사용할 수 있도록
+표준 sqlite3 모듈을 사용하며, gunicorn 워커 간에도 공유됩니다.
+
+TTL 규칙 (date 기준)
+    - 그저께 이전: 확정된 데이터이므로 만료되지 않음
+    - 어제: YESTERDAY_TTL 초 후 갱신
+    - 오늘(이후): TODAY_TTL 초 후 갱신
+    - final로 저장된 응답(하루 96개 구간이 모두 게시된 getDayLpData 등)은 날짜와 관계없이 만료되지 않음
+항목 수가 MAX_ENTRIES를 넘으면 가장 오래 사용되지 않은 항목부터 삭제합니다.
+
+같은 파일의 kepco_lease 테이블은 워커 간 조회 임대(lease)입니다. 같은 키를 KEPCO에서 가져오는 워커는
+하나뿐이며, 임대는 LEASE_TTL 초 후 만료되므로 leader 워커가 죽어도 다른 워커가 이어받습니다.
+"""
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from .conf import get_settings
+
+TODAY_TTL = 5 * 60
+YESTERDAY_TTL = 60 * 60
+
+MAX_ENTRIES = 200_000
+# 쓰기 EVICT_EVERY 회마다 한 번씩 크기 제한을 검사
+EVICT_EVERY = 500
+
+# 조회 임대 만료 시간(초). 재시도를 포함한 KEPCO 호출 하나보다 길어야 함
+LEASE_TTL = 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS kepco_response (
+    endpoint    TEXT NOT NULL,
+    cust_no     TEXT NOT NULL,
+    date        TEXT NOT NULL,
+    payload     TEXT NOT NULL,
+    fetched_at  REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    final       INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (endpoint, cust_no, date)
+);
+CREATE INDEX IF NOT EXISTS kepco_response_accessed ON kepco_response (accessed_at);
+CREATE TABLE IF NOT EXISTS kepco_lease (
+    endpoint    TEXT NOT NULL,
+    cust_no     TEXT NOT NULL,
+    date        TEXT NOT NULL,
+    owner       TEXT NOT NULL,
+    expires_at  REAL NOT NULL,
+    PRIMARY KEY (endpoint, cust_no, date)
+);
+"""
+
+
+def ttl_for(date, now=None):
+    """date(YYYYMMDD 또는 YYYYMMDDHHMM)에 해당하는 TTL(초)을 반환합니다. None이면 만료되지 않음."""
+    now = now or datetime.now()
+    try:
+        day = datetime.strptime(str(date)[:8], "%Y%m%d").date()
+    except ValueError:
+        return TODAY_TTL
+    yesterday = (now - timedelta(days=1)).date()
+    if day < yesterday:
+        return None
+    if day == yesterday:
+        return YESTERDAY_TTL
+    return TODAY_TTL
+
+
+class ResponseCache:
+    """
+    (endpoint, custNo, date) 단위 KEPCO 응답 캐시.
+    path를 주지 않으면 conf.get_settings()의 cache_path(settings.KEPCO["CACHE_PATH"] / KEPCO_CACHE_PATH)를 사용합니다.
+    """
+
+    def __init__(self, path=None, max_entries=MAX_ENTRIES):
+        self.path = str(path or get_settings().cache_path)
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.counters = {"hits": 0, "misses": 0, "expired": 0, "writes": 0, "evictions": 0}
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(kepco_response)")}
+            if "final" not in columns:
+                # final 컬럼 추가 이전에 만든 캐시 파일
+                conn.execute("ALTER TABLE kepco_response ADD COLUMN final INTEGER NOT NULL DEFAULT 0")
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _count(self, name, n=1):
+        with self._lock:
+            self.counters[name] += n
+
+    def get(self, endpoint, cust_no, date, count_miss=True):
+        """
+        캐시된 응답(dict)을 반환합니다. 없거나 만료되었으면 None.
+        count_miss=False: 같은 조회를 다시 확인하는 경우로, miss를 카운터에 더하지 않음
+        """
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT payload, fetched_at, final FROM kepco_response WHERE endpoint=? AND cust_no=? AND date=?",
+            (endpoint, cust_no, str(date)),
+        ).fetchone()
+        if row is None:
+            if count_miss:
+                self._count("misses")
+            return None
+
+        payload, fetched_at, final = row
+        now = time.time()
+        ttl = ttl_for(date)
+        if ttl is not None and not final and now - fetched_at > ttl:
+            if count_miss:
+                self._count("expired")
+                self._count("misses")
+            return None
+
+        conn.execute(
+            "UPDATE kepco_response SET accessed_at=? WHERE endpoint=? AND cust_no=? AND date=?",
+            (now, endpoint, cust_no, str(date)),
+        )
+        self._count("hits")
+        return json.loads(payload)
+
+    def cached_keys(self, endpoint, cust_nos, dates, final_only=False):
+        """
+        만료되지 않은 (고객번호, date) 집합을 반환합니다. hit/miss 카운터와 사용 시각은 바꾸지 않습니다.
+        final_only: final로 저장된 응답만 반환
+        """
+        cust_nos = set(cust_nos)
+        dates = [str(d) for d in dates]
+        conn = self._connect()
+        now = time.time()
+        keys = set()
+        for start in range(0, len(dates), 500):
+            chunk = dates[start:start + 500]
+            rows = conn.execute(
+                f"SELECT cust_no, date, fetched_at, final FROM kepco_response "
+                f"WHERE endpoint=? AND date IN ({','.join('?' * len(chunk))})",
+                (endpoint, *chunk),
+            )
+            for cust_no, date, fetched_at, final in rows:
+                if cust_no not in cust_nos or (final_only and not final):
+                    continue
+                ttl = ttl_for(date)
+                if final or ttl is None or now - fetched_at <= ttl:
+                    keys.add((cust_no, date))
+        return keys
+
+    def set(self, endpoint, cust_no, date, data, final=False):
+        """응답(dict)을 저장합니다. final이면 TTL과 관계없이 만료되지 않습니다."""
+        now = time.time()
+        self._connect().execute(
+            "INSERT OR REPLACE INTO kepco_response (endpoint, cust_no, date, payload, fetched_at, accessed_at, final) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (endpoint, cust_no, str(date), json.dumps(data, ensure_ascii=False), now, now, int(final)),
+        )
+        self._count("writes")
+        with self._lock:
+            self._writes += 1
+            evict = self._writes % EVICT_EVERY == 0
+        if evict:
+            self.evict()
+
+    def acquire_lease(self, endpoint, cust_no, date, ttl=LEASE_TTL):
+        """
+        (endpoint, custNo, date) 조회 임대를 얻고 release_lease()에 넘길 owner를 반환합니다.
+        다른 워커가 만료되지 않은 임대를 가지고 있으면 기다리지 않고 None을 반환합니다.
+        """
+        owner = uuid.uuid4().hex
+        now = time.time()
+        cursor = self._connect().execute(
+            "INSERT INTO kepco_lease (endpoint, cust_no, date, owner, expires_at) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (endpoint, cust_no, date) DO UPDATE SET owner=excluded.owner, expires_at=excluded.expires_at "
+            "WHERE kepco_lease.expires_at < ?",
+            (endpoint, cust_no, str(date), owner, now + ttl, now),
+        )
+        return owner if cursor.rowcount == 1 else None
+
+    def renew_lease(self, endpoint, cust_no, date, owner, ttl=LEASE_TTL):
+        """owner가 가진 임대의 만료 시각을 ttl초 뒤로 늘립니다. 이미 만료되어 다른 워커가 가져갔으면 False."""
+        cursor = self._connect().execute(
+            "UPDATE kepco_lease SET expires_at=? WHERE endpoint=? AND cust_no=? AND date=? AND owner=?",
+            (time.time() + ttl, endpoint, cust_no, str(date), owner),
+        )
+        return cursor.rowcount == 1
+
+    def release_lease(self, endpoint, cust_no, date, owner):
+        """acquire_lease()로 얻은 임대를 반납합니다. 만료되어 다른 워커가 가져간 임대는 건드리지 않습니다."""
+        self._connect().execute(
+            "DELETE FROM kepco_lease WHERE endpoint=? AND cust_no=? AND date=? AND owner=?",
+            (endpoint, cust_no, str(date), owner),
+        )
+
+    def evict(self):
+        """max_entries를 넘는 항목을 오래 사용되지 않은 순서로 삭제합니다."""
+        conn = self._connect()
+        (total,) = conn.execute("SELECT COUNT(*) FROM kepco_response").fetchone()
+        excess = total - self.max_entries
+        if excess <= 0:
+            return 0
+        conn.execute(
+            "DELETE FROM kepco_response WHERE rowid IN "
+            "(SELECT rowid FROM kepco_response ORDER BY accessed_at LIMIT ?)",
+            (excess,),
+        )
+        self._count("evictions", excess)
+        return excess
+
+    def stats(self):
+        """현재 프로세스의 hit/miss 카운터와 저장된 항목 수를 반환합니다."""
+        (entries,) = self._connect().execute("SELECT COUNT(*) FROM kepco_response").fetchone()
+        with self._lock:
+            stats = dict(self.counters)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = round(stats["hits"] / lookups, 4) if lookups else None
+        stats["entries"] = entries
+        stats["max_entries"] = self.max_entries
+        return stats
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """프로세스 전역 ResponseCache를 반환합니다 (최초 호출 시 생성)."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResponseCache()
+    return _cache
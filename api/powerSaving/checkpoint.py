@@ -0,0 +1,94 @@
+"""
+kepco_daily_report.py 진행 상황 저장소 (재시작 시 이어서 실행).
+
+(날짜, 고객번호)별로 조회에 성공한 getDayLpData.do 응답을 저장하고, 보고서를 보낸(저장한) 날짜를 기록합니다.
+작업이 중간에 중단되어도 다시 실행하면 이미 보낸 날짜는 건너뛰고,
+진행 중이던 날짜는 저장된 고객의 응답을 그대로 사용해 나머지 고객만 KEPCO에 조회합니다.
+kepco_daily_report.py에서 사용하므로 cache.ResponseCache와 같이 표준 sqlite3 모듈을 사용합니다.
+"""
+import json
+import sqlite3
+import threading
+import time
+
+from .conf import get_settings
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS report_customer (
+    date        TEXT NOT NULL,
+    cust_no     TEXT NOT NULL,
+    payload     TEXT NOT NULL,
+    fetched_at  REAL NOT NULL,
+    PRIMARY KEY (date, cust_no)
+);
+CREATE TABLE IF NOT EXISTS report_day (
+    date        TEXT PRIMARY KEY,
+    files       TEXT NOT NULL,
+    done_at     REAL NOT NULL
+);
+"""
+
+
+class ReportCheckpoint:
+    """
+    (날짜, 고객번호)별 조회 결과와 날짜별 완료 여부.
+    path를 주지 않으면 conf.get_settings()의 checkpoint_path(settings.KEPCO["CHECKPOINT_PATH"] / KEPCO_CHECKPOINT_PATH)를 사용합니다.
+    """
+
+    def __init__(self, path=None):
+        self.path = str(path or get_settings().checkpoint_path)
+        self._local = threading.local()
+        self._connect().executescript(_SCHEMA)
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def load(self, date):
+        """date에 저장된 {고객번호: 응답(dict)}을 반환합니다."""
+        rows = self._connect().execute(
+            "SELECT cust_no, payload FROM report_customer WHERE date=?", (str(date),)
+        )
+        return {cust_no: json.loads(payload) for cust_no, payload in rows}
+
+    def save(self, date, cust_no, data):
+        """고객 한 명의 조회 결과를 저장합니다."""
+        self._connect().execute(
+            "INSERT OR REPLACE INTO report_customer (date, cust_no, payload, fetched_at) VALUES (?, ?, ?, ?)",
+            (str(date), cust_no, json.dumps(data, ensure_ascii=False), time.time()),
+        )
+
+    def is_done(self, date):
+        row = self._connect().execute("SELECT 1 FROM report_day WHERE date=?", (str(date),)).fetchone()
+        return row is not None
+
+    def mark_done(self, date, files):
+        """date의 보고서를 보냈음(저장했음)을 기록하고, 더 필요 없는 고객별 응답을 지웁니다."""
+        self._transaction(
+            ("INSERT OR REPLACE INTO report_day (date, files, done_at) VALUES (?, ?, ?)",
+             (str(date), json.dumps(list(files), ensure_ascii=False), time.time())),
+            ("DELETE FROM report_customer WHERE date=?", (str(date),)),
+        )
+
+    def reset(self, date):
+        """date의 진행 상황을 지웁니다 (처음부터 다시 실행)."""
+        self._transaction(
+            ("DELETE FROM report_day WHERE date=?", (str(date),)),
+            ("DELETE FROM report_customer WHERE date=?", (str(date),)),
+        )
+
+    def _transaction(self, *statements):
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for sql, params in statements:
+                conn.execute(sql, params)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
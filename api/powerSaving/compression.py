@@ -0,0 +1,170 @@
+"""
+powerSaving 응답 압축 미들웨어 (gzip, brotli, zstd).
+
+클라이언트의 Accept-Encoding 중 zstd → br → gzip 순서로 사용 가능한 방식을 골라 응답을 압축합니다.
+brotli / zstd는 각각 brotli, zstandard 패키지가 설치된 경우에만 사용하며, 없으면 gzip만 사용합니다.
+NDJSON 등 스트리밍 응답은 chunk마다 압축해 flush하므로 레코드가 만들어지는 대로 전송됩니다
+(압축 사전은 chunk 사이에 유지되어 반복되는 키/본부명 등이 계속 압축됩니다).
+xlsx / parquet처럼 이미 압축된 파일 형식은 다시 압축하지 않습니다.
+"""
+import re
+import zlib
+
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+from .metrics import stage
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# 압축 대상 경로와 Content-Type
+COMPRESS_PATH_PREFIX = "/ninja-api/powerSaving/"
+COMPRESS_CONTENT_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "text/csv",
+    "application/vnd.apache.arrow.stream",
+)
+
+# 이보다 짧은 응답은 압축하지 않음
+MIN_SIZE = 200
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+ZSTD_LEVEL = 3
+
+
+class _Gzip:
+    def __init__(self):
+        # wbits=31: gzip 헤더/트레일러 포함 (mtime 0)
+        self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def compress(self, data):
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._compressor.flush()
+
+
+class _Brotli:
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+
+    def compress(self, data):
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self):
+        return self._compressor.finish()
+
+
+class _Zstd:
+    def __init__(self):
+        self._compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+
+    def compress(self, data):
+        return self._compressor.compress(data) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self):
+        return self._compressor.flush()
+
+
+# Content-Encoding → 압축기 (서버 선호 순서)
+ENCODERS = {}
+if zstandard is not None:
+    ENCODERS["zstd"] = _Zstd
+if brotli is not None:
+    ENCODERS["br"] = _Brotli
+ENCODERS["gzip"] = _Gzip
+
+_ACCEPT_ENCODING = re.compile(r"\s*([^\s;,]+)\s*(?:;\s*q\s*=\s*([0-9.]+))?")
+
+
+def choose_encoding(accept_encoding):
+    """Accept-Encoding 헤더에서 사용할 Content-Encoding을 고릅니다. 압축하지 않으면 None."""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        match = _ACCEPT_ENCODING.match(part)
+        if not match:
+            continue
+        try:
+            quality = float(match.group(2)) if match.group(2) else 1.0
+        except ValueError:
+            continue
+        accepted[match.group(1).lower()] = quality
+
+    best = None
+    for encoding in ENCODERS:
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > 0 and (best is None or quality > best[1]):
+            best = (encoding, quality)
+    return best[0] if best else None
+
+
+def compress_chunks(chunks, encoding):
+    """bytes chunk iterable을 압축 스트림으로 변환합니다."""
+    compressor = ENCODERS[encoding]()
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+async def acompress_chunks(chunks, encoding):
+    """compress_chunks의 비동기 버전 (chunks: async iterable)."""
+    compressor = ENCODERS[encoding]()
+    async for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """COMPRESS_PATH_PREFIX 아래 응답을 Accept-Encoding에 맞춰 압축합니다."""
+
+    def process_response(self, request, response):
+        if not request.path.startswith(COMPRESS_PATH_PREFIX):
+            return response
+        if response.status_code != 200 or response.has_header("Content-Encoding"):
+            return response
+        if not response.get("Content-Type", "").startswith(COMPRESS_CONTENT_TYPES):
+            return response
+        if not response.streaming and len(response.content) < MIN_SIZE:
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = choose_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = acompress_chunks(response.streaming_content, encoding)
+            else:
+                response.streaming_content = compress_chunks(response.streaming_content, encoding)
+            # 압축 후 크기는 전송이 끝나야 알 수 있음
+            del response.headers["Content-Length"]
+        else:
+            with stage("compress"):
+                compressor = ENCODERS[encoding]()
+                compressed = compressor.compress(response.content) + compressor.finish()
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+
+        # 압축된 바이트는 원본과 다르므로 strong ETag를 weak로 바꿈 (If-None-Match는 weak 비교로 계속 일치)
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = encoding
+        return response
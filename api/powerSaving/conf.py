@@ -0,0 +1,109 @@
+"""
+KEPCO 연동 설정 (OpenAPI 주소, 서비스 키, 고객 목록, 응답 캐시/보고서 진행 상황 파일).
+
+Django settings의 KEPCO(dict)를 읽고, 같은 이름의 KEPCO_* 환경 변수가 있으면 그 값을 우선합니다.
+프로세스당 한 번만 읽으며(get_settings), api.py, kepco_daily_report.py와 관리 명령이 같은 값을 사용합니다.
+주소, 서비스 키, 파일 경로 모두 사용하는 시점에 get_settings()로 읽으므로, 테스트의 override_settings(KEPCO=...)는
+setting_changed 신호(apps.PowersavingConfig.ready)로 다시 읽게 됩니다.
+Django 설정을 불러올 수 없는 경우(DJANGO_SETTINGS_MODULE 미지정 등)에는 환경 변수와 기본값만 사용합니다.
+
+    settings.KEPCO          환경 변수               기본값
+    BASE_URL                KEPCO_BASE_URL          https://opm.kepco.co.kr:11080/OpenAPI
+    SERVICE_KEYS (목록)     KEPCO_SERVICE_KEYS      기존 서비스 키 1개 (환경 변수는 쉼표 구분)
+    CUSTOMER_CSV            KEPCO_CUSTOMER_CSV      kepcolist_gg.csv (실행 디렉터리 기준)
+    CACHE_PATH              KEPCO_CACHE_PATH        <프로젝트>/kepco_cache.sqlite3
+    CHECKPOINT_PATH         KEPCO_CHECKPOINT_PATH   <프로젝트>/kepco_report_checkpoint.sqlite3
+
+서비스 키를 여러 개 지정하면 키마다 호출 속도 제한(throttle.TokenBucket)을 따로 두고
+호출을 키들에 나누어 보내므로 전체 호출 한도가 키 개수만큼 늘어납니다.
+"""
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from django.core.exceptions import ImproperlyConfigured
+
+DEFAULT_BASE_URL = "https://opm.kepco.co.kr:11080/OpenAPI"
+DEFAULT_SERVICE_KEYS = ("bpb89eyd7bg430vckh8t",)
+DEFAULT_CUSTOMER_CSV = "kepcolist_gg.csv"
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent.parent / "kepco_cache.sqlite3"
+DEFAULT_CHECKPOINT_PATH = Path(__file__).resolve().parent.parent / "kepco_report_checkpoint.sqlite3"
+
+
+@dataclass(frozen=True)
+class KepcoSettings:
+    base_url: str
+    service_keys: tuple[str, ...]
+    customer_csv: str
+    cache_path: Path
+    checkpoint_path: Path
+
+    @property
+    def service_key(self):
+        """첫 번째 서비스 키."""
+        return self.service_keys[0]
+
+
+def _django_settings():
+    """settings.KEPCO(dict)를 반환합니다. Django 설정이 없으면 빈 dict."""
+    from django.conf import settings
+
+    try:
+        return dict(getattr(settings, "KEPCO", {}))
+    except ImproperlyConfigured:
+        return {}
+
+
+def _split_keys(value):
+    if isinstance(value, str):
+        value = value.split(",")
+    return tuple(key.strip() for key in value if key and key.strip())
+
+
+def load_settings(environ=None):
+    """Django settings와 환경 변수(environ, 기본값 os.environ)로 KepcoSettings를 만듭니다."""
+    environ = os.environ if environ is None else environ
+    configured = _django_settings()
+
+    def value(name, default=None):
+        return environ.get(f"KEPCO_{name}") or configured.get(name, default)
+
+    base_url = str(value("BASE_URL", DEFAULT_BASE_URL)).rstrip("/")
+    if urlsplit(base_url).scheme not in ("http", "https"):
+        raise ImproperlyConfigured(f"KEPCO BASE_URL must be an http(s) URL: {base_url!r}")
+
+    service_keys = _split_keys(value("SERVICE_KEYS", DEFAULT_SERVICE_KEYS))
+    if not service_keys:
+        raise ImproperlyConfigured("KEPCO SERVICE_KEYS is empty (settings.KEPCO or KEPCO_SERVICE_KEYS)")
+
+    return KepcoSettings(
+        base_url=base_url,
+        service_keys=service_keys,
+        customer_csv=str(value("CUSTOMER_CSV", DEFAULT_CUSTOMER_CSV)),
+        cache_path=Path(value("CACHE_PATH", DEFAULT_CACHE_PATH)),
+        checkpoint_path=Path(value("CHECKPOINT_PATH", DEFAULT_CHECKPOINT_PATH)),
+    )
+
+
+_settings = None
+_settings_lock = threading.Lock()
+
+
+def get_settings():
+    """프로세스 전역 KepcoSettings를 반환합니다 (최초 호출 시 한 번 읽음)."""
+    global _settings
+    if _settings is None:
+        with _settings_lock:
+            if _settings is None:
+                _settings = load_settings()
+    return _settings
+
+
+def reset_settings(setting=None, **kwargs):
+    """다음 get_settings() 호출 때 설정을 다시 읽게 합니다 (setting_changed 신호 수신 함수로도 사용)."""
+    global _settings
+    if setting in (None, "KEPCO"):
+        with _settings_lock:
+            _settings = None
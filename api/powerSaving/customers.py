@@ -0,0 +1,140 @@
+"""
+고객(국사) 목록 레지스트리.
+
+kepcolist_gg.csv를 프로세스당 한 번만 읽어 slot 레코드로 보관하고, 파일 mtime이 바뀌면 다시 읽습니다.
+고객번호, 본부명, 센터, 팀, 국사별 인덱스를 만들어 두므로 엔드포인트는 요청마다 CSV를 읽지 않고
+필터(예: team=원효운용팀)에 해당하는 고객만 CSV 순서대로 바로 꺼낼 수 있습니다.
+"""
+import math
+import os
+import threading
+
+import pandas as pd
+
+from .conf import get_settings
+
+# CSV 컬럼 → 레코드 속성
+CSV_FIELDS = {
+    "고객번호": "cust_no",
+    "구분": "category",
+    "구분1": "category1",
+    "본부명": "bonbu",
+    "센터": "center",
+    "팀": "team",
+    "국사": "guksa",
+    # 선택 컬럼: 계약전력(kW), analysis의 contract_peak 알림 기준
+    "계약전력": "contract_power",
+}
+
+# 필터 파라미터 → 인덱스 속성
+FILTER_FIELDS = {
+    "custNo": "cust_no",
+    "bonbu": "bonbu",
+    "center": "center",
+    "team": "team",
+    "guksa": "guksa",
+}
+
+
+class CustomerRecord:
+    """고객 목록 CSV의 한 행. 값이 비어 있으면 None."""
+
+    __slots__ = ("position",) + tuple(CSV_FIELDS.values())
+
+    def __init__(self, position, **fields):
+        self.position = position
+        for name in CSV_FIELDS.values():
+            setattr(self, name, fields.get(name))
+
+    def __repr__(self):
+        return f"CustomerRecord({self.cust_no}, {self.team}, {self.guksa})"
+
+
+def _value(value):
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    return value
+
+
+class CustomerRegistry:
+    """CSV 고객 목록과 필드별 인덱스. 파일이 바뀌면 다음 조회 때 다시 읽습니다."""
+
+    def __init__(self, path=None):
+        self.path = path or get_settings().customer_csv
+        self._lock = threading.Lock()
+        self._mtime = None
+        # (레코드 튜플, {속성: {값: [위치, ...]}}) - 다시 읽을 때 한 번에 교체
+        self._snapshot = ((), {})
+
+    def _load(self):
+        """파일이 바뀌었으면 다시 읽고 현재 (레코드, 인덱스)를 반환합니다."""
+        mtime = os.stat(self.path).st_mtime_ns
+        if mtime == self._mtime:
+            return self._snapshot
+        with self._lock:
+            if mtime == self._mtime:
+                return self._snapshot
+            customer_data = pd.read_csv(self.path, dtype=str)
+            columns = [column for column in CSV_FIELDS if column in customer_data.columns]
+            records = []
+            for values in customer_data[columns].itertuples(index=False, name=None):
+                fields = {CSV_FIELDS[column]: _value(value) for column, value in zip(columns, values)}
+                if fields.get("cust_no"):
+                    records.append(CustomerRecord(len(records), **fields))
+
+            indexes = {field: {} for field in FILTER_FIELDS.values()}
+            for record in records:
+                for field, index in indexes.items():
+                    index.setdefault(getattr(record, field), []).append(record.position)
+
+            self._snapshot = (tuple(records), indexes)
+            self._mtime = mtime
+            return self._snapshot
+
+    def all(self):
+        """전체 고객 레코드를 CSV 순서대로 반환합니다."""
+        records, _ = self._load()
+        return list(records)
+
+    def get(self, cust_no):
+        """고객번호의 레코드를 반환합니다. 없으면 None."""
+        records, indexes = self._load()
+        positions = indexes["cust_no"].get(cust_no)
+        return records[positions[0]] if positions else None
+
+    def filter(self, custNo=None, bonbu=None, center=None, team=None, guksa=None):
+        """
+        조건에 맞는 고객 레코드를 CSV 순서대로 반환합니다. 조건이 없으면 전체.
+        각 조건은 쉼표로 여러 값을 줄 수 있으며(OR), 서로 다른 조건은 모두 만족해야 합니다(AND).
+        """
+        records, indexes = self._load()
+        conditions = {"custNo": custNo, "bonbu": bonbu, "center": center, "team": team, "guksa": guksa}
+        positions = None
+        for name, value in conditions.items():
+            if not value:
+                continue
+            index = indexes[FILTER_FIELDS[name]]
+            matched = set()
+            for part in str(value).split(","):
+                matched.update(index.get(part.strip(), ()))
+            positions = matched if positions is None else positions & matched
+        if positions is None:
+            return list(records)
+        return [records[position] for position in sorted(positions)]
+
+
+_registries = {}
+_registries_lock = threading.Lock()
+
+
+def get_registry(path=None):
+    """
+    path의 CustomerRegistry를 반환합니다 (경로별 최초 호출 시 생성).
+    path를 주지 않으면 conf.get_settings()의 customer_csv(settings.KEPCO["CUSTOMER_CSV"] / KEPCO_CUSTOMER_CSV)를 사용합니다.
+    """
+    path = path or get_settings().customer_csv
+    registry = _registries.get(path)
+    if registry is None:
+        with _registries_lock:
+            registry = _registries.setdefault(path, CustomerRegistry(path))
+    return registry
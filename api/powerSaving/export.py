@@ -0,0 +1,139 @@
+"""
+결과 DataFrame 내보내기 (returnType=xlsx, csv, parquet, arrow).
+
+openpyxl write-only 워크북으로 행을 순서대로 기록하고 표(Table) 스타일도 같은 단계에서 추가합니다.
+저장 후 다시 load_workbook으로 여는 과정이나 BytesIO.getvalue() 복사 없이
+임시 파일(작으면 메모리)에 저장한 뒤 FileResponse로 나누어 전송합니다.
+csv/parquet/arrow(IPC stream)는 분석 도구용 컬럼 형식으로 DataFrame에서 바로 만듭니다.
+parquet/arrow는 pyarrow가 필요합니다.
+"""
+import math
+import tempfile
+import warnings
+
+from django.http import FileResponse
+from openpyxl import Workbook
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.table import Table, TableStyleInfo
+
+XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+CSV_CONTENT_TYPE = "text/csv; charset=utf-8"
+PARQUET_CONTENT_TYPE = "application/vnd.apache.parquet"
+ARROW_CONTENT_TYPE = "application/vnd.apache.arrow.stream"
+
+# 이 크기를 넘으면 임시 파일을 디스크에 씀
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+TABLE_STYLE = "TableStyleMedium2"
+
+
+def _cell(value):
+    # NaN은 빈 셀로 기록 (openpyxl은 NaN을 그대로 쓰면 Excel에서 오류가 남)
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+def write_xlsx(df, target, table_name="DataTable", sheet_name="Sheet1", style=TABLE_STYLE):
+    """
+    df를 write-only 워크북으로 target(파일 경로 또는 file-like)에 저장합니다.
+    table_name이 있으면 전체 범위에 표 스타일을 적용합니다.
+    """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(sheet_name)
+
+    columns = [str(column) for column in df.columns]
+    if columns:
+        ws.append(columns)
+    for row in df.itertuples(index=False, name=None):
+        ws.append([_cell(value) for value in row])
+
+    if table_name and columns and len(df):
+        table = Table(displayName=table_name, ref=f"A1:{get_column_letter(len(columns))}{len(df) + 1}")
+        # write-only 모드에서는 헤더를 다시 읽을 수 없으므로 표 컬럼 이름을 직접 지정
+        table._initialise_columns()
+        for table_column, name in zip(table.tableColumns, columns):
+            table_column.name = name
+        table.tableStyleInfo = TableStyleInfo(
+            name=style,
+            showFirstColumn=False,
+            showLastColumn=False,
+            showRowStripes=True,
+            showColumnStripes=False,
+        )
+        with warnings.catch_warnings():
+            # 컬럼을 위에서 직접 지정했으므로 write-only 안내 경고는 무시
+            warnings.simplefilter("ignore", UserWarning)
+            ws.add_table(table)
+
+    wb.save(target)
+
+
+def _file_response(write, df, filename, content_type):
+    output = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    write(df, output)
+    output.seek(0)
+    return FileResponse(output, as_attachment=True, filename=filename, content_type=content_type)
+
+
+def xlsx_response(df, filename):
+    """df를 xlsx 파일로 만들어 다운로드 응답(FileResponse)으로 반환합니다."""
+    return _file_response(write_xlsx, df, filename, XLSX_CONTENT_TYPE)
+
+
+def _arrow_table(df):
+    """df를 pyarrow.Table로 변환합니다. 숫자와 문자열이 섞인 컬럼은 문자열 컬럼으로 변환합니다."""
+    import pyarrow as pa
+
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        df = df.copy()
+        for column in df.columns[df.dtypes == object]:
+            df[column] = df[column].map(lambda v: None if v is None or (isinstance(v, float) and math.isnan(v)) else str(v))
+        return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def write_csv(df, target):
+    df.to_csv(target, index=False, encoding="utf-8")
+
+
+def write_parquet(df, target):
+    import pyarrow.parquet as pq
+
+    pq.write_table(_arrow_table(df), target)
+
+
+def write_arrow(df, target):
+    import pyarrow as pa
+
+    table = _arrow_table(df)
+    with pa.ipc.new_stream(target, table.schema) as writer:
+        writer.write_table(table)
+
+
+def csv_response(df, filename):
+    return _file_response(write_csv, df, filename, CSV_CONTENT_TYPE)
+
+
+def parquet_response(df, filename):
+    return _file_response(write_parquet, df, filename, PARQUET_CONTENT_TYPE)
+
+
+def arrow_response(df, filename):
+    return _file_response(write_arrow, df, filename, ARROW_CONTENT_TYPE)
+
+
+# returnType → (응답 함수, 확장자)
+EXPORT_FORMATS = {
+    "xlsx": (xlsx_response, "xlsx"),
+    "csv": (csv_response, "csv"),
+    "parquet": (parquet_response, "parquet"),
+    "arrow": (arrow_response, "arrows"),
+}
+
+
+def export_response(df, returnType, basename):
+    """returnType(xlsx, csv, parquet, arrow)에 맞는 다운로드 응답을 반환합니다. 파일명: basename.확장자"""
+    response_func, extension = EXPORT_FORMATS[returnType]
+    return response_func(df, f"{basename}.{extension}")
@@ -0,0 +1,137 @@
+"""
+로컬 KEPCO OpenAPI 대역 서버 (부하 테스트/벤치마크용).
+
+getDayLpData.do / getMinuteLpData.do를 실제 API와 같은 JSON 형태로 응답합니다.
+사용량 값은 (custNo, date, meterNo)로 정해지는 의사 난수라 같은 요청에는 항상 같은 값을 반환합니다.
+
+    - latency: 응답 지연(초), jitter 비율만큼 무작위로 늘어남
+    - error_rate: 0~1, 이 비율로 500/503 응답
+    - meters: 고객당 계량기(레코드) 수 (응답 크기)
+
+GET /stats는 호출 수를, GET /reset은 호출 수 초기화를 반환합니다.
+fake_kepco 관리 명령으로 단독 실행하고 KEPCO_BASE_URL=http://127.0.0.1:<port>/OpenAPI 로 연결합니다.
+"""
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from .parsing import SLOT_TIMES
+
+DEFAULT_LATENCY = 0.05
+DEFAULT_JITTER = 0.5
+
+
+def day_lp_data(cust_no, date, meters=1):
+    """getDayLpData.do 응답(dict)을 만듭니다."""
+    records = []
+    for index in range(meters):
+        meter_no = f"M{cust_no[-6:]}{index:02d}"
+        rnd = random.Random(f"{cust_no}:{date}:{meter_no}")
+        record = {"custNo": cust_no, "meterNo": meter_no, "mr_ymd": date}
+        for hhmm in SLOT_TIMES:
+            record[f"pwr_qty{hhmm}"] = round(rnd.uniform(5, 120), 2)
+        records.append(record)
+    return {"dayLpDataInfoList": records}
+
+
+def minute_lp_data(cust_no, date_time, meters=1):
+    """getMinuteLpData.do 응답(dict)을 만듭니다."""
+    records = []
+    for index in range(meters):
+        meter_no = f"M{cust_no[-6:]}{index:02d}"
+        rnd = random.Random(f"{cust_no}:{date_time}:{meter_no}")
+        records.append({
+            "custNo": cust_no,
+            "meterNo": meter_no,
+            "mr_ymd": date_time[:8],
+            "mr_hhmi": date_time[8:],
+            "pwr_qty": round(rnd.uniform(5, 120), 2),
+        })
+    return {"minuteLpDataInfoList": records}
+
+
+class FakeKepcoServer(ThreadingHTTPServer):
+    """설정(latency, error_rate, meters)과 호출 수를 가진 대역 서버."""
+
+    daemon_threads = True
+
+    def __init__(self, address, latency=DEFAULT_LATENCY, jitter=DEFAULT_JITTER, error_rate=0.0, meters=1):
+        super().__init__(address, FakeKepcoHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.meters = meters
+        self.counts = {"requests": 0, "errors": 0}
+        self._lock = threading.Lock()
+        self._random = random.Random()
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/OpenAPI"
+
+    def count(self, name):
+        with self._lock:
+            self.counts[name] += 1
+
+    def roll_error(self):
+        with self._lock:
+            return self._random.random() < self.error_rate
+
+    def delay(self):
+        with self._lock:
+            return self.latency * (1 + self._random.random() * self.jitter)
+
+
+class FakeKepcoHandler(BaseHTTPRequestHandler):
+    # keep-alive (클라이언트 연결 풀 재사용)
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        server = self.server
+
+        if url.path == "/stats":
+            return self._send(200, dict(server.counts))
+        if url.path == "/reset":
+            with server._lock:
+                server.counts = {"requests": 0, "errors": 0}
+            return self._send(200, {"reset": True})
+
+        endpoint = url.path.rsplit("/", 1)[-1]
+        if endpoint not in ("getDayLpData.do", "getMinuteLpData.do") or "custNo" not in query:
+            return self._send(404, {"error": "not found"})
+
+        server.count("requests")
+        time.sleep(server.delay())
+        if server.roll_error():
+            server.count("errors")
+            return self._send(503 if server.counts["errors"] % 2 else 500, {"error": "fake error"})
+
+        if endpoint == "getDayLpData.do":
+            payload = day_lp_data(query["custNo"], query.get("date", ""), server.meters)
+        else:
+            payload = minute_lp_data(query["custNo"], query.get("dateTime", ""), server.meters)
+        return self._send(200, payload)
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start(host="127.0.0.1", port=0, **options):
+    """대역 서버를 백그라운드 스레드에서 시작하고 서버 객체를 반환합니다. port=0이면 빈 포트를 사용합니다."""
+    server = FakeKepcoServer((host, port), **options)
+    threading.Thread(target=server.serve_forever, name="fake-kepco", daemon=True).start()
+    return server
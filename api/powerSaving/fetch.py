@@ -0,0 +1,110 @@
+"""
+KEPCO OpenAPI 고객별 호출을 동시에 수행하는 공용 fetch 엔진.
+
+api.py의 엔드포인트와 kepco_daily_report.py가 함께 사용합니다.
+호출은 스레드 풀에서 동시에 실행되지만 결과는 입력 순서 그대로 반환되므로
+순차 루프와 동일한 행 순서가 유지됩니다.
+비동기 엔드포인트용으로 같은 의미의 gather_limited / afetch_iter를 제공합니다.
+전체 조회 시간은 metrics의 fetch 단계로 기록하며, 풀 스레드에서도 호출한 요청의 측정값에 기록되도록
+현재 contextvars를 넘겨 실행합니다.
+"""
+import asyncio
+import contextvars
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from .metrics import stage
+
+# 동시에 KEPCO로 보내는 최대 호출 수
+MAX_IN_FLIGHT = 8
+
+
+def _in_context(func):
+    """호출 시점의 contextvars로 func(item)을 실행하는 함수를 반환합니다 (스레드 풀용)."""
+    context = contextvars.copy_context()
+    return lambda item: context.copy().run(func, item)
+
+
+def fetch_iter(func, items, max_in_flight=None):
+    """
+    items의 각 항목에 대해 func(item)을 동시에 실행하고 결과를 items 순서대로 하나씩 yield 합니다.
+    실행 중이거나 소비되지 않은 결과는 최대 max_in_flight개만 유지하므로
+    items가 길어도(예: 긴 기간 스트리밍) 메모리 사용량이 일정합니다.
+    func에서 발생한 예외는 해당 결과를 꺼낼 때 호출자에게 그대로 전달됩니다.
+    """
+    limit = max_in_flight or MAX_IN_FLIGHT
+    items = iter(items)
+    if limit <= 1:
+        with stage("fetch"):
+            for item in items:
+                yield func(item)
+        return
+
+    pending = deque()
+    func = _in_context(func)
+    with stage("fetch"), ThreadPoolExecutor(max_workers=limit, thread_name_prefix="kepco-fetch") as executor:
+        try:
+            for item in items:
+                pending.append(executor.submit(func, item))
+                if len(pending) >= limit:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # 소비자가 중단한 경우(클라이언트 연결 종료 등) 대기 중인 호출 취소
+            for future in pending:
+                future.cancel()
+
+
+def fetch_all(func, items, max_in_flight=None):
+    """
+    items의 각 항목에 대해 func(item)을 동시에 실행하고 결과를 items 순서대로 리스트로 반환합니다.
+    max_in_flight: 동시 실행 상한(미입력시 MAX_IN_FLIGHT).
+    func에서 발생한 예외는 호출자에게 그대로 전달됩니다.
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    limit = max_in_flight or MAX_IN_FLIGHT
+    with stage("fetch"):
+        if limit <= 1 or len(items) == 1:
+            return [func(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=min(limit, len(items)), thread_name_prefix="kepco-fetch") as executor:
+            return list(executor.map(_in_context(func), items))
+
+
+async def gather_limited(func, items, max_in_flight=None):
+    """
+    fetch_all의 비동기 버전. 코루틴 함수 func(item)을 최대 max_in_flight개씩 동시에 실행하고
+    결과를 items 순서대로 리스트로 반환합니다.
+    """
+    semaphore = asyncio.Semaphore(max_in_flight or MAX_IN_FLIGHT)
+
+    async def run(item):
+        async with semaphore:
+            return await func(item)
+
+    with stage("fetch"):
+        return await asyncio.gather(*(run(item) for item in items))
+
+
+async def afetch_iter(func, items, max_in_flight=None):
+    """
+    fetch_iter의 비동기 버전. 코루틴 함수 func(item)을 최대 max_in_flight개씩 실행하며
+    결과를 items 순서대로 하나씩 yield 합니다.
+    """
+    limit = max_in_flight or MAX_IN_FLIGHT
+    pending = deque()
+    with stage("fetch"):
+        try:
+            for item in items:
+                pending.append(asyncio.ensure_future(func(item)))
+                if len(pending) >= limit:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
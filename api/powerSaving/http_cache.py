@@ -0,0 +1,77 @@
+"""
+powerSaving 응답의 HTTP 캐시 헤더(ETag, Cache-Control)와 조건부 요청(304) 처리.
+
+ETag는 결과 DataFrame 내용(컬럼, 값)과 returnType으로 만들므로 응답 파일을 만들기 전에 계산할 수 있고,
+If-None-Match가 일치하면 json/xlsx 등을 만들지 않고 바로 304를 반환합니다.
+xlsx는 파일 안에 생성 시각이 들어가 같은 내용이어도 바이트가 달라지므로 weak ETag(W/)를 사용합니다.
+
+Cache-Control (조회 날짜와 고객별 Status 기준)
+    - 모든 날짜가 확정(cache.ttl_for가 None)이고 모든 행이 ok: CLOSED_MAX_AGE
+    - 어제/오늘이 포함된 경우: 그 날짜의 응답 캐시 TTL과 같은 max-age
+    - 조회 실패/데이터 없음 행이 있으면: no-cache (매번 ETag로 재검증)
+"""
+import hashlib
+
+import pandas as pd
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+
+from .cache import ttl_for
+from .export import EXPORT_FORMATS
+from .metrics import observe_rows, stage
+
+# 확정된 날짜 응답의 max-age (고객 목록 변경을 반영할 수 있도록 영구(immutable)로 두지 않음)
+CLOSED_MAX_AGE = 7 * 24 * 60 * 60
+
+# 응답 형식이 바뀌면 올려서 기존 ETag를 무효화
+ETAG_VERSION = "1"
+
+# 파일 안에 생성 시각이 들어가는 형식 (weak ETag)
+WEAK_FORMATS = ("xlsx",)
+
+
+def frame_etag(df, returnType):
+    """df 내용과 returnType으로 ETag(따옴표 포함)를 만듭니다."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{ETAG_VERSION}:{returnType}:".encode())
+    digest.update("\x1f".join(str(column) for column in df.columns).encode())
+    if len(df):
+        digest.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    etag = f'"{digest.hexdigest()}"'
+    return f"W/{etag}" if returnType in WEAK_FORMATS else etag
+
+
+def cache_control(dates, df):
+    """조회 날짜(YYYYMMDD 목록)와 결과 df로 Cache-Control 값(dict)을 반환합니다."""
+    if df.empty or ("Status" in df and not (df["Status"] == "ok").all()):
+        return {"no_cache": True}
+    ttls = [ttl_for(date) for date in dates]
+    if all(ttl is None for ttl in ttls):
+        return {"public": True, "max_age": CLOSED_MAX_AGE}
+    return {"public": True, "max_age": min(ttl for ttl in ttls if ttl is not None)}
+
+
+def cached_render(request, df, dates, returnType, render):
+    """
+    render()로 만든 응답에 ETag/Cache-Control을 붙여 반환합니다.
+    요청의 If-None-Match가 ETag와 같으면 render()를 호출하지 않고 304를 반환합니다.
+    json, compact와 EXPORT_FORMATS 이외의 returnType(잘못된 값 등)은 render() 결과를 그대로 반환합니다.
+    """
+    if returnType not in ("json", "compact") and returnType not in EXPORT_FORMATS:
+        return render()
+
+    observe_rows(len(df))
+    headers = HttpResponse()
+    with stage("etag"):
+        headers["ETag"] = frame_etag(df, returnType)
+        patch_cache_control(headers, **cache_control(dates, df))
+    not_modified = get_conditional_response(request, etag=headers["ETag"], response=headers)
+    if not_modified is not headers:
+        return not_modified
+
+    with stage("serialize"):
+        response = render()
+    if response.status_code == 200:
+        response["ETag"] = headers["ETag"]
+        response["Cache-Control"] = headers["Cache-Control"]
+    return response
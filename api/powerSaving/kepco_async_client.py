@@ -0,0 +1,177 @@
+"""
+KEPCO OpenAPI 비동기 클라이언트 (httpx.AsyncClient).
+
+/powerSaving/async/* 엔드포인트에서 사용합니다. 연결 풀, 재시도/백오프, 타임아웃, 응답 캐시는
+kepco_client.KepcoClient와 같은 설정을 따르며(동시 조회 병합 포함) 결과도 같은 형태(dict, 오류 시 예외)로 반환합니다.
+httpx.AsyncClient는 이벤트 루프에 묶이므로 실행 중인 루프마다 하나씩 생성합니다
+(ASGI 서버에서는 프로세스당 하나, WSGI에서 async 뷰를 실행하면 요청마다 하나).
+"""
+import asyncio
+import threading
+import time
+import weakref
+
+import httpx
+import requests
+
+from .cache import get_cache
+from .conf import get_settings
+from .kepco_client import (
+    BACKOFF_FACTOR,
+    MAX_RETRIES,
+    POOL_SIZE,
+    REQUEST_TIMEOUT,
+    RETRY_STATUSES,
+    KepcoAPIError,
+    decode_json,
+)
+from .metrics import observe_upstream, upstream_error
+from .parsing import is_complete_day
+from .singleflight import AsyncSingleFlight, KeyLease
+from .throttle import THROTTLE_STATUSES, get_breaker, get_key_pool, retry_after_seconds
+
+# 비동기 클라이언트 호출에서 발생할 수 있는 통신/응답 오류 (깨진 JSON 본문은 KepcoDecodeError)
+FETCH_ERRORS = (requests.RequestException, httpx.HTTPError)
+
+
+class AsyncKepcoClient:
+    """httpx.AsyncClient로 KEPCO OpenAPI를 호출하는 비동기 클라이언트."""
+
+    def __init__(self, base_url=None, service_keys=None, pool_size=POOL_SIZE,
+                 max_retries=MAX_RETRIES, backoff_factor=BACKOFF_FACTOR, timeout=REQUEST_TIMEOUT,
+                 cache=None):
+        config = get_settings()
+        self.base_url = (base_url or config.base_url).rstrip("/")
+        self.service_keys = tuple(service_keys or config.service_keys)
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.cache = cache
+        self._flight = AsyncSingleFlight()
+        self.keys = get_key_pool(self.base_url, self.service_keys)
+        self.breaker = get_breaker(self.base_url)
+        self._leases = KeyLease(cache) if cache is not None else None
+
+        connect_timeout, read_timeout = timeout
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+        )
+
+    async def get(self, endpoint, params):
+        """
+        KEPCO OpenAPI endpoint를 호출하고 응답 JSON(dict)을 반환합니다.
+        연결 오류와 RETRY_STATUSES 응답은 지수 백오프(429/503은 Retry-After 이상)로 재시도하며,
+        최종적으로 200이 아니면 KepcoAPIError를, 200이지만 본문이 JSON이 아니면 KepcoDecodeError를 발생시킵니다.
+        매 시도는 호출 속도 제한을 따르고(토큰이 있는 서비스 키 사용), circuit이 열려 있으면
+        throttle.CircuitOpenError를 발생시킵니다.
+        호출 시간(첫 시도부터 재시도 포함)과 오류는 metrics에 기록합니다.
+        """
+        try:
+            self.breaker.before_call()
+        except requests.RequestException as e:
+            upstream_error(endpoint, type(e).__name__)
+            raise
+        url = f"{self.base_url}/{endpoint}"
+        started = time.perf_counter()
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            delay = self.backoff_factor * (2 ** attempt)
+            service_key = await self.keys.aacquire()
+            limiter = self.keys.limiters[service_key]
+            try:
+                response = await self.client.get(url, params=dict(params, serviceKey=service_key, returnType="02"))
+            except httpx.TransportError as e:
+                if last_attempt:
+                    observe_upstream(endpoint, time.perf_counter() - started, type(e).__name__)
+                    upstream_error(endpoint, type(e).__name__)
+                    self.breaker.record_failure()
+                    raise
+            else:
+                if response.status_code in THROTTLE_STATUSES:
+                    retry_after = retry_after_seconds(response.headers.get("Retry-After"))
+                    limiter.throttled(retry_after)
+                    delay = max(delay, retry_after or 0)
+                else:
+                    limiter.succeeded()
+                if response.status_code == 200:
+                    observe_upstream(endpoint, time.perf_counter() - started, response.status_code)
+                    data = decode_json(response, endpoint, self.breaker)
+                    self.breaker.record_success()
+                    return data
+                if response.status_code not in RETRY_STATUSES or last_attempt:
+                    observe_upstream(endpoint, time.perf_counter() - started, response.status_code)
+                    upstream_error(endpoint, response.status_code)
+                    if response.status_code in RETRY_STATUSES:
+                        self.breaker.record_failure()
+                    else:
+                        self.breaker.record_success()
+                    raise KepcoAPIError(response.status_code)
+            await asyncio.sleep(delay)
+
+    async def get_cached(self, endpoint, params, cust_no, date, list_key, use_cache=True, complete=None):
+        """
+        캐시를 먼저 조회하고, 없으면 KEPCO를 호출해 데이터가 있는 응답만 캐시에 저장합니다.
+        complete(응답 목록)가 True이면 더 바뀌지 않는 응답으로 보고 만료 없이(final) 저장합니다.
+        같은 (endpoint, custNo, date)의 동시 호출은 KEPCO 호출 하나를 공유합니다 (singleflight).
+        """
+        if use_cache and self.cache is not None:
+            data = await asyncio.to_thread(self.cache.get, endpoint, cust_no, date)
+            if data is not None:
+                return data
+
+        key = (endpoint, cust_no, str(date))
+        return await self._flight.do(
+            key + (use_cache,),
+            lambda: self._fetch(endpoint, params, key, list_key, use_cache, complete),
+        )
+
+    async def _fetch(self, endpoint, params, key, list_key, use_cache, complete):
+        if self.cache is None:
+            return await self.get(endpoint, params)
+
+        _, cust_no, date = key
+        # 다른 워커(동기 클라이언트 포함)가 같은 key를 조회 중이면 끝날 때까지 기다린 뒤 캐시에서 사용
+        check = (lambda: self.cache.get(endpoint, cust_no, date, False)) if use_cache else (lambda: None)
+        data, owner = await self._leases.aclaim(key, check)
+        if data is not None:
+            return data
+
+        try:
+            data = await self.get(endpoint, params)
+            if data.get(list_key):
+                final = complete is not None and complete(data[list_key])
+                await asyncio.to_thread(self.cache.set, endpoint, cust_no, date, data, final)
+        finally:
+            await self._leases.arelease(key, owner)
+        return data
+
+    async def get_day_lp_data(self, cust_no, date, use_cache=True):
+        """고객의 일 단위 15분 LP 데이터(getDayLpData.do)를 조회합니다. date: YYYYMMDD"""
+        return await self.get_cached(
+            "getDayLpData.do", {"custNo": cust_no, "date": date},
+            cust_no, date, "dayLpDataInfoList", use_cache=use_cache, complete=is_complete_day,
+        )
+
+    async def get_minute_lp_data(self, cust_no, date_time, use_cache=True):
+        """고객의 15분 LP 데이터(getMinuteLpData.do)를 조회합니다. date_time: YYYYMMDDHHMM"""
+        return await self.get_cached(
+            "getMinuteLpData.do", {"custNo": cust_no, "dateTime": date_time},
+            cust_no, date_time, "minuteLpDataInfoList", use_cache=use_cache,
+        )
+
+    async def aclose(self):
+        await self.client.aclose()
+
+
+_clients = weakref.WeakKeyDictionary()
+_clients_lock = threading.Lock()
+
+
+def get_async_client():
+    """실행 중인 이벤트 루프의 AsyncKepcoClient를 반환합니다 (루프별 최초 호출 시 생성)."""
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = _clients.get(loop)
+        if client is None:
+            client = _clients[loop] = AsyncKepcoClient(cache=get_cache())
+    return client
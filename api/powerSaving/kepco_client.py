@@ -0,0 +1,219 @@
+"""
+KEPCO OpenAPI(opm.kepco.co.kr) 클라이언트.
+
+프로세스 전체에서 하나의 requests.Session을 공유하여 TLS 연결을 재사용합니다.
+연결 풀 크기와 재시도/백오프 정책은 아래 상수로 조정합니다 (재시도도 시도마다 호출 속도 제한을 따름).
+OpenAPI 주소와 서비스 키는 conf.get_settings()(settings.KEPCO / KEPCO_* 환경 변수)에서 읽습니다.
+호출 속도 제한과 circuit breaker는 throttle 모듈을 참고하세요.
+api.py와 kepco_daily_report.py는 get_client()로 같은 클라이언트를 사용합니다.
+조회 결과는 cache.ResponseCache에 저장되어 같은 (custNo, date) 재조회 시 KEPCO를 호출하지 않고,
+동시에 들어온 같은 조회는 singleflight로 합쳐 KEPCO를 한 번만 호출합니다 (gunicorn 워커 간 포함).
+
+예) https://opm.kepco.co.kr:11080/OpenAPI/getDayLpData.do?custNo=0135338560&date=20241001&serviceKey=...&returnType=02
+"""
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .cache import get_cache
+from .conf import get_settings
+from .metrics import observe_upstream, upstream_error
+from .parsing import is_complete_day
+from .singleflight import KeyLease, SingleFlight
+from .throttle import THROTTLE_STATUSES, get_breaker, get_key_pool, retry_after_seconds
+
+# 호스트당 유지하는 keep-alive 연결 수 (fetch.MAX_IN_FLIGHT 이상으로 유지)
+POOL_SIZE = 16
+
+# 연결 오류/일시적 오류 응답에 대한 재시도 정책
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.5  # 0.5s, 1s, 2s ...
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# 호출별 타임아웃 (connect, read) 초
+REQUEST_TIMEOUT = (5, 30)
+
+
+class KepcoAPIError(requests.HTTPError):
+    """KEPCO OpenAPI가 200 이외의 상태 코드를 반환한 경우. str()은 상태 코드입니다."""
+
+    def __init__(self, status_code, response=None):
+        super().__init__(str(status_code), response=response)
+        self.status_code = status_code
+
+
+class KepcoDecodeError(KepcoAPIError):
+    """KEPCO OpenAPI가 200 응답에 JSON이 아닌 본문을 반환한 경우."""
+
+    def __init__(self, status_code, response=None):
+        super().__init__(status_code, response=response)
+        self.args = (f"invalid JSON response (status {status_code})",)
+
+
+def decode_json(response, endpoint, breaker):
+    """
+    응답 본문을 JSON(dict)으로 변환합니다. 본문이 깨져 있으면 오류 지표와 circuit breaker 실패로 기록하고
+    KepcoDecodeError(RequestException)를 발생시켜 다른 조회 오류처럼 고객별로 처리되게 합니다.
+    """
+    try:
+        return response.json()
+    except ValueError as e:
+        upstream_error(endpoint, "invalid_json")
+        breaker.record_failure()
+        raise KepcoDecodeError(response.status_code) from e
+
+
+class KepcoClient:
+    """
+    풀링된 Session으로 KEPCO OpenAPI를 호출하는 클라이언트.
+    base_url, service_keys를 주지 않으면 conf.get_settings() 값을 사용합니다.
+    """
+
+    def __init__(self, base_url=None, service_keys=None, pool_size=POOL_SIZE,
+                 max_retries=MAX_RETRIES, backoff_factor=BACKOFF_FACTOR, timeout=REQUEST_TIMEOUT,
+                 cache=None):
+        config = get_settings()
+        self.base_url = (base_url or config.base_url).rstrip("/")
+        self.service_keys = tuple(service_keys or config.service_keys)
+        self.timeout = timeout
+        self.cache = cache
+        self._flight = SingleFlight()
+        self.keys = get_key_pool(self.base_url, self.service_keys)
+        self.breaker = get_breaker(self.base_url)
+        self._leases = KeyLease(cache) if cache is not None else None
+
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        # 재시도는 get()에서 직접 수행 (매 시도가 호출 속도 제한 토큰을 사용하도록 urllib3 재시도는 끔)
+        retry = Retry(total=0, raise_on_status=False)
+        # pool_block=True: 풀이 가득 차면 연결을 새로 만들지 않고 반납을 기다림
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry, pool_block=True)
+
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def get(self, endpoint, params):
+        """
+        KEPCO OpenAPI endpoint를 호출하고 응답 JSON(dict)을 반환합니다.
+        연결 오류와 RETRY_STATUSES 응답은 지수 백오프(429/503은 Retry-After 이상)로 재시도하며,
+        최종적으로 200이 아니면 KepcoAPIError를, 200이지만 본문이 JSON이 아니면 KepcoDecodeError를 발생시킵니다.
+        통신 오류는 requests.RequestException을 발생시킵니다.
+        매 시도는 호출 속도 제한을 따르고(토큰이 있는 서비스 키를 돌아가며 사용), circuit이 열려 있으면
+        호출하지 않고 throttle.CircuitOpenError(RequestException)를 발생시킵니다.
+        호출 시간(첫 시도부터 재시도 포함)과 오류는 metrics에 기록합니다. (AsyncKepcoClient.get과 같은 정책)
+        """
+        try:
+            self.breaker.before_call()
+        except requests.RequestException as e:
+            upstream_error(endpoint, type(e).__name__)
+            raise
+        url = f"{self.base_url}/{endpoint}"
+        started = time.perf_counter()
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            delay = self.backoff_factor * (2 ** attempt)
+            service_key = self.keys.acquire()
+            limiter = self.keys.limiters[service_key]
+            try:
+                response = self.session.get(url, params=dict(params, serviceKey=service_key, returnType="02"), timeout=self.timeout)
+            except requests.RequestException as e:
+                # 연결 오류/타임아웃만 재시도
+                if last_attempt or not isinstance(e, (requests.ConnectionError, requests.Timeout)):
+                    observe_upstream(endpoint, time.perf_counter() - started, type(e).__name__)
+                    upstream_error(endpoint, type(e).__name__)
+                    self.breaker.record_failure()
+                    raise
+            else:
+                if response.status_code in THROTTLE_STATUSES:
+                    retry_after = retry_after_seconds(response.headers.get("Retry-After"))
+                    limiter.throttled(retry_after)
+                    delay = max(delay, retry_after or 0)
+                else:
+                    limiter.succeeded()
+                if response.status_code == 200:
+                    observe_upstream(endpoint, time.perf_counter() - started, response.status_code)
+                    data = decode_json(response, endpoint, self.breaker)
+                    self.breaker.record_success()
+                    return data
+                if response.status_code not in RETRY_STATUSES or last_attempt:
+                    observe_upstream(endpoint, time.perf_counter() - started, response.status_code)
+                    upstream_error(endpoint, response.status_code)
+                    if response.status_code in RETRY_STATUSES:
+                        self.breaker.record_failure()
+                    else:
+                        self.breaker.record_success()
+                    raise KepcoAPIError(response.status_code, response=response)
+            time.sleep(delay)
+
+    def get_cached(self, endpoint, params, cust_no, date, list_key, use_cache=True, complete=None):
+        """
+        캐시를 먼저 조회하고, 없으면 KEPCO를 호출해 데이터가 있는 응답만 캐시에 저장합니다.
+        complete(응답 목록)가 True이면 더 바뀌지 않는 응답으로 보고 만료 없이(final) 저장합니다.
+        같은 (endpoint, custNo, date)의 동시 호출은 KEPCO 호출 하나를 공유합니다 (singleflight).
+        """
+        if use_cache and self.cache is not None:
+            data = self.cache.get(endpoint, cust_no, date)
+            if data is not None:
+                return data
+
+        key = (endpoint, cust_no, str(date))
+        return self._flight.do(
+            key + (use_cache,),
+            lambda: self._fetch(endpoint, params, key, list_key, use_cache, complete),
+        )
+
+    def _fetch(self, endpoint, params, key, list_key, use_cache, complete):
+        if self.cache is None:
+            return self.get(endpoint, params)
+
+        _, cust_no, date = key
+        # 다른 워커가 같은 key를 조회 중이면 끝날 때까지 기다린 뒤 그 결과를 캐시에서 사용
+        check = (lambda: self.cache.get(endpoint, cust_no, date, count_miss=False)) if use_cache else (lambda: None)
+        data, owner = self._leases.claim(key, check)
+        if data is not None:
+            return data
+
+        try:
+            data = self.get(endpoint, params)
+            # 빈 응답은 아직 게시되지 않은 데이터일 수 있으므로 저장하지 않음
+            if data.get(list_key):
+                final = complete is not None and complete(data[list_key])
+                self.cache.set(endpoint, cust_no, date, data, final=final)
+        finally:
+            self._leases.release(key, owner)
+        return data
+
+    def get_day_lp_data(self, cust_no, date, use_cache=True):
+        """고객의 일 단위 15분 LP 데이터(getDayLpData.do)를 조회합니다. date: YYYYMMDD"""
+        return self.get_cached(
+            "getDayLpData.do", {"custNo": cust_no, "date": date},
+            cust_no, date, "dayLpDataInfoList", use_cache=use_cache, complete=is_complete_day,
+        )
+
+    def get_minute_lp_data(self, cust_no, date_time, use_cache=True):
+        """고객의 15분 LP 데이터(getMinuteLpData.do)를 조회합니다. date_time: YYYYMMDDHHMM"""
+        return self.get_cached(
+            "getMinuteLpData.do", {"custNo": cust_no, "dateTime": date_time},
+            cust_no, date_time, "minuteLpDataInfoList", use_cache=use_cache,
+        )
+
+    def close(self):
+        self.session.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """프로세스 전역 KepcoClient를 반환합니다 (최초 호출 시 생성)."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = KepcoClient(cache=get_cache())
+    return _client
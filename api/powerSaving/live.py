@@ -0,0 +1,488 @@
+"""
+실시간 15분 사용량 폴러와 메모리 구독 창 (async/liveData, async/liveStream, liveStatus 엔드포인트).
+
+LivePoller는 백그라운드 스레드에서 POLL_INTERVAL초마다 고객별로 마지막으로 수집한 15분 구간 이후의
+구간만 getMinuteLpData.do로 조회해 LiveWindow(최근 WINDOW_HOURS시간)에 추가합니다.
+kepco15minData처럼 매번 전체 고객을 다시 조회하지 않으며, 아직 게시되지 않은(빈) 구간은
+EMPTY_RETRY초 뒤에 다시 조회하고 GIVE_UP_AFTER가 지나도 비어 있으면 건너뜁니다.
+
+한 회차에 새로 수집한 행은 하나의 seq(증가하는 번호)로 묶여 창에 추가되고, 구독자는
+    - long-poll: async/liveData?since=<마지막으로 받은 seq> (새 행이 생길 때까지 기다렸다가 반환)
+    - Server-Sent Events: async/liveStream (Last-Event-ID로 이어받기)
+로 받습니다.
+
+폴러는 live 엔드포인트가 처음 호출될 때 워커 프로세스마다 시작됩니다(get_poller).
+워커 간에는 응답 캐시 파일의 leader 임대(kepco_lease)를 가진 폴러 하나만 KEPCO를 조회하고, 수집한 행을
+같은 파일의 kepco_live 테이블(LiveFeed)에 seq와 함께 기록합니다. 모든 워커의 폴러는 FEED_POLL초마다
+이 테이블에서 새 행을 읽어 자기 창에 같은 seq로 추가하므로 since와 Last-Event-ID는 어느 워커에 연결해도 같은
+위치를 가리킵니다. leader 워커가 멈추면 LEADER_TTL초 뒤 다른 워커의 폴러가 이어받습니다.
+seq는 줄어들지 않으며, 캐시 파일을 지운 경우에만 처음부터 다시 시작합니다(클라이언트는 since 없이 다시 연결).
+새 행은 leader가 feed에 기록한 뒤 listeners(예: analysis.LiveDemandCheck, 계약전력 초과 알림)에도 전달합니다.
+"""
+import asyncio
+import itertools
+import json
+import sqlite3
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+
+import requests
+from django.http import StreamingHttpResponse
+
+from .customers import get_registry
+from .fetch import fetch_all
+from .kepco_client import get_client
+
+# 15분 구간
+SLOT = timedelta(minutes=15)
+
+# 폴링 회차 간격(초)
+POLL_INTERVAL = 60
+# 폴러를 처음 시작할 때 가져오는 최근 구간 수
+INITIAL_SLOTS = 4
+# 고객 한 명당 한 회차에 조회하는 최대 구간 수 (밀린 구간은 다음 회차에 이어서 조회)
+MAX_CATCHUP = 8
+# 빈 응답(아직 게시되지 않은 구간)을 다시 조회하기까지의 시간(초)
+EMPTY_RETRY = 120
+# 이 시간이 지나도 비어 있는 구간은 건너뜀
+GIVE_UP_AFTER = timedelta(hours=2)
+
+# 메모리에 유지하는 구간(시간)과 최대 행 수
+WINDOW_HOURS = 24
+MAX_RECORDS = 200_000
+
+# 워커 간 leader 임대 키와 만료 시간(초; leader가 멈추면 이 시간 뒤 다른 워커가 이어받음)
+LEADER_KEY = ("live", "poller", "")
+LEADER_TTL = 10 * POLL_INTERVAL
+# 다른 워커의 leader가 기록한 새 행을 읽는 간격(초)
+FEED_POLL = 2
+
+# long-poll 기본/최대 대기 시간(초)
+LONG_POLL_TIMEOUT = 25
+MAX_LONG_POLL = 60
+# SSE keepalive 간격, 연결 유지 시간(초; 이후 클라이언트가 Last-Event-ID로 다시 연결), 재연결 대기(ms)
+SSE_HEARTBEAT = 15
+SSE_DURATION = 30 * 60
+SSE_RETRY_MS = 5000
+SSE_CONTENT_TYPE = "text/event-stream; charset=utf-8"
+
+# feed에 저장하는 구간 종료 시각 형식 (문자열 비교 = 시각 비교)
+SLOT_FORMAT = "%Y-%m-%d %H:%M"
+
+_FEED_SCHEMA = """
+CREATE TABLE IF NOT EXISTS kepco_live_batch (
+    seq         INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at  REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS kepco_live (
+    seq         INTEGER NOT NULL,
+    cust_no     TEXT NOT NULL,
+    slot_end    TEXT NOT NULL,
+    record      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS kepco_live_seq ON kepco_live (seq);
+"""
+
+
+def last_slot(now):
+    """now 시점에 끝난 마지막 15분 구간의 종료 시각."""
+    return now.replace(minute=now.minute - now.minute % 15, second=0, microsecond=0)
+
+
+def date_time_param(slot_end):
+    """구간 종료 시각을 getMinuteLpData.do의 dateTime(YYYYMMDDHHMM)으로 변환합니다. 자정은 전날 2400."""
+    if slot_end.hour == 0 and slot_end.minute == 0:
+        return (slot_end - timedelta(days=1)).strftime("%Y%m%d") + "2400"
+    return slot_end.strftime("%Y%m%d%H%M")
+
+
+def slot_records(row, data):
+    """고객 1건의 getMinuteLpData 응답을 kepco15minData와 같은 형태의 레코드(dict) 목록으로 변환합니다."""
+    records = []
+    for record in data.get("minuteLpDataInfoList", []):
+        value = record.get("pwr_qty")
+        if not isinstance(value, (int, float)):
+            continue
+        mr_ymd = str(record.get("mr_ymd") or "")
+        records.append({
+            "Customer Number": row.cust_no,
+            "MeterNo": record.get("meterNo"),
+            "Date": f"{mr_ymd[:4]}-{mr_ymd[4:6]}-{mr_ymd[6:]}",
+            "Time": record.get("mr_hhmi"),
+            "Bonbu": row.bonbu,
+            "Center": row.center,
+            "Team": row.team,
+            "Guksa": row.guksa,
+            "Power Usage": value,
+            "Status": "ok",
+        })
+    return records
+
+
+class LiveFeed:
+    """
+    leader 폴러가 수집한 레코드를 워커 간에 공유하는 테이블 (응답 캐시 파일에 저장).
+    seq는 AUTOINCREMENT로 발급하므로 오래된 행을 지워도 같은 번호가 다시 나오지 않습니다.
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        self._local = threading.local()
+        self._connect().executescript(_FEED_SCHEMA)
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def append(self, items, cutoff):
+        """[(구간 종료 시각, 레코드)]를 새 seq로 저장하고 seq를 반환합니다. cutoff 이전 구간은 삭제합니다."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            seq = conn.execute("INSERT INTO kepco_live_batch (created_at) VALUES (?)", (time.time(),)).lastrowid
+            conn.executemany(
+                "INSERT INTO kepco_live (seq, cust_no, slot_end, record) VALUES (?, ?, ?, ?)",
+                [
+                    (seq, record["Customer Number"], slot_end.strftime(SLOT_FORMAT), json.dumps(record, ensure_ascii=False))
+                    for slot_end, record in items
+                ],
+            )
+            conn.execute("DELETE FROM kepco_live WHERE slot_end < ?", (cutoff.strftime(SLOT_FORMAT),))
+            conn.execute("DELETE FROM kepco_live_batch WHERE seq < ? AND seq NOT IN (SELECT seq FROM kepco_live)", (seq,))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return seq
+
+    def read(self, after=0):
+        """seq가 after보다 큰 행을 [(seq, 구간 종료 시각, 레코드)]로 저장 순서대로 반환합니다."""
+        rows = self._connect().execute(
+            "SELECT seq, slot_end, record FROM kepco_live WHERE seq > ? ORDER BY seq, rowid", (after,),
+        )
+        return [(seq, datetime.strptime(slot_end, SLOT_FORMAT), json.loads(record)) for seq, slot_end, record in rows]
+
+    def latest_slots(self):
+        """고객번호 → feed에 저장된 마지막 구간 종료 시각."""
+        rows = self._connect().execute("SELECT cust_no, MAX(slot_end) FROM kepco_live GROUP BY cust_no")
+        return {cust_no: datetime.strptime(slot_end, SLOT_FORMAT) for cust_no, slot_end in rows}
+
+
+class LiveWindow:
+    """
+    최근 구간의 레코드를 수집 순서(seq)대로 보관하는 창.
+    publish()가 새 seq를 만들면 await_seq()로 기다리던 구독자를 깨웁니다.
+    """
+
+    def __init__(self, hours=WINDOW_HOURS, max_records=MAX_RECORDS):
+        self.span = timedelta(hours=hours)
+        self.max_records = max_records
+        self.seq = 0
+        # (seq, 구간 종료 시각, 레코드)
+        self._items = deque()
+        # 창에서 밀려난 가장 큰 seq (이보다 오래된 since는 일부 행을 놓친 것)
+        self._evicted_seq = 0
+        self._lock = threading.Lock()
+        # 비동기 구독자: (이벤트 루프, asyncio.Event)
+        self._async_waiters = set()
+
+    def __len__(self):
+        return len(self._items)
+
+    def publish(self, items, now=None, seq=None):
+        """
+        [(구간 종료 시각, 레코드)]를 새 seq로 추가하고 seq를 반환합니다.
+        seq: LiveFeed에서 읽은 행의 seq (없으면 현재 seq + 1)
+        """
+        cutoff = (now or datetime.now()) - self.span
+        with self._lock:
+            if seq is None:
+                seq = self.seq + 1
+            elif self.seq == 0:
+                # 워커가 처음 읽은 feed 행보다 앞선 seq는 이 창에 없음
+                self._evicted_seq = seq - 1
+            self.seq = seq
+            self._items.extend((self.seq, slot_end, record) for slot_end, record in items)
+            while self._items and (self._items[0][1] < cutoff or len(self._items) > self.max_records):
+                self._evicted_seq = max(self._evicted_seq, self._items.popleft()[0])
+            waiters = list(self._async_waiters)
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # 이미 종료된 이벤트 루프
+                pass
+        return self.seq
+
+    def since(self, since=0, cust_nos=None):
+        """
+        seq가 since보다 큰 레코드를 (다음 since, 레코드 목록, truncated)로 반환합니다.
+        cust_nos(집합)를 주면 해당 고객만. truncated는 since 이후 행 일부가 이미 창에서 밀려난 경우입니다.
+        since가 현재 seq보다 크면(다른 워커에서 받은 seq를 이 워커가 아직 feed에서 읽지 않음) 빈 목록과 since를 그대로 반환합니다.
+        """
+        with self._lock:
+            if since > self.seq:
+                return since, [], False
+            truncated = 0 < since < self._evicted_seq
+            records = []
+            # 최근 항목부터 since까지 거꾸로 읽음
+            for seq, _, record in reversed(self._items):
+                if seq <= since:
+                    break
+                if cust_nos is None or record["Customer Number"] in cust_nos:
+                    records.append(record)
+            records.reverse()
+            return self.seq, records, truncated
+
+    async def await_seq(self, since, timeout):
+        """seq가 since보다 커질 때까지 최대 timeout초 기다립니다 (스레드를 점유하지 않음)."""
+        event = asyncio.Event()
+        waiter = (asyncio.get_running_loop(), event)
+        with self._lock:
+            if self.seq > since:
+                return True
+            self._async_waiters.add(waiter)
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with self._lock:
+                self._async_waiters.discard(waiter)
+
+    async def acollect(self, since, cust_nos=None, timeout=0):
+        """
+        since 이후 cust_nos의 새 레코드가 생길 때까지 최대 timeout초 기다린 뒤 since()와 같은 값을 반환합니다.
+        다른 고객의 행만 추가된 경우에는 계속 기다립니다.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            seq, records, truncated = self.since(since, cust_nos)
+            remaining = deadline - time.monotonic()
+            if records or truncated or remaining <= 0:
+                return seq, records, truncated
+            await self.await_seq(seq, remaining)
+            since = seq
+
+
+class LivePoller(threading.Thread):
+    """
+    고객별 마지막 수집 구간을 기억하고 새 구간만 조회해 LiveWindow에 추가하는 백그라운드 스레드.
+    워커 간 leader 임대를 가진 폴러만 KEPCO를 조회해 LiveFeed에 기록하고, 나머지는 feed를 읽기만 합니다.
+    클라이언트에 응답 캐시가 없으면 feed 없이 이 워커의 창에만 추가합니다.
+    """
+
+    def __init__(self, client=None, registry=None, window=None, interval=POLL_INTERVAL, feed=None):
+        super().__init__(name="kepco-live-poller", daemon=True)
+        self.client = client or get_client()
+        self.registry = registry or get_registry()
+        self.window = window or LiveWindow()
+        self.interval = interval
+        self.cache = self.client.cache
+        if feed is None and self.cache is not None:
+            feed = LiveFeed(self.cache.path)
+        self.feed = feed
+        # leader 임대 owner (leader가 아니면 None)
+        self._lease = None
+        # 고객번호 → 마지막으로 수집한(또는 건너뛴) 구간 종료 시각
+        self.latest = {}
+        # 고객번호 → 빈 응답 후 다시 조회할 시각
+        self.retry_at = {}
+        # 고객번호 → 마지막 조회 오류
+        self.errors = {}
+        self.last_poll = None
+        # 새 행 [(구간 종료 시각, 레코드)]을 받는 함수 목록
+        self.listeners = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        next_poll = 0
+        while not self._stop_event.is_set():
+            try:
+                if self.is_leader() and time.monotonic() >= next_poll:
+                    next_poll = time.monotonic() + self.interval
+                    self.poll_once()
+                else:
+                    self.sync()
+            except Exception as e:
+                print(str(e))
+            self._stop_event.wait(FEED_POLL if self.feed is not None else self.interval)
+        if self._lease is not None:
+            self.cache.release_lease(*LEADER_KEY, self._lease)
+            self._lease = None
+
+    def stop(self):
+        self._stop_event.set()
+
+    def is_leader(self):
+        """
+        워커 간 leader 임대를 연장하거나 새로 얻습니다. feed가 없으면 항상 True.
+        새로 leader가 되면 이전 leader가 feed에 기록한 구간부터 이어서 조회합니다.
+        """
+        if self.feed is None:
+            return True
+        if self._lease is not None and self.cache.renew_lease(*LEADER_KEY, self._lease, LEADER_TTL):
+            return True
+        self._lease = self.cache.acquire_lease(*LEADER_KEY, ttl=LEADER_TTL)
+        if self._lease is None:
+            return False
+        latest = self.feed.latest_slots()
+        with self._lock:
+            self.latest = latest
+            self.retry_at = {}
+        return True
+
+    def sync(self, now=None):
+        """feed에서 창에 아직 없는 행을 seq별로 읽어 추가합니다. 추가한 행 수를 반환합니다."""
+        if self.feed is None:
+            return 0
+        rows = self.feed.read(self.window.seq)
+        for seq, group in itertools.groupby(rows, key=lambda row: row[0]):
+            self.window.publish([(slot_end, record) for _, slot_end, record in group], now, seq=seq)
+        return len(rows)
+
+    def poll_once(self, now=None):
+        """한 회차: 조회할 구간이 있는 고객만 조회하고 새 레코드를 창에 추가합니다. 추가한 레코드 수를 반환합니다."""
+        now = now or datetime.now()
+        due = last_slot(now)
+        oldest = due - self.window.span
+        if not self.is_leader():
+            # 다른 워커가 leader: feed에서 읽기만 함
+            self.sync(now)
+            return 0
+        with self._lock:
+            tasks = []
+            for row in self.registry.all():
+                latest = max(self.latest.get(row.cust_no) or due - INITIAL_SLOTS * SLOT, oldest)
+                if latest < due and self.retry_at.get(row.cust_no, now) <= now:
+                    tasks.append((row, latest))
+
+        results = fetch_all(lambda task: self._poll_customer(*task, due, now), tasks)
+
+        items = []
+        with self._lock:
+            for cust_no, latest, records, retry_at, error in results:
+                self.latest[cust_no] = latest
+                if retry_at:
+                    self.retry_at[cust_no] = retry_at
+                else:
+                    self.retry_at.pop(cust_no, None)
+                if error:
+                    self.errors[cust_no] = error
+                else:
+                    self.errors.pop(cust_no, None)
+                items.extend(records)
+            self.last_poll = now
+        if items:
+            if self.feed is None:
+                self.window.publish(items, now)
+            elif self.is_leader():
+                self.feed.append(items, now - self.window.span)
+                self.sync(now)
+            else:
+                # 조회하는 동안 임대가 만료되어 다른 워커가 leader가 됨: 그 워커가 feed 기준으로 다시 조회
+                return 0
+            for listener in self.listeners:
+                try:
+                    listener(items)
+                except Exception as e:
+                    print(str(e))
+        return len(items)
+
+    def _poll_customer(self, row, latest, due, now):
+        """고객 한 명의 latest 이후 구간을 순서대로 조회합니다. (고객번호, 새 latest, [(구간, 레코드)], 재조회 시각, 오류)"""
+        items = []
+        slot = latest + SLOT
+        for _ in range(MAX_CATCHUP):
+            if slot > due:
+                break
+            try:
+                data = self.client.get_minute_lp_data(row.cust_no, date_time_param(slot))
+            except requests.RequestException as e:
+                print(f"API Error for Customer Number {row.cust_no}: {str(e)}")
+                return row.cust_no, latest, items, None, str(e)
+            records = slot_records(row, data)
+            if not records and now - slot < GIVE_UP_AFTER:
+                # 아직 게시되지 않은 구간: 나중에 같은 구간부터 다시 조회
+                return row.cust_no, latest, items, now + timedelta(seconds=EMPTY_RETRY), None
+            items.extend((slot, record) for record in records)
+            latest = slot
+            slot += SLOT
+        return row.cust_no, latest, items, None, None
+
+    def status(self):
+        """폴러 상태 (liveStatus)."""
+        with self._lock:
+            return {
+                "running": self.is_alive(),
+                "leader": self.feed is None or self._lease is not None,
+                "lastPoll": self.last_poll.strftime("%Y-%m-%d %H:%M:%S") if self.last_poll else None,
+                "seq": self.window.seq,
+                "records": len(self.window),
+                "latest": {cust_no: date_time_param(slot) for cust_no, slot in self.latest.items()},
+                "errors": dict(self.errors),
+            }
+
+
+def _event(seq, records, truncated):
+    data = json.dumps({"seq": seq, "truncated": truncated, "data": records}, ensure_ascii=False)
+    return f"id: {seq}\nevent: interval\ndata: {data}\n\n"
+
+
+async def asse_events(window, since=0, cust_nos=None, duration=SSE_DURATION):
+    """since 이후의 레코드와 이후 새로 수집되는 레코드를 SSE 이벤트 문자열로 생성합니다."""
+    yield f"retry: {SSE_RETRY_MS}\n\n"
+    deadline = time.monotonic() + duration
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        seq, records, truncated = await window.acollect(since, cust_nos, min(SSE_HEARTBEAT, remaining))
+        yield _event(seq, records, truncated) if records or truncated else ": keepalive\n\n"
+        since = seq
+
+
+def sse_response(events):
+    """SSE 이벤트(iterable 또는 async iterable)를 StreamingHttpResponse로 반환합니다 (압축/프록시 버퍼링 없음)."""
+    response = StreamingHttpResponse(events, content_type=SSE_CONTENT_TYPE)
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+def last_event_id(request, since=None):
+    """SSE 재연결 시 브라우저가 보내는 Last-Event-ID(없으면 since, 둘 다 없으면 0)."""
+    value = request.headers.get("Last-Event-ID")
+    try:
+        return int(value) if value else (since or 0)
+    except ValueError:
+        return since or 0
+
+
+_poller = None
+_poller_lock = threading.Lock()
+
+
+def get_poller():
+    """프로세스 전역 LivePoller를 반환합니다 (최초 호출 시 시작)."""
+    global _poller
+    if _poller is None:
+        with _poller_lock:
+            if _poller is None:
+                # 분석(analysis)은 모델을 사용하므로 여기서 import
+                from .analysis import LiveDemandCheck
+
+                poller = LivePoller()
+                poller.listeners.append(LiveDemandCheck())
+                poller.start()
+                _poller = poller
+    return _poller
@@ -0,0 +1,36 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from powerSaving.analysis import update_analysis
+from powerSaving.models import LoadProfile
+
+
+class Command(BaseCommand):
+    help = (
+        "저장된 LoadProfile로 고객 x 날짜 분석 지표(DayStat)와 알림(Alert)을 다시 계산합니다. "
+        "--start/--end가 없으면 저장된 모든 날짜를 계산합니다. (ingest_lp는 저장한 날짜의 분석을 자동으로 갱신합니다) "
+        "계약전력 초과(contract_peak) 알림은 고객 목록 CSV에 계약전력(kW) 컬럼이 있어야 만들어집니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--start", help="시작일 YYYYMMDD")
+        parser.add_argument("--end", help="마지막 날짜 YYYYMMDD")
+
+    def handle(self, *args, **options):
+        days = LoadProfile.objects.all()
+        try:
+            if options["start"]:
+                days = days.filter(date__gte=datetime.strptime(options["start"], "%Y%m%d").date())
+            if options["end"]:
+                days = days.filter(date__lte=datetime.strptime(options["end"], "%Y%m%d").date())
+        except ValueError as e:
+            raise CommandError(f"날짜 형식 오류(YYYYMMDD): {e}")
+
+        dates = list(days.values_list("date", flat=True).distinct())
+        if not dates:
+            self.stdout.write("저장된 데이터가 없습니다.")
+            return
+
+        saved = update_analysis(dates, log=self.stdout.write)
+        self.stdout.write(self.style.SUCCESS(f"완료: {len(dates)}일, 일 지표 {saved}행 저장"))
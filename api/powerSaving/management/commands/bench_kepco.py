@@ -0,0 +1,57 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from powerSaving import bench, fake_kepco
+
+
+class Command(BaseCommand):
+    help = (
+        "로컬 KEPCO 대역 서버로 powerSaving 엔드포인트와 kepco_daily_report.py의 "
+        "end-to-end 시간, 처리량, 최대 메모리를 고객 수별로 측정합니다. "
+        "기본 호출 제한(초당 20회)이 큰 고객 수에서 시간을 좌우하므로 --max-rate로 조정할 수 있습니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", default=",".join(map(str, bench.DEFAULT_SIZES)), help="고객 수 목록 (쉼표 구분)")
+        parser.add_argument("--cases", default=",".join(bench.CASES), help="실행할 케이스 (쉼표 구분)")
+        parser.add_argument("--range-days", type=int, default=2, help="range/aggregate 조회 일수 (기본값: 2)")
+        parser.add_argument("--latency", type=float, default=fake_kepco.DEFAULT_LATENCY, help="대역 서버 응답 지연(초)")
+        parser.add_argument("--error-rate", type=float, default=0.0, help="대역 서버 500/503 응답 비율 (0~1)")
+        parser.add_argument("--meters", type=int, default=1, help="고객당 계량기(레코드) 수")
+        parser.add_argument("--max-rate", type=float, default=None, help="KEPCO 초당 호출 제한 (기본값: throttle.MAX_RATE)")
+        parser.add_argument("--workers", type=int, default=None, help="동시 KEPCO 호출 수")
+        parser.add_argument("--output", help="결과를 저장할 JSON 파일")
+        # 내부용: 케이스 하나를 현재 프로세스에서 실행
+        parser.add_argument("--case", help="케이스 JSON 파일 (bench_kepco가 자식 프로세스에 전달)")
+
+    def handle(self, *args, **options):
+        if options["case"]:
+            case = json.loads(Path(options["case"]).read_text())
+            result = bench.run_case(case)
+            Path(case["result_path"]).write_text(json.dumps(result))
+            return
+
+        try:
+            sizes = [int(size) for size in options["sizes"].split(",")]
+        except ValueError as e:
+            raise CommandError(f"--sizes 형식 오류: {e}")
+        names = [name.strip() for name in options["cases"].split(",") if name.strip()]
+        unknown = [name for name in names if name not in bench.CASES]
+        if unknown:
+            raise CommandError(f"알 수 없는 케이스: {', '.join(unknown)} (가능: {', '.join(bench.CASES)})")
+
+        results = bench.run_benchmark(
+            sizes=sizes,
+            names=names,
+            range_days=options["range_days"],
+            latency=options["latency"],
+            error_rate=options["error_rate"],
+            meters=options["meters"],
+            max_rate=options["max_rate"],
+            workers=options["workers"],
+            log=self.stdout.write,
+        )
+        if options["output"]:
+            Path(options["output"]).write_text(json.dumps(results, ensure_ascii=False, indent=2))
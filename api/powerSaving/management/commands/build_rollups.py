@@ -0,0 +1,35 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from powerSaving.models import LoadProfile
+from powerSaving.rollups import update_rollups
+
+
+class Command(BaseCommand):
+    help = (
+        "저장된 LoadProfile로 hour/day/month 롤업(Rollup)을 다시 계산합니다. "
+        "--start/--end가 없으면 저장된 모든 날짜를 계산합니다. (ingest_lp는 저장한 날짜의 롤업을 자동으로 갱신합니다)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--start", help="시작일 YYYYMMDD")
+        parser.add_argument("--end", help="마지막 날짜 YYYYMMDD")
+
+    def handle(self, *args, **options):
+        days = LoadProfile.objects.all()
+        try:
+            if options["start"]:
+                days = days.filter(date__gte=datetime.strptime(options["start"], "%Y%m%d").date())
+            if options["end"]:
+                days = days.filter(date__lte=datetime.strptime(options["end"], "%Y%m%d").date())
+        except ValueError as e:
+            raise CommandError(f"날짜 형식 오류(YYYYMMDD): {e}")
+
+        dates = list(days.values_list("date", flat=True).distinct())
+        if not dates:
+            self.stdout.write("저장된 데이터가 없습니다.")
+            return
+
+        saved = update_rollups(dates, log=self.stdout.write)
+        self.stdout.write(self.style.SUCCESS(f"완료: {len(dates)}일, 롤업 {saved}행 저장"))
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from powerSaving import fake_kepco
+
+
+class Command(BaseCommand):
+    help = (
+        "로컬 KEPCO OpenAPI 대역 서버를 실행합니다 (getDayLpData.do, getMinuteLpData.do). "
+        "API 서버는 KEPCO_BASE_URL=http://<host>:<port>/OpenAPI 환경 변수로 연결합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8900)
+        parser.add_argument("--latency", type=float, default=fake_kepco.DEFAULT_LATENCY, help="응답 지연(초)")
+        parser.add_argument("--jitter", type=float, default=fake_kepco.DEFAULT_JITTER, help="지연에 더하는 무작위 비율 (0.5: 최대 1.5배)")
+        parser.add_argument("--error-rate", type=float, default=0.0, help="500/503 응답 비율 (0~1)")
+        parser.add_argument("--meters", type=int, default=1, help="고객당 계량기(레코드) 수")
+
+    def handle(self, *args, **options):
+        server = fake_kepco.FakeKepcoServer(
+            (options["host"], options["port"]),
+            latency=options["latency"],
+            jitter=options["jitter"],
+            error_rate=options["error_rate"],
+            meters=options["meters"],
+        )
+        self.stdout.write(f"KEPCO 대역 서버: {server.base_url} (Ctrl+C로 종료)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
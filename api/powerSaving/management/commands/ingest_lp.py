@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from powerSaving import store
+
+
+class Command(BaseCommand):
+    help = (
+        "KEPCO getDayLpData.do 15분 데이터를 LoadProfile 테이블에 저장합니다. "
+        "--start/--end를 주면 해당 기간을 backfill 하고, 없으면 고객별 마지막 저장일 이후부터 어제까지 증분 저장합니다. "
+        "증분 저장은 일부 구간만 저장된 날짜도 다시 조회합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--start", help="backfill 시작일 YYYYMMDD")
+        parser.add_argument("--end", help="마지막 날짜 YYYYMMDD (기본값: 어제)")
+        parser.add_argument("--days", type=int, default=30, help="저장된 데이터가 없는 고객의 초기 backfill 일수 (기본값: 30)")
+        parser.add_argument("--workers", type=int, default=None, help="동시 KEPCO 호출 수")
+        parser.add_argument("--csv", default=None, help="고객 목록 CSV 경로 (기본값: settings.KEPCO[\"CUSTOMER_CSV\"])")
+
+    def handle(self, *args, **options):
+        try:
+            end = datetime.strptime(options["end"], "%Y%m%d").date() if options["end"] else datetime.today().date() - timedelta(days=1)
+            start = datetime.strptime(options["start"], "%Y%m%d").date() if options["start"] else None
+        except ValueError as e:
+            raise CommandError(f"날짜 형식 오류(YYYYMMDD): {e}")
+
+        customers = store.sync_customers(options["csv"])
+        self.stdout.write(f"고객 {len(customers)}건 동기화")
+
+        tasks = []
+        if start is not None:
+            # backfill: 모든 고객에 대해 start~end
+            starts = {cust_no: start for cust_no in customers}
+        else:
+            # 증분: 마지막 저장일 다음 날부터(없으면 최근 --days 일), 일부 구간만 저장된 날짜는 다시 조회
+            last = store.last_ingested_dates()
+            default_start = end - timedelta(days=options["days"] - 1)
+            starts = {cust_no: last[cust_no] + timedelta(days=1) if cust_no in last else default_start for cust_no in customers}
+            tasks = [
+                (customers[cust_no], day.strftime("%Y%m%d"))
+                for cust_no, day in store.incomplete_days()
+                if cust_no in customers and day < starts[cust_no]
+            ]
+
+        for cust_no, customer in customers.items():
+            day = starts[cust_no]
+            while day <= end:
+                tasks.append((customer, day.strftime("%Y%m%d")))
+                day += timedelta(days=1)
+
+        if not tasks:
+            self.stdout.write("저장할 데이터가 없습니다.")
+            return
+
+        self.stdout.write(f"{len(tasks)}건 (고객 x 날짜) 조회 시작")
+        saved, failed = store.ingest(tasks, max_in_flight=options["workers"], log=self.stdout.write)
+
+        for customer, date, error in failed:
+            self.stderr.write(f"실패: {customer.cust_no} {date}: {error}")
+        self.stdout.write(self.style.SUCCESS(f"완료: {saved}행 저장, 실패 {len(failed)}건"))
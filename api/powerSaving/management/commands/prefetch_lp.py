@@ -0,0 +1,49 @@
+import time
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from powerSaving import prefetch
+
+
+class Command(BaseCommand):
+    help = (
+        "어제(또는 --date)의 getDayLpData.do 응답을 전체 고객에 대해 미리 가져와 캐시에 저장합니다. "
+        "데이터가 없거나 일부 구간이 비어 있는 고객은 --interval 초 간격으로 다시 조회합니다. "
+        "--daemon을 주면 종료하지 않고 매 회차 어제 날짜를 다시 계산해 계속 실행합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--date", help="조회 날짜 YYYYMMDD (기본값: 어제)")
+        parser.add_argument("--daemon", action="store_true", help="종료하지 않고 --interval 간격으로 계속 실행")
+        parser.add_argument("--interval", type=int, default=600, help="회차 간격(초) (기본값: 600)")
+        parser.add_argument("--retries", type=int, default=6, help="1회 실행 시 gap이 남은 고객의 재조회 횟수 (기본값: 6)")
+        parser.add_argument("--workers", type=int, default=None, help="동시 KEPCO 호출 수")
+
+    def handle(self, *args, **options):
+        if options["date"]:
+            try:
+                datetime.strptime(options["date"], "%Y%m%d")
+            except ValueError as e:
+                raise CommandError(f"날짜 형식 오류(YYYYMMDD): {e}")
+            if options["daemon"]:
+                raise CommandError("--daemon은 --date와 함께 사용할 수 없습니다.")
+
+        attempt = 0
+        while True:
+            date = options["date"] or prefetch.yesterday()
+            fetched, gaps = prefetch.prefetch_day(date, max_in_flight=options["workers"])
+            self.stdout.write(
+                f"{datetime.now():%Y-%m-%d %H:%M:%S} {date}: {fetched}건 조회, 미완료 {len(gaps)}건"
+            )
+            for cust_no, error in gaps.items():
+                self.stderr.write(f"미완료: {cust_no} {date}: {error}")
+
+            if not options["daemon"]:
+                if not gaps:
+                    self.stdout.write(self.style.SUCCESS(f"완료: {date} 전체 고객 캐시 저장"))
+                    return
+                attempt += 1
+                if attempt > options["retries"]:
+                    raise CommandError(f"{date}: 미완료 {len(gaps)}건 (재시도 {options['retries']}회 초과)")
+            time.sleep(options["interval"])
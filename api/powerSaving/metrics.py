@@ -0,0 +1,312 @@
+"""
+powerSaving 처리 지표(Prometheus text format, GET /metrics)와 요청별 Server-Timing 헤더.
+
+지표는 프로세스(gunicorn 워커)마다 따로 집계되며 /metrics는 그 요청을 받은 워커의 값을 반환합니다.
+
+    kepco_upstream_seconds{endpoint, status}        KEPCO 호출 시간 (재시도 포함, 최종 상태 코드 또는 예외 이름)
+    kepco_upstream_errors_total{endpoint, reason}   KEPCO 호출 오류 (상태 코드 또는 예외 이름)
+    kepco_cache_lookups_total{result}               응답 캐시 조회 (hits, misses, expired)
+    kepco_cache_hit_ratio                           응답 캐시 적중률
+    powersaving_stage_seconds{view, stage}          단계별 처리 시간
+    powersaving_request_seconds{view, status}       요청 전체 처리 시간
+    powersaving_rows{view}                          응답 행 수
+
+단계(stage)
+    store      로컬 저장소(LoadProfile) 조회
+    fetch      고객별 KEPCO 조회 전체 (동시 호출의 wall time, 레코드 변환 포함)
+    frame      결과 DataFrame 생성
+    aggregate  그룹/시간 단위 집계
+    analysis   일 분석 지표/알림 계산 (ingest_lp, analyze_lp)
+    etag       ETag 계산
+    serialize  json/compact/xlsx/csv 등 응답 생성
+    compress   응답 압축
+Server-Timing에는 단계별 시간과 함께 kepco(요청 중 KEPCO 호출 시간의 합, 호출 수)와 total을 넣습니다.
+ndjson 스트리밍은 헤더를 보낸 뒤 조회가 진행되므로 단계 시간은 지표에만 반영됩니다.
+"""
+import bisect
+import contextvars
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+from django.http import HttpResponse
+from django.utils.deprecation import MiddlewareMixin
+
+# 요청 단위 측정 대상 경로
+METRICS_PATH_PREFIX = "/ninja-api/powerSaving/"
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+ROW_BUCKETS = (0, 10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+# 요청 밖(관리 명령, kepco_daily_report.py)에서 측정한 값의 view 라벨
+NO_VIEW = "none"
+
+REGISTRY = []
+
+
+def _format(value):
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names, values):
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+class Metric:
+    """라벨 값 조합별로 값을 보관하는 지표. 생성 시 REGISTRY에 등록됩니다."""
+
+    type = "untyped"
+
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def _items(self):
+        with self._lock:
+            return sorted((key, self._copy(value)) for key, value in self._values.items())
+
+    def _copy(self, value):
+        return value
+
+    def lines(self):
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} {self.type}"
+        for key, value in self._items():
+            yield from self._samples(key, value)
+
+    def _samples(self, key, value):
+        yield f"{self.name}{_labels(self.labelnames, key)} {_format(value)}"
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(self, name, help, labels=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        # 마지막 칸은 가장 큰 버킷보다 큰 값
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.get(key) or ([0] * (len(self.buckets) + 1), 0.0)
+            counts[index] += 1
+            self._values[key] = (counts, total + value)
+
+    def _copy(self, value):
+        counts, total = value
+        return list(counts), total
+
+    def _samples(self, key, value):
+        counts, total = value
+        names = self.labelnames + ("le",)
+        cumulative = 0
+        for bound, count in zip(self.buckets + (math.inf,), counts):
+            cumulative += count
+            yield f"{self.name}_bucket{_labels(names, key + (_format(bound),))} {cumulative}"
+        yield f"{self.name}_sum{_labels(self.labelnames, key)} {_format(round(total, 6))}"
+        yield f"{self.name}_count{_labels(self.labelnames, key)} {cumulative}"
+
+
+class CallbackMetric(Metric):
+    """/metrics를 만들 때 callback()이 반환하는 {라벨 값 튜플: 값}을 내보내는 지표."""
+
+    def __init__(self, name, help, labels=(), type="gauge", callback=None):
+        super().__init__(name, help, labels)
+        self.type = type
+        self.callback = callback
+
+    def _items(self):
+        return sorted(self.callback().items())
+
+
+def _cache_counters():
+    from .cache import get_cache
+
+    return dict(get_cache().counters)
+
+
+def _cache_lookups():
+    counters = _cache_counters()
+    return {(result,): counters[result] for result in ("hits", "misses", "expired")}
+
+
+def _cache_hit_ratio():
+    counters = _cache_counters()
+    lookups = counters["hits"] + counters["misses"]
+    return {(): counters["hits"] / lookups if lookups else 0.0}
+
+
+UPSTREAM_SECONDS = Histogram("kepco_upstream_seconds", "KEPCO OpenAPI call latency", ("endpoint", "status"))
+UPSTREAM_ERRORS = Counter("kepco_upstream_errors_total", "KEPCO OpenAPI call errors", ("endpoint", "reason"))
+CACHE_LOOKUPS = CallbackMetric(
+    "kepco_cache_lookups_total", "KEPCO response cache lookups", ("result",), "counter", _cache_lookups
+)
+CACHE_HIT_RATIO = CallbackMetric("kepco_cache_hit_ratio", "KEPCO response cache hit ratio", callback=_cache_hit_ratio)
+STAGE_SECONDS = Histogram("powersaving_stage_seconds", "Processing time per pipeline stage", ("view", "stage"))
+REQUEST_SECONDS = Histogram("powersaving_request_seconds", "Request processing time", ("view", "status"))
+ROWS = Histogram("powersaving_rows", "Rows produced per response", ("view",), buckets=ROW_BUCKETS)
+
+
+class RequestTiming:
+    """한 요청의 단계별 누적 시간과 KEPCO 호출 시간/횟수 (Server-Timing 헤더)."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.view = NO_VIEW
+        self.stages = {}
+        self.upstream_seconds = 0.0
+        self.upstream_calls = 0
+        # 고객별 조회 스레드에서도 기록하므로 잠금
+        self._lock = threading.Lock()
+
+    def add_stage(self, name, seconds):
+        with self._lock:
+            self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def add_upstream(self, seconds):
+        with self._lock:
+            self.upstream_seconds += seconds
+            self.upstream_calls += 1
+
+    def server_timing(self, total):
+        with self._lock:
+            entries = [f"{name};dur={seconds * 1000:.1f}" for name, seconds in self.stages.items()]
+            if self.upstream_calls:
+                entries.append(f'kepco;dur={self.upstream_seconds * 1000:.1f};desc="{self.upstream_calls} calls"')
+        entries.append(f"total;dur={total * 1000:.1f}")
+        return ", ".join(entries)
+
+
+_timing = contextvars.ContextVar("powersaving_request_timing", default=None)
+
+
+def current_view():
+    """현재 요청의 view 이름 (요청 밖이면 NO_VIEW)."""
+    timing = _timing.get()
+    return timing.view if timing is not None else NO_VIEW
+
+
+@contextmanager
+def stage(name):
+    """with 블록의 실행 시간을 name 단계로 기록합니다 (지표와 현재 요청의 Server-Timing)."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        timing = _timing.get()
+        STAGE_SECONDS.observe(elapsed, view=current_view(), stage=name)
+        if timing is not None:
+            timing.add_stage(name, elapsed)
+
+
+def observe_upstream(endpoint, seconds, status):
+    """KEPCO 호출 한 건의 시간과 결과(상태 코드 또는 예외 이름)를 기록합니다."""
+    UPSTREAM_SECONDS.observe(seconds, endpoint=endpoint, status=status)
+    timing = _timing.get()
+    if timing is not None:
+        timing.add_upstream(seconds)
+
+
+def upstream_error(endpoint, reason):
+    UPSTREAM_ERRORS.inc(endpoint=endpoint, reason=reason)
+
+
+def observe_rows(count):
+    ROWS.observe(count, view=current_view())
+
+
+def counted(records, view=None):
+    """
+    ndjson으로 보내는 records(레코드 dict 또는 dict 목록 iterable)를 그대로 넘기면서
+    끝났을 때 전체 행 수를 기록합니다.
+    """
+    view = view or current_view()
+    rows = 0
+    try:
+        for record in records:
+            rows += len(record) if isinstance(record, list) else 1
+            yield record
+    finally:
+        ROWS.observe(rows, view=view)
+
+
+async def acounted(records, view=None):
+    """counted()의 비동기 버전."""
+    view = view or current_view()
+    rows = 0
+    try:
+        async for record in records:
+            rows += len(record) if isinstance(record, list) else 1
+            yield record
+    finally:
+        ROWS.observe(rows, view=view)
+
+
+def render():
+    """REGISTRY의 모든 지표를 Prometheus text format 문자열로 반환합니다."""
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.lines())
+    return "\n".join(lines) + "\n"
+
+
+def metrics_view(request):
+    """GET /metrics (현재 워커의 지표)."""
+    return HttpResponse(render(), content_type=CONTENT_TYPE)
+
+
+class MetricsMiddleware(MiddlewareMixin):
+    """METRICS_PATH_PREFIX 아래 요청의 처리 시간을 기록하고 Server-Timing 헤더를 붙입니다."""
+
+    def process_request(self, request):
+        if not request.path.startswith(METRICS_PATH_PREFIX):
+            return
+        request.timing = RequestTiming()
+        # 스트리밍 응답은 반환 뒤에도 조회가 이어지므로 reset하지 않음 (다음 요청이 다시 설정)
+        _timing.set(request.timing)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        timing = getattr(request, "timing", None)
+        if timing is not None and request.resolver_match is not None:
+            timing.view = request.resolver_match.url_name or request.resolver_match.route
+
+    def process_response(self, request, response):
+        timing = getattr(request, "timing", None)
+        if timing is None:
+            return response
+        total = time.perf_counter() - timing.started
+        REQUEST_SECONDS.observe(total, view=timing.view, status=response.status_code)
+        response.headers["Server-Timing"] = timing.server_timing(total)
+        return response
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.1 on 2026-10-17 11:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Customer',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('cust_no', models.CharField(max_length=20, unique=True, verbose_name='고객번호')),
+                ('category', models.CharField(blank=True, max_length=50, verbose_name='구분')),
+                ('category1', models.CharField(blank=True, max_length=50, verbose_name='구분1')),
+                ('bonbu', models.CharField(blank=True, max_length=100, verbose_name='본부명')),
+                ('center', models.CharField(blank=True, max_length=100, verbose_name='센터')),
+                ('team', models.CharField(blank=True, max_length=100, verbose_name='팀')),
+                ('guksa', models.CharField(blank=True, max_length=100, verbose_name='국사')),
+            ],
+            options={
+                'ordering': ['id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='LoadProfile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('meter_no', models.CharField(blank=True, max_length=30, verbose_name='계기번호')),
+                ('date', models.DateField()),
+                ('time', models.CharField(max_length=4)),
+                ('timestamp', models.DateTimeField()),
+                ('power_usage', models.FloatField(null=True)),
+                ('customer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='load_profiles', to='powerSaving.customer')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['customer', 'timestamp'], name='load_profile_cust_ts'), models.Index(fields=['customer', 'date'], name='load_profile_cust_date')],
+                'constraints': [models.UniqueConstraint(fields=('customer', 'meter_no', 'timestamp'), name='uniq_load_profile_interval')],
+            },
+        ),
+    ]
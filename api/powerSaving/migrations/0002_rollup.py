@@ -0,0 +1,37 @@
+# Generated by Django 5.2.1 on 2026-10-17 11:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('powerSaving', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Rollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('granularity', models.CharField(choices=[('hour', 'hour'), ('day', 'day'), ('month', 'month')], max_length=8)),
+                ('level', models.CharField(max_length=16)),
+                ('bonbu', models.CharField(blank=True, max_length=100, verbose_name='본부명')),
+                ('center', models.CharField(blank=True, max_length=100, verbose_name='센터')),
+                ('team', models.CharField(blank=True, max_length=100, verbose_name='팀')),
+                ('guksa', models.CharField(blank=True, max_length=100, verbose_name='국사')),
+                ('cust_no', models.CharField(blank=True, max_length=20, verbose_name='고객번호')),
+                ('period', models.CharField(max_length=16)),
+                ('start_date', models.DateField()),
+                ('customers', models.IntegerField()),
+                ('intervals', models.IntegerField()),
+                ('power_sum', models.FloatField()),
+                ('power_peak', models.FloatField()),
+                ('peak_time', models.CharField(max_length=16)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['granularity', 'level', 'start_date'], name='rollup_level_date')],
+                'constraints': [models.UniqueConstraint(fields=('granularity', 'level', 'bonbu', 'center', 'team', 'guksa', 'cust_no', 'period'), name='uniq_rollup_group_period')],
+            },
+        ),
+    ]
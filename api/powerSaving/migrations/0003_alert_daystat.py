@@ -0,0 +1,60 @@
+# Generated by Django 5.2.1 on 2026-10-17 12:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('powerSaving', '0002_rollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Alert',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(max_length=32)),
+                ('severity', models.CharField(choices=[('warning', 'warning'), ('critical', 'critical')], max_length=8)),
+                ('source', models.CharField(choices=[('daily', 'daily'), ('live', 'live')], max_length=8)),
+                ('level', models.CharField(max_length=16)),
+                ('bonbu', models.CharField(blank=True, max_length=100, verbose_name='본부명')),
+                ('center', models.CharField(blank=True, max_length=100, verbose_name='센터')),
+                ('team', models.CharField(blank=True, max_length=100, verbose_name='팀')),
+                ('guksa', models.CharField(blank=True, max_length=100, verbose_name='국사')),
+                ('cust_no', models.CharField(blank=True, max_length=20, verbose_name='고객번호')),
+                ('period', models.CharField(max_length=16)),
+                ('date', models.DateField()),
+                ('value', models.FloatField()),
+                ('threshold', models.FloatField()),
+                ('message', models.CharField(max_length=200)),
+                ('raised_at', models.DateTimeField()),
+            ],
+            options={
+                'indexes': [models.Index(fields=['date', 'kind'], name='alert_date_kind')],
+                'constraints': [models.UniqueConstraint(fields=('kind', 'level', 'bonbu', 'center', 'team', 'guksa', 'cust_no', 'period'), name='uniq_alert_group_period')],
+            },
+        ),
+        migrations.CreateModel(
+            name='DayStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('intervals', models.IntegerField()),
+                ('power_sum', models.FloatField()),
+                ('power_peak', models.FloatField()),
+                ('peak_time', models.CharField(max_length=16)),
+                ('load_factor', models.FloatField(null=True)),
+                ('baseline_sum', models.FloatField(null=True)),
+                ('sum_score', models.FloatField(null=True)),
+                ('baseline_peak', models.FloatField(null=True)),
+                ('peak_score', models.FloatField(null=True)),
+                ('customer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='day_stats', to='powerSaving.customer')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['date'], name='day_stat_date')],
+                'constraints': [models.UniqueConstraint(fields=('customer', 'date'), name='uniq_day_stat_customer_date')],
+            },
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.1 on 2026-10-17 12:44
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q
+from django.utils import timezone
+
+# 하루 96개 15분 구간 (0015 ~ 2400)
+SLOT_TIMES = [f"{m // 60:02d}{m % 60:02d}" for m in range(15, 24 * 60 + 1, 15)]
+
+
+def backfill_stored_days(apps, schema_editor):
+    """이미 저장된 고객 x 날짜의 complete를 저장된 구간 값으로 계산합니다 (계기마다 96개 구간 값이 모두 있으면 complete)."""
+    LoadProfile = apps.get_model("powerSaving", "LoadProfile")
+    StoredDay = apps.get_model("powerSaving", "StoredDay")
+    rows = (
+        LoadProfile.objects
+        .values("customer_id", "date")
+        .annotate(
+            meters=Count("meter_no", distinct=True),
+            values=Count("id", filter=Q(power_usage__isnull=False, time__in=SLOT_TIMES)),
+        )
+    )
+    now = timezone.now()
+    StoredDay.objects.bulk_create(
+        [
+            StoredDay(customer_id=row["customer_id"], date=row["date"], complete=row["values"] == len(SLOT_TIMES) * row["meters"], ingested_at=now)
+            for row in rows.iterator()
+        ],
+        batch_size=5000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('powerSaving', '0003_alert_daystat'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StoredDay',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('complete', models.BooleanField(default=False)),
+                ('ingested_at', models.DateTimeField()),
+                ('customer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stored_days', to='powerSaving.customer')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['date', 'complete'], name='stored_day_date_complete')],
+                'constraints': [models.UniqueConstraint(fields=('customer', 'date'), name='uniq_stored_day_customer_date')],
+            },
+        ),
+        migrations.RunPython(backfill_stored_days, migrations.RunPython.noop),
+    ]
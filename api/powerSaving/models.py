@@ -1,3 +1,175 @@
 from django.db import models
 
 # Create your models here.
+
+
+class Customer(models.Model):
+    """kepcolist_gg.csv의 고객(국사) 정보."""
+    cust_no = models.CharField("고객번호", max_length=20, unique=True)
+    category = models.CharField("구분", max_length=50, blank=True)
+    category1 = models.CharField("구분1", max_length=50, blank=True)
+    bonbu = models.CharField("본부명", max_length=100, blank=True)
+    center = models.CharField("센터", max_length=100, blank=True)
+    team = models.CharField("팀", max_length=100, blank=True)
+    guksa = models.CharField("국사", max_length=100, blank=True)
+
+    class Meta:
+        ordering = ["id"]
+
+    def __str__(self):
+        return f"{self.cust_no} {self.guksa}"
+
+
+class LoadProfile(models.Model):
+    """
+    getDayLpData.do의 15분 간격 전력 사용량.
+    date/time은 KEPCO 원본 값(YYYY-MM-DD, pwr_qtyHHMM의 HHMM)이며,
+    timestamp는 해당 구간의 종료 시각입니다 (2400 → 다음 날 00:00).
+    """
+    customer = models.ForeignKey(Customer, on_delete=models.CASCADE, related_name="load_profiles")
+    meter_no = models.CharField("계기번호", max_length=30, blank=True)
+    date = models.DateField()
+    time = models.CharField(max_length=4)
+    timestamp = models.DateTimeField()
+    power_usage = models.FloatField(null=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["customer", "meter_no", "timestamp"], name="uniq_load_profile_interval"),
+        ]
+        indexes = [
+            models.Index(fields=["customer", "timestamp"], name="load_profile_cust_ts"),
+            models.Index(fields=["customer", "date"], name="load_profile_cust_date"),
+        ]
+
+    def __str__(self):
+        return f"{self.customer_id} {self.timestamp} {self.power_usage}"
+
+
+class StoredDay(models.Model):
+    """
+    LoadProfile에 저장된 고객 x 날짜. complete는 저장 시점에 하루 96개 구간이 모두 게시되어 있었는지
+    (parsing.is_complete_day)이며, 엔드포인트와 기간 조회 계획은 complete인 날짜만 저장소에서 읽습니다.
+    """
+    customer = models.ForeignKey(Customer, on_delete=models.CASCADE, related_name="stored_days")
+    date = models.DateField()
+    complete = models.BooleanField(default=False)
+    ingested_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["customer", "date"], name="uniq_stored_day_customer_date"),
+        ]
+        indexes = [
+            models.Index(fields=["date", "complete"], name="stored_day_date_complete"),
+        ]
+
+    def __str__(self):
+        return f"{self.customer_id} {self.date} {self.complete}"
+
+
+class Rollup(models.Model):
+    """
+    LoadProfile 집계(롤업). 시간 단위(granularity)와 조직 계층(level)별 합계/피크를 미리 계산해 둡니다.
+    level에 포함되지 않는 계층 컬럼은 빈 문자열이며, period는 구간 시작(/powerSaving/aggregate의 Period 형식)입니다.
+    ingest_lp가 날짜를 저장할 때마다 해당 날짜의 hour/day 롤업과 그 달의 month 롤업을 다시 계산합니다.
+    """
+    GRANULARITY_CHOICES = [("hour", "hour"), ("day", "day"), ("month", "month")]
+
+    granularity = models.CharField(max_length=8, choices=GRANULARITY_CHOICES)
+    level = models.CharField(max_length=16)
+    bonbu = models.CharField("본부명", max_length=100, blank=True)
+    center = models.CharField("센터", max_length=100, blank=True)
+    team = models.CharField("팀", max_length=100, blank=True)
+    guksa = models.CharField("국사", max_length=100, blank=True)
+    cust_no = models.CharField("고객번호", max_length=20, blank=True)
+    period = models.CharField(max_length=16)
+    start_date = models.DateField()
+    customers = models.IntegerField()
+    intervals = models.IntegerField()
+    power_sum = models.FloatField()
+    power_peak = models.FloatField()
+    peak_time = models.CharField(max_length=16)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["granularity", "level", "bonbu", "center", "team", "guksa", "cust_no", "period"],
+                name="uniq_rollup_group_period",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["granularity", "level", "start_date"], name="rollup_level_date"),
+        ]
+
+    def __str__(self):
+        return f"{self.granularity} {self.level} {self.period} {self.power_sum}"
+
+
+class DayStat(models.Model):
+    """
+    고객 x 날짜 분석 지표 (analysis.update_analysis).
+    power_peak는 15분 최대 사용량(kWh)이며 최대수요전력(kW)은 power_peak x 4입니다.
+    baseline_*은 직전 날짜들의 중앙값, *_score는 기준선 대비 강건 z-score이며 이력이 부족하면 null입니다.
+    """
+    customer = models.ForeignKey(Customer, on_delete=models.CASCADE, related_name="day_stats")
+    date = models.DateField()
+    intervals = models.IntegerField()
+    power_sum = models.FloatField()
+    power_peak = models.FloatField()
+    peak_time = models.CharField(max_length=16)
+    load_factor = models.FloatField(null=True)
+    baseline_sum = models.FloatField(null=True)
+    sum_score = models.FloatField(null=True)
+    baseline_peak = models.FloatField(null=True)
+    peak_score = models.FloatField(null=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["customer", "date"], name="uniq_day_stat_customer_date"),
+        ]
+        indexes = [
+            models.Index(fields=["date"], name="day_stat_date"),
+        ]
+
+    def __str__(self):
+        return f"{self.customer_id} {self.date} {self.power_sum}"
+
+
+class Alert(models.Model):
+    """
+    임계치 알림 (analysis). level(guksa, customer)에 포함되지 않는 계층 컬럼은 빈 문자열입니다.
+    period는 일 분석이면 날짜(YYYY-MM-DD), 실시간 폴러이면 15분 구간 종료 시각(YYYY-MM-DD HH:MM)입니다.
+    """
+    SEVERITY_CHOICES = [("warning", "warning"), ("critical", "critical")]
+    SOURCE_CHOICES = [("daily", "daily"), ("live", "live")]
+
+    kind = models.CharField(max_length=32)
+    severity = models.CharField(max_length=8, choices=SEVERITY_CHOICES)
+    source = models.CharField(max_length=8, choices=SOURCE_CHOICES)
+    level = models.CharField(max_length=16)
+    bonbu = models.CharField("본부명", max_length=100, blank=True)
+    center = models.CharField("센터", max_length=100, blank=True)
+    team = models.CharField("팀", max_length=100, blank=True)
+    guksa = models.CharField("국사", max_length=100, blank=True)
+    cust_no = models.CharField("고객번호", max_length=20, blank=True)
+    period = models.CharField(max_length=16)
+    date = models.DateField()
+    value = models.FloatField()
+    threshold = models.FloatField()
+    message = models.CharField(max_length=200)
+    raised_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["kind", "level", "bonbu", "center", "team", "guksa", "cust_no", "period"],
+                name="uniq_alert_group_period",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["date", "kind"], name="alert_date_kind"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.severity} {self.period} {self.message}"
@@ -0,0 +1,116 @@
+"""
+getDayLpData.do 응답(dayLpDataInfoList) 파싱.
+
+레코드의 pwr_qtyHHMM 값을 (레코드 x 15분 구간) float 행렬로 한 번에 변환하여
+일 합계와 15분 단위 long-format 행을 벡터 연산으로 계산합니다.
+숫자가 아닌 값(None, "1.5" 같은 숫자 문자열 포함)은 NaN으로 처리되어 합계와 15분 행에서 제외됩니다.
+"""
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+SLOT_PREFIX = "pwr_qty"
+
+# KEPCO 표준 15분 구간: 0015, 0030, ..., 2400 (96개)
+SLOT_TIMES = tuple(f"{m // 60:02d}{m % 60:02d}" for m in range(15, 24 * 60 + 1, 15))
+SLOT_COLUMNS = tuple(SLOT_PREFIX + t for t in SLOT_TIMES)
+
+
+@lru_cache(maxsize=64)
+def _slot_index(keys):
+    """레코드 키 튜플에서 pwr_qty 키 목록을 (응답 순서대로) 추출합니다."""
+    columns = tuple(key for key in keys if key.startswith(SLOT_PREFIX))
+    return columns, tuple(key[-4:] for key in columns)
+
+
+def slot_columns(day_lp_data):
+    """레코드들의 pwr_qty 컬럼과 HHMM 시간 목록을 반환합니다. 대부분 SLOT_COLUMNS와 같습니다."""
+    if len(day_lp_data) == 1:
+        keys = tuple(day_lp_data[0])
+    else:
+        keys = tuple(dict.fromkeys(key for record in day_lp_data for key in record))
+    return _slot_index(keys)
+
+
+def _to_float(value):
+    """int/float 값만 숫자로 인정합니다 (기존 isinstance(value, (int, float)) 합계와 동일). 숫자 문자열도 NaN."""
+    if isinstance(value, (int, float)):
+        return value
+    return np.nan
+
+
+def lp_matrix(day_lp_data):
+    """
+    dayLpDataInfoList를 (meterNo 목록, HHMM 시간 목록, float 행렬[레코드, 구간])로 변환합니다.
+    """
+    columns, times = slot_columns(day_lp_data)
+    meters = [record.get("meterNo") for record in day_lp_data]
+    # 숫자가 아닌 값은 float 변환 전에 NaN으로 바꿔, "1.5" 같은 문자열이 섞인 레코드 유무와 상관없이 같은 결과를 냄
+    values = np.array(
+        [[_to_float(record.get(column)) for column in columns] for record in day_lp_data],
+        dtype=np.float64,
+    )
+    if values.ndim != 2:
+        values = values.reshape(len(day_lp_data), len(columns))
+    return meters, list(times), values
+
+
+def lp_frame(day_lp_data):
+    """dayLpDataInfoList를 meterNo 인덱스, HHMM 컬럼의 wide DataFrame으로 변환합니다."""
+    meters, times, values = lp_matrix(day_lp_data)
+    return pd.DataFrame(values, index=pd.Index(meters, name="MeterNo"), columns=times)
+
+
+def daily_total(day_lp_data):
+    """모든 레코드의 pwr_qty 합계(일 사용량)를 반환합니다."""
+    _, _, values = lp_matrix(day_lp_data)
+    return float(np.nansum(values))
+
+
+def interval_frame(day_lp_data):
+    """
+    15분 단위 long-format DataFrame(MeterNo, Time, Power Usage)을 반환합니다.
+    행 순서는 레코드 → 구간 순서이며 숫자가 아닌 값은 제외됩니다.
+    """
+    meters, times, values = lp_matrix(day_lp_data)
+    mask = ~np.isnan(values)
+    record_idx, slot_idx = np.nonzero(mask)
+    return pd.DataFrame({
+        "MeterNo": np.asarray(meters, dtype=object)[record_idx],
+        "Time": np.asarray(times, dtype=object)[slot_idx],
+        "Power Usage": values[mask],
+    })
+
+
+_SLOT_POSITION = {t: i for i, t in enumerate(SLOT_TIMES)}
+
+
+def slot_totals(day_lp_data):
+    """
+    모든 레코드(meter)의 구간별 합계를 SLOT_TIMES 순서의 길이 96 float 배열로 반환합니다.
+    값이 하나도 없는 구간은 NaN입니다.
+    """
+    _, times, values = lp_matrix(day_lp_data)
+    totals = np.full(len(SLOT_TIMES), np.nan)
+    positions = [_SLOT_POSITION.get(t) for t in times]
+    keep = [i for i, p in enumerate(positions) if p is not None]
+    if not keep or not len(values):
+        return totals
+    values = values[:, keep]
+    sums = np.nansum(values, axis=0)
+    sums[np.isnan(values).all(axis=0)] = np.nan
+    totals[[positions[i] for i in keep]] = sums
+    return totals
+
+
+def is_complete_day(day_lp_data):
+    """모든 레코드에 96개 구간(SLOT_TIMES) 값이 숫자로 모두 있으면 True (하루 데이터가 모두 게시됨)."""
+    if not day_lp_data:
+        return False
+    _, times, values = lp_matrix(day_lp_data)
+    positions = [_SLOT_POSITION.get(t) for t in times]
+    keep = [i for i, p in enumerate(positions) if p is not None]
+    if len({positions[i] for i in keep}) < len(SLOT_TIMES):
+        return False
+    return not np.isnan(values[:, keep]).any()
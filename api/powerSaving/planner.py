@@ -0,0 +1,128 @@
+"""
+기간 조회(kepcoDailyRangeData) 작업 계획.
+
+날짜 × 고객을 (고객번호, 날짜) 작업으로 펼치고 CSV에 중복된 고객번호는 한 번만 조회합니다.
+로컬 저장소(LoadProfile)에 있는 작업은 KEPCO 호출 없이 읽고, 응답 캐시에 있는 작업은
+호출 비용에서 제외합니다. 실행 전에 기간 길이와 예상 KEPCO 호출 수를 검사해
+MAX_RANGE_DAYS / MAX_FETCH_CALLS를 넘는 요청은 RangeTooLarge로 거절합니다.
+남은 작업은 fetch 엔진으로 기간 전체에 걸쳐 동시에 호출하고, 결과는 날짜 → CSV 순서로 반환합니다.
+"""
+import math
+
+from asgiref.sync import sync_to_async
+
+from .fetch import MAX_IN_FLIGHT, afetch_iter, fetch_iter
+from .store import load_days, stored_keys
+
+DAY_LP_ENDPOINT = "getDayLpData.do"
+
+# 한 번에 조회할 수 있는 최대 기간(일) - 한 분기
+MAX_RANGE_DAYS = 92
+
+# 한 요청에서 허용하는 최대 KEPCO 호출 수 (저장소/캐시에 없는 작업 수)
+MAX_FETCH_CALLS = 1500
+
+# 예상 소요 시간 계산용 KEPCO 호출 1건 평균 시간(초)
+AVG_CALL_SECONDS = 0.5
+
+
+class RangeTooLarge(ValueError):
+    """기간 또는 예상 KEPCO 호출 수가 상한을 넘는 요청."""
+
+
+class RangePlan:
+    """
+    기간 조회 작업 계획.
+    dates: YYYYMMDD 목록, cust_nos: 중복 제거된 고객번호(CSV 순서),
+    stored: 저장소에 있는 작업, cached: 캐시에 있는 작업, fetch_keys: 저장소에 없어 fetch로 가져올 작업(날짜 → 고객 순서)
+    """
+
+    def __init__(self, dates, cust_nos, stored, cached):
+        self.dates = list(dates)
+        self.cust_nos = list(cust_nos)
+        self.stored = stored
+        self.cached = cached
+        self.fetch_keys = [(cust_no, date) for date in self.dates for cust_no in self.cust_nos if (cust_no, date) not in stored]
+
+    @property
+    def upstream_calls(self):
+        """KEPCO를 실제로 호출해야 하는 작업 수 (캐시 hit 제외)."""
+        return sum(1 for key in self.fetch_keys if key not in self.cached)
+
+    def estimated_seconds(self, max_in_flight=None):
+        return math.ceil(self.upstream_calls / (max_in_flight or MAX_IN_FLIGHT)) * AVG_CALL_SECONDS
+
+    def _day_stored(self, date, skip):
+        cust_nos = [cust_no for cust_no in self.cust_nos if (cust_no, date) in self.stored and (cust_no, date) not in skip]
+        return cust_nos, [date]
+
+    def iter_days(self, fetch, max_in_flight=None, skip=()):
+        """
+        fetch((고객번호, 날짜))로 저장소에 없는 작업을 동시에 가져오며 (날짜, {고객번호: 응답}) 을 날짜 순서로 yield 합니다.
+        응답은 저장소에서 읽은 응답 또는 fetch의 반환값이며, fetch의 반환값은 검사하지 않고 그대로 전달합니다.
+        고객별 오류를 결과에 남기려면 fetch가 예외를 잡아 값으로 반환해야 합니다
+        (kepcoDailyRangeData는 예외 객체를 반환해 Status 컬럼에 기록하고, aggregate는 None을 반환해 missing으로 보고).
+        fetch가 예외를 발생시키면 해당 작업의 결과를 꺼낼 때 호출자에게 그대로 전달되어 반복이 끝나고, 대기 중인 호출은 취소됩니다.
+        저장소는 날짜 단위로 읽으므로 기간이 길어도 메모리가 일정합니다.
+        skip: 호출자가 이미 값을 가지고 있는 저장소 작업(예: 롤업 일 합계) - 읽지 않고 응답에서도 제외합니다.
+        """
+        fetched = fetch_iter(fetch, self.fetch_keys, max_in_flight=max_in_flight)
+        try:
+            for date in self.dates:
+                stored = load_days(*self._day_stored(date, skip))
+                day = {}
+                for cust_no in self.cust_nos:
+                    key = (cust_no, date)
+                    if key in skip:
+                        continue
+                    if key in self.stored:
+                        # 계획 이후 저장소에서 사라진 경우 직접 조회
+                        day[cust_no] = stored.get(key) or fetch(key)
+                    else:
+                        day[cust_no] = next(fetched)
+                yield date, day
+        finally:
+            # 소비자가 중단한 경우 대기 중인 호출 취소
+            fetched.close()
+
+    async def aiter_days(self, fetch, max_in_flight=None, skip=()):
+        """iter_days의 비동기 버전 (fetch: 코루틴 함수). fetch의 반환값과 예외는 iter_days와 같이 처리합니다."""
+        fetched = afetch_iter(fetch, self.fetch_keys, max_in_flight=max_in_flight)
+        try:
+            for date in self.dates:
+                stored = await sync_to_async(load_days)(*self._day_stored(date, skip))
+                day = {}
+                for cust_no in self.cust_nos:
+                    key = (cust_no, date)
+                    if key in skip:
+                        continue
+                    if key in self.stored:
+                        day[cust_no] = stored.get(key) or await fetch(key)
+                    else:
+                        day[cust_no] = await anext(fetched)
+                yield date, day
+        finally:
+            await fetched.aclose()
+
+
+def plan_range(cust_nos, dates, cache=None):
+    """
+    (고객번호, 날짜) 작업 계획을 만들고 상한을 검사합니다.
+    cache: ResponseCache (있으면 캐시에 있는 작업을 호출 비용에서 제외)
+    """
+    dates = list(dates)
+    if len(dates) > MAX_RANGE_DAYS:
+        raise RangeTooLarge(f"Date range too large: {len(dates)} days (max {MAX_RANGE_DAYS} days)")
+
+    cust_nos = list(dict.fromkeys(cust_no for cust_no in cust_nos if cust_no))
+    stored = stored_keys(cust_nos, dates)
+    cached = cache.cached_keys(DAY_LP_ENDPOINT, cust_nos, dates) if cache is not None else set()
+    plan = RangePlan(dates, cust_nos, stored, cached)
+
+    if plan.upstream_calls > MAX_FETCH_CALLS:
+        raise RangeTooLarge(
+            f"Date range too large: {plan.upstream_calls} KEPCO calls needed "
+            f"(about {plan.estimated_seconds():.0f}s, max {MAX_FETCH_CALLS} calls). "
+            f"Use a shorter range or ingest the data first (manage.py ingest_lp)."
+        )
+    return plan
@@ -0,0 +1,61 @@
+"""
+어제 데이터 사전 조회(prefetch).
+
+날짜를 지정하지 않은 kepcoDailyData / kepcoDailyData15min 요청과 kepco_daily_report.py는
+어제의 getDayLpData.do 응답을 사용합니다. prefetch_lp 관리 명령이 KEPCO 게시 이후 전체 고객의
+응답을 미리 가져와 캐시에 저장해 두면 이 요청들은 KEPCO를 호출하지 않고 캐시에서 응답합니다.
+
+96개 구간이 모두 게시된 응답은 캐시에 final로 저장되어 만료되지 않으며 다음 회차에서 건너뜁니다.
+오류, 빈 응답, 일부 구간이 비어 있는 고객은 gap으로 반환되어 다음 회차에 다시 조회합니다.
+"""
+from datetime import datetime, timedelta
+
+import requests
+
+from .customers import get_registry
+from .fetch import fetch_all
+from .kepco_client import get_client
+from .parsing import is_complete_day
+from .planner import DAY_LP_ENDPOINT
+
+
+def yesterday():
+    """어제 날짜(YYYYMMDD)를 반환합니다."""
+    return (datetime.today() - timedelta(days=1)).strftime("%Y%m%d")
+
+
+def prefetch_day(date, cust_nos=None, max_in_flight=None):
+    """
+    date(YYYYMMDD)의 getDayLpData.do 응답을 고객별로 KEPCO에서 다시 가져와 캐시에 저장합니다.
+    cust_nos가 없으면 고객 목록 전체를 조회하고, 이미 final로 캐시된 고객은 건너뜁니다.
+    반환: (조회한 고객 수, {고객번호: "no data" | "incomplete" | 오류 메시지})
+    """
+    client = get_client()
+    if cust_nos is None:
+        cust_nos = [record.cust_no for record in get_registry().all()]
+    cust_nos = list(dict.fromkeys(cust_nos))
+
+    done = set()
+    if client.cache is not None:
+        done = {cust_no for cust_no, _ in client.cache.cached_keys(DAY_LP_ENDPOINT, cust_nos, [date], final_only=True)}
+    pending = [cust_no for cust_no in cust_nos if cust_no not in done]
+
+    def fetch(cust_no):
+        try:
+            # 캐시된 응답은 아직 완성되지 않은 것이므로 무시하고 다시 조회
+            data = client.get_day_lp_data(cust_no, date, use_cache=False)
+        except requests.RequestException as e:
+            return cust_no, str(e)
+        day_lp_data = data.get("dayLpDataInfoList")
+        if not day_lp_data:
+            return cust_no, "no data"
+        if not is_complete_day(day_lp_data):
+            return cust_no, "incomplete"
+        return cust_no, None
+
+    gaps = {
+        cust_no: error
+        for cust_no, error in fetch_all(fetch, pending, max_in_flight=max_in_flight)
+        if error is not None
+    }
+    return len(pending), gaps
@@ -0,0 +1,229 @@
+"""
+LoadProfile 롤업 테이블(Rollup) 갱신과 조회.
+
+hour/day 롤업은 저장된 15분 값에서 aggregation.summarize로 계산하고,
+month 롤업은 그 달의 day 롤업을 aggregation.combine으로 다시 집계해 만듭니다.
+ingest(store.ingest)가 날짜를 저장하면 해당 날짜와 그 달의 롤업만 다시 계산합니다.
+
+조회 시에는 요청한 고객/날짜가 모두 저장소에 있고, 필터가 그룹 단위로 고객을 선택한 경우에만
+롤업을 사용합니다 (일부 고객만 선택하면 그룹 롤업 값이 달라지므로 원본 15분 값으로 집계).
+"""
+from datetime import datetime
+
+import pandas as pd
+from django.db import transaction
+
+from .aggregation import GROUP_LEVELS, combine, finalize, summarize
+from .customers import get_registry
+from .metrics import stage
+from .models import LoadProfile, Rollup
+from .store import BATCH_SIZE, stored_keys
+
+# 한 번에 다시 계산하는 날짜 수
+UPDATE_DAYS = 31
+
+# 롤업 컬럼 → 집계 프레임 컬럼
+_GROUP_FIELDS = {
+    "bonbu": "Bonbu",
+    "center": "Center",
+    "team": "Team",
+    "guksa": "Guksa",
+    "cust_no": "Customer Number",
+}
+_VALUE_FIELDS = {
+    "customers": "Customers",
+    "intervals": "Intervals",
+    "power_sum": "Power Usage Sum",
+    "power_peak": "Power Usage Peak",
+    "peak_time": "Peak Time",
+}
+_PERIOD_FORMATS = {"hour": "%Y-%m-%d %H:%M", "day": "%Y-%m-%d", "month": "%Y-%m"}
+
+
+def _days(dates):
+    return sorted({d if not isinstance(d, str) else datetime.strptime(d, "%Y%m%d").date() for d in dates})
+
+
+def stored_frame(days):
+    """days의 LoadProfile 값을 aggregation.interval_long과 같은 long-format으로 반환합니다."""
+    rows = (
+        LoadProfile.objects
+        .filter(date__in=days, power_usage__isnull=False)
+        .values_list(
+            "customer__cust_no", "customer__bonbu", "customer__center", "customer__team", "customer__guksa",
+            "date", "time", "power_usage",
+        )
+    )
+    frame = pd.DataFrame.from_records(
+        rows.iterator(chunk_size=BATCH_SIZE),
+        columns=["Customer Number", "Bonbu", "Center", "Team", "Guksa", "Date", "Time", "Power Usage"],
+    )
+    if frame.empty:
+        return frame.drop(columns=["Date", "Time"]).assign(Slot=pd.Series(dtype="datetime64[ns]"))
+
+    # Time(HHMM)은 구간 종료 시각이므로 15분을 빼서 구간 시작 시각으로 변환
+    minutes = frame["Time"].str[:2].astype(int) * 60 + frame["Time"].str[2:].astype(int) - 15
+    slots = pd.to_datetime(frame["Date"]) + pd.to_timedelta(minutes, unit="m")
+    frame = frame.drop(columns=["Date", "Time"]).assign(Slot=slots)
+    for column in ["Customer Number", "Bonbu", "Center", "Team", "Guksa"]:
+        frame[column] = frame[column].astype("category")
+    return frame
+
+
+def _rollup_objects(summary, granularity, level):
+    if summary.empty:
+        return []
+    keys = GROUP_LEVELS[level]
+    fields = {field: column for field, column in _GROUP_FIELDS.items() if column in keys}
+    periods = summary["Period"].dt.strftime(_PERIOD_FORMATS[granularity])
+    start_dates = summary["Period"].dt.date
+    records = summary.to_dict("records")
+    return [
+        Rollup(
+            granularity=granularity,
+            level=level,
+            period=period,
+            start_date=start_date,
+            **{field: record[column] or "" for field, column in fields.items()},
+            **{field: record[column] for field, column in _VALUE_FIELDS.items()},
+        )
+        for record, period, start_date in zip(records, periods, start_dates)
+    ]
+
+
+def _replace(objects, **lookup):
+    with transaction.atomic():
+        Rollup.objects.filter(**lookup).delete()
+        Rollup.objects.bulk_create(objects, batch_size=BATCH_SIZE)
+    return len(objects)
+
+
+def _read(granularity, level, **lookup):
+    """롤업 행을 summarize 결과와 같은 형태(그룹 컬럼, Period Timestamp, 값 컬럼)로 읽습니다."""
+    keys = GROUP_LEVELS[level]
+    fields = [field for field, column in _GROUP_FIELDS.items() if column in keys]
+    rows = Rollup.objects.filter(granularity=granularity, level=level, **lookup).values_list(
+        *fields, "period", *_VALUE_FIELDS
+    )
+    frame = pd.DataFrame.from_records(
+        list(rows), columns=[_GROUP_FIELDS[f] for f in fields] + ["Period"] + list(_VALUE_FIELDS.values())
+    )
+    frame["Period"] = pd.to_datetime(frame["Period"], format=_PERIOD_FORMATS[granularity])
+    return frame
+
+
+def update_rollups(dates, log=None):
+    """
+    dates(YYYYMMDD 또는 date)의 hour/day 롤업과 해당 월의 month 롤업을 저장된 15분 값으로 다시 계산합니다.
+    저장한 롤업 행 수를 반환합니다.
+    """
+    days = _days(dates)
+    saved = 0
+    for start in range(0, len(days), UPDATE_DAYS):
+        batch = days[start:start + UPDATE_DAYS]
+        frame = stored_frame(batch)
+        objects = []
+        for level in GROUP_LEVELS:
+            for granularity in ("hour", "day"):
+                objects += _rollup_objects(summarize(frame, level, granularity), granularity, level)
+        saved += _replace(objects, granularity__in=["hour", "day"], start_date__in=batch)
+
+    for year, month in sorted({(day.year, day.month) for day in days}):
+        month_lookup = {"start_date__year": year, "start_date__month": month}
+        customer_days = _read("day", "customer", **month_lookup)
+        objects = []
+        for level in GROUP_LEVELS:
+            level_days = customer_days if level == "customer" else _read("day", level, **month_lookup)
+            if level_days.empty:
+                continue
+            objects += _rollup_objects(combine(level_days, customer_days, level, "month"), "month", level)
+        saved += _replace(objects, granularity="month", **month_lookup)
+
+    if log:
+        log(f"rollups: {len(days)} days, {saved} rows updated")
+    return saved
+
+
+@stage("store")
+def day_totals(keys):
+    """[(고객번호, YYYYMMDD)]의 일 사용량 합계를 customer day 롤업에서 읽어 {(고객번호, YYYYMMDD): 합계}로 반환합니다."""
+    keys = set(keys)
+    if not keys:
+        return {}
+    rows = Rollup.objects.filter(
+        granularity="day",
+        level="customer",
+        cust_no__in={cust_no for cust_no, _ in keys},
+        start_date__in=_days(date for _, date in keys),
+    ).values_list("cust_no", "start_date", "power_sum")
+    totals = {}
+    for cust_no, start_date, power_sum in rows:
+        key = (cust_no, start_date.strftime("%Y%m%d"))
+        if key in keys:
+            totals[key] = power_sum
+    return totals
+
+
+def _group(record, keys):
+    return tuple(getattr(record, field) or "" for field, column in _GROUP_FIELDS.items() if column in keys)
+
+
+def rollup_aggregate(customers, dates, group_by, bucket):
+    """
+    롤업으로 /powerSaving/aggregate 결과를 만듭니다. 롤업을 쓸 수 없으면 None을 반환합니다.
+    (15min bucket, 일부 고객만 선택한 그룹, 저장소에 complete로 저장되지 않은 고객/날짜가 있는 경우)
+    """
+    if bucket not in ("hour", "day", "week", "month"):
+        return None
+
+    keys = GROUP_LEVELS[group_by]
+    cust_nos = {record.cust_no for record in customers}
+    groups = {_group(record, keys) for record in customers}
+    roster = {record.cust_no for record in get_registry().all() if _group(record, keys) in groups}
+    if roster != cust_nos:
+        return None
+    if len(stored_keys(cust_nos, dates)) < len(cust_nos) * len(dates):
+        return None
+
+    days = _days(dates)
+
+    def select(frame, level):
+        # 선택한 그룹만 남김
+        level_keys = GROUP_LEVELS[level]
+        if not keys or frame.empty:
+            return frame
+        if level == "customer":
+            return frame[frame["Customer Number"].isin(cust_nos)]
+        return frame[pd.Series(list(zip(*(frame[k] for k in level_keys))), index=frame.index).isin(groups)]
+
+    if bucket in ("hour", "day"):
+        summary = select(_read(bucket, group_by, start_date__in=days), group_by)
+        return finalize(summary, group_by, bucket)
+
+    if bucket == "week":
+        day_summary = select(_read("day", group_by, start_date__in=days), group_by)
+        customer_days = select(_read("day", "customer", start_date__in=days), "customer")
+        if day_summary.empty:
+            return finalize(pd.DataFrame(), group_by, bucket)
+        return finalize(combine(day_summary, customer_days, group_by, "week"), group_by, bucket)
+
+    # month: 달 전체가 기간에 포함되면 month 롤업, 일부 날짜만 포함된 달은 day 롤업을 다시 집계
+    summaries = []
+    partial = []
+    for year, month in sorted({(day.year, day.month) for day in days}):
+        month_days = [day for day in days if (day.year, day.month) == (year, month)]
+        month_length = (pd.Timestamp(year=year, month=month, day=1) + pd.offsets.MonthEnd(0)).day
+        if len(month_days) == month_length:
+            summaries.append(select(_read("month", group_by, start_date__year=year, start_date__month=month), group_by))
+        else:
+            partial += month_days
+    if partial:
+        day_summary = select(_read("day", group_by, start_date__in=partial), group_by)
+        customer_days = select(_read("day", "customer", start_date__in=partial), "customer")
+        if not day_summary.empty:
+            summaries.append(combine(day_summary, customer_days, group_by, "month"))
+
+    summaries = [summary for summary in summaries if not summary.empty]
+    if not summaries:
+        return finalize(pd.DataFrame(), group_by, bucket)
+    return finalize(pd.concat(summaries, ignore_index=True), group_by, bucket)
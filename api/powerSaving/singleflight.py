@@ -0,0 +1,115 @@
+"""
+같은 KEPCO 조회의 동시 호출 병합(single-flight).
+
+여러 요청이 같은 (endpoint, custNo, date)를 동시에 조회하면 먼저 시작한 호출(leader)만 KEPCO를 호출하고
+나머지는 그 결과(또는 예외)를 함께 받습니다.
+
+    - 프로세스 내부: SingleFlight (스레드), AsyncSingleFlight (이벤트 루프)
+    - gunicorn 워커 간: KeyLease. 캐시 DB의 key별 임대 행을 얻은 워커만 KEPCO를 호출하고,
+      나머지 워커는 그 key의 캐시를 다시 확인하며 기다리다 저장된 응답을 사용합니다.
+      임대에는 만료 시각이 있어 KEPCO 호출 동안 잠금을 잡고 있지 않습니다.
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+
+# 다른 워커의 임대가 끝나기를 기다릴 때 캐시를 다시 확인하는 간격(초)
+LEASE_POLL = 0.05
+
+
+class SingleFlight:
+    """같은 key의 동시 호출을 하나로 합치는 스레드용 single-flight."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        """
+        key로 진행 중인 호출이 있으면 그 결과를 기다려 반환하고, 없으면 fn()을 실행합니다.
+        fn()의 예외는 기다리던 모든 호출에 그대로 전달됩니다.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._calls[key]
+        return future.result()
+
+    def in_flight(self):
+        with self._lock:
+            return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """같은 key의 동시 호출을 하나로 합치는 asyncio용 single-flight (이벤트 루프마다 하나)."""
+
+    def __init__(self):
+        self._calls = {}
+
+    async def do(self, key, fn):
+        """key로 진행 중인 호출이 있으면 그 결과를 기다려 반환하고, 없으면 await fn()을 실행합니다."""
+        task = self._calls.get(key)
+        if task is None or task.done():
+            task = self._calls[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda done: self._calls.pop(key) if self._calls.get(key) is done else None)
+        # 기다리던 요청 하나가 취소되어도 다른 요청이 공유하는 호출은 계속 진행
+        return await asyncio.shield(task)
+
+    def in_flight(self):
+        return len(self._calls)
+
+
+class KeyLease:
+    """
+    key별 프로세스 간 leader 선출. ResponseCache의 조회 임대(kepco_lease) 행을 사용합니다.
+    잠금을 잡고 기다리지 않으므로 leader가 KEPCO를 호출하는 동안 다른 key의 조회는 막히지 않고,
+    같은 key를 기다리는 워커는 poll 초 간격으로 캐시와 임대만 다시 확인합니다.
+    """
+
+    def __init__(self, cache, poll=LEASE_POLL):
+        self.cache = cache
+        self.poll = poll
+
+    def claim(self, key, check):
+        """
+        key의 임대를 얻을 때까지 기다립니다.
+        기다리는 동안 check()가 None이 아닌 값을 반환하면(다른 워커가 가져와 캐시에 저장) (값, None)을,
+        임대를 얻으면 (None, owner)를 반환합니다. owner는 release()에 넘깁니다.
+        """
+        while True:
+            value = check()
+            if value is not None:
+                return value, None
+            owner = self.cache.acquire_lease(*key)
+            if owner is not None:
+                return None, owner
+            time.sleep(self.poll)
+
+    def release(self, key, owner):
+        self.cache.release_lease(*key, owner)
+
+    async def aclaim(self, key, check):
+        """claim()의 비동기 버전. check는 동기 함수이며 캐시 조회는 스레드에서 실행합니다."""
+        while True:
+            value = await asyncio.to_thread(check)
+            if value is not None:
+                return value, None
+            owner = await asyncio.to_thread(self.cache.acquire_lease, *key)
+            if owner is not None:
+                return None, owner
+            await asyncio.sleep(self.poll)
+
+    async def arelease(self, key, owner):
+        await asyncio.to_thread(self.cache.release_lease, *key, owner)
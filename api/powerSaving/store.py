@@ -0,0 +1,206 @@
+"""
+15분 LP 데이터 로컬 저장소 (Customer / LoadProfile 모델).
+
+ingest_lp 관리 명령이 getDayLpData.do 응답을 bulk insert로 저장하면서 고객 x 날짜마다 하루 96개 구간이
+모두 게시되었는지(StoredDay.complete)를 함께 저장합니다. 엔드포인트와 기간 조회 계획은 complete인 날짜만
+KEPCO 대신 여기서 읽고, 일부만 저장된 날짜는 KEPCO에서 다시 가져옵니다 (ingest_lp가 다시 저장하면 complete로 바뀜).
+"""
+import math
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import requests
+from django.db import transaction
+from django.db.models import Exists, Max, OuterRef
+from django.utils import timezone
+
+from .customers import get_registry
+from .fetch import fetch_all
+from .kepco_client import get_client
+from .metrics import stage
+from .models import Customer, LoadProfile, StoredDay
+from .parsing import is_complete_day, lp_matrix
+
+# bulk_create 한 번에 저장하는 행 수
+BATCH_SIZE = 5000
+
+# 한 번에 KEPCO에서 가져와 저장하는 (고객, 날짜) 작업 수
+INGEST_CHUNK = 200
+
+_CUSTOMER_FIELDS = ["category", "category1", "bonbu", "center", "team", "guksa"]
+
+
+def sync_customers(csv_path=None):
+    """CSV(기본값: 설정의 고객 목록)의 고객 목록을 Customer 테이블에 반영하고 {고객번호: Customer}를 반환합니다."""
+    customers = {
+        record.cust_no: Customer(cust_no=record.cust_no, **{field: getattr(record, field) or "" for field in _CUSTOMER_FIELDS})
+        for record in get_registry(csv_path).all()
+    }
+
+    Customer.objects.bulk_create(
+        list(customers.values()),
+        update_conflicts=True,
+        unique_fields=["cust_no"],
+        update_fields=_CUSTOMER_FIELDS,
+    )
+    return {c.cust_no: c for c in Customer.objects.filter(cust_no__in=list(customers))}
+
+
+def _interval_end(day, hhmm):
+    """date와 HHMM(0015~2400)으로 구간 종료 시각(aware datetime)을 만듭니다."""
+    naive = datetime.combine(day, datetime.min.time()) + timedelta(hours=int(hhmm[:2]), minutes=int(hhmm[2:]))
+    return timezone.make_aware(naive)
+
+
+def _profile_rows(customer, date, data):
+    day_lp_data = data.get("dayLpDataInfoList", [])
+    if not day_lp_data:
+        return
+    day = datetime.strptime(str(date), "%Y%m%d").date()
+    meters, times, values = lp_matrix(day_lp_data)
+    timestamps = [_interval_end(day, hhmm) for hhmm in times]
+    for meter_no, row in zip(meters, values.tolist()):
+        for hhmm, timestamp, value in zip(times, timestamps, row):
+            yield LoadProfile(
+                customer=customer,
+                meter_no=meter_no or "",
+                date=day,
+                time=hhmm,
+                timestamp=timestamp,
+                power_usage=None if math.isnan(value) else value,
+            )
+
+
+def save_days(items):
+    """
+    [(Customer, date(YYYYMMDD), getDayLpData 응답)] 목록을 LoadProfile에 bulk insert 합니다.
+    이미 있는 구간은 사용량만 갱신하고, 고객 x 날짜의 complete 여부를 StoredDay에 저장합니다 (두 저장은 한 트랜잭션).
+    저장한 행 수를 반환합니다.
+    """
+    rows = [row for customer, date, data in items for row in _profile_rows(customer, date, data)]
+    if rows:
+        with transaction.atomic():
+            LoadProfile.objects.bulk_create(
+                rows,
+                batch_size=BATCH_SIZE,
+                update_conflicts=True,
+                unique_fields=["customer", "meter_no", "timestamp"],
+                update_fields=["power_usage"],
+            )
+            now = timezone.now()
+            StoredDay.objects.bulk_create(
+                [
+                    StoredDay(
+                        customer=customer,
+                        date=datetime.strptime(str(date), "%Y%m%d").date(),
+                        complete=is_complete_day(data["dayLpDataInfoList"]),
+                        ingested_at=now,
+                    )
+                    for customer, date, data in items if data.get("dayLpDataInfoList")
+                ],
+                batch_size=BATCH_SIZE,
+                update_conflicts=True,
+                unique_fields=["customer", "date"],
+                update_fields=["complete", "ingested_at"],
+            )
+    return len(rows)
+
+
+@stage("store")
+def load_days(cust_nos, dates):
+    """
+    저장소에 있는 complete 날짜 데이터를 getDayLpData.do 응답 형태로 반환합니다.
+    반환: {(고객번호, YYYYMMDD): {"dayLpDataInfoList": [{"meterNo": ..., "pwr_qtyHHMM": ...}, ...]}}
+    일부 구간만 저장된 날짜는 반환하지 않으므로 호출자가 KEPCO에서 가져옵니다.
+    """
+    days = [datetime.strptime(str(d), "%Y%m%d").date() for d in dates]
+    if not days or not cust_nos:
+        return {}
+
+    complete = StoredDay.objects.filter(customer=OuterRef("customer"), date=OuterRef("date"), complete=True)
+    rows = (
+        LoadProfile.objects
+        .filter(Exists(complete), customer__cust_no__in=list(cust_nos), date__in=days)
+        .order_by("id")
+        .values_list("customer__cust_no", "meter_no", "date", "time", "power_usage")
+    )
+    records = defaultdict(dict)
+    for cust_no, meter_no, day, hhmm, power_usage in rows.iterator(chunk_size=BATCH_SIZE):
+        key = (cust_no, day.strftime("%Y%m%d"))
+        record = records[key].setdefault(meter_no, {"meterNo": meter_no})
+        record[f"pwr_qty{hhmm}"] = power_usage
+    return {key: {"dayLpDataInfoList": list(meters.values())} for key, meters in records.items()}
+
+
+@stage("store")
+def stored_keys(cust_nos, dates):
+    """저장소에 있는 complete 날짜의 (고객번호, YYYYMMDD) 집합을 반환합니다. 사용량 값은 읽지 않습니다."""
+    days = [datetime.strptime(str(d), "%Y%m%d").date() for d in dates]
+    if not days or not cust_nos:
+        return set()
+
+    rows = (
+        StoredDay.objects
+        .filter(customer__cust_no__in=list(cust_nos), date__in=days, complete=True)
+        .values_list("customer__cust_no", "date")
+    )
+    return {(cust_no, day.strftime("%Y%m%d")) for cust_no, day in rows}
+
+
+def incomplete_days():
+    """일부 구간만 저장된 (고객번호, date) 목록을 날짜 순서로 반환합니다 (ingest_lp가 다시 조회)."""
+    return list(
+        StoredDay.objects.filter(complete=False)
+        .order_by("date", "customer_id")
+        .values_list("customer__cust_no", "date")
+    )
+
+
+def last_ingested_dates():
+    """{고객번호: 마지막으로 저장된 date}를 반환합니다."""
+    return dict(
+        LoadProfile.objects.values("customer__cust_no")
+        .annotate(last=Max("date"))
+        .values_list("customer__cust_no", "last")
+    )
+
+
+def ingest(tasks, max_in_flight=None, log=print):
+    """
+    [(Customer, YYYYMMDD)] 작업을 KEPCO에서 가져와 저장합니다.
+    INGEST_CHUNK 단위로 동시 조회 후 bulk insert 하고, 저장한 날짜의 롤업을 갱신합니다.
+    (저장 행 수, 실패 작업 목록)을 반환합니다.
+    """
+    client = get_client()
+
+    def fetch(task):
+        customer, date = task
+        try:
+            return customer, date, client.get_day_lp_data(customer.cust_no, date), None
+        except requests.RequestException as e:
+            return customer, date, None, str(e)
+
+    # 롤업(rollups)과 분석(analysis)은 store를 사용하므로 여기서 import
+    from .analysis import update_analysis
+    from .rollups import update_rollups
+
+    saved = 0
+    failed = []
+    saved_dates = set()
+    for start in range(0, len(tasks), INGEST_CHUNK):
+        chunk = tasks[start:start + INGEST_CHUNK]
+        items = []
+        for customer, date, data, error in fetch_all(fetch, chunk, max_in_flight=max_in_flight):
+            if error or not data.get("dayLpDataInfoList"):
+                failed.append((customer, date, error or "no data"))
+                continue
+            items.append((customer, date, data))
+        saved += save_days(items)
+        saved_dates.update(date for _, date, _ in items)
+        log(f"{min(start + INGEST_CHUNK, len(tasks))}/{len(tasks)} tasks, {saved} rows saved")
+
+    # 저장한 날짜의 hour/day 롤업과 해당 월의 month 롤업, 일 분석 지표/알림만 다시 계산
+    if saved_dates:
+        update_rollups(saved_dates, log=log)
+        update_analysis(saved_dates, log=log)
+    return saved, failed
@@ -0,0 +1,64 @@
+"""
+대용량 조회 결과를 NDJSON(한 줄에 JSON 레코드 하나)으로 스트리밍하는 응답.
+
+레코드는 생성되는 즉시 클라이언트로 전송되므로 기간이 길어도 서버 메모리가 일정하게 유지됩니다.
+중간에 오류가 발생하면 마지막 줄에 {"returnCode": "le", "error": "..."}를 쓰고 종료합니다.
+"""
+import json
+
+from django.http import StreamingHttpResponse
+
+from .metrics import acounted, counted, current_view
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson; charset=utf-8"
+
+
+class StreamError(Exception):
+    """스트리밍 도중 응답을 중단해야 하는 오류. 메시지가 마지막 줄의 error가 됩니다."""
+
+
+def _chunk(record):
+    # 레코드 목록(list)은 여러 줄을 한 chunk로 묶어 전송 (압축 시 flush 횟수 감소)
+    if isinstance(record, list):
+        return "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in record)
+    return json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def ndjson_lines(records):
+    """
+    records(dict iterable)를 NDJSON 줄 단위 문자열로 변환합니다.
+    dict 대신 dict 목록을 yield하면 그 레코드들을 한 chunk로 씁니다.
+    """
+    try:
+        for record in records:
+            yield _chunk(record)
+    except StreamError as e:
+        yield json.dumps({"returnCode": "le", "error": str(e)}, ensure_ascii=False) + "\n"
+    except Exception as e:
+        print(str(e))
+        yield json.dumps({"returnCode": "le", "error": str(e)}, ensure_ascii=False) + "\n"
+
+
+async def ndjson_alines(records):
+    """ndjson_lines의 비동기 버전 (records: async iterable)."""
+    try:
+        async for record in records:
+            yield _chunk(record)
+    except StreamError as e:
+        yield json.dumps({"returnCode": "le", "error": str(e)}, ensure_ascii=False) + "\n"
+    except Exception as e:
+        print(str(e))
+        yield json.dumps({"returnCode": "le", "error": str(e)}, ensure_ascii=False) + "\n"
+
+
+def ndjson_response(records, filename=None):
+    """records(iterable 또는 async iterable)를 NDJSON StreamingHttpResponse로 반환합니다. 보낸 행 수는 metrics에 기록합니다."""
+    view = current_view()
+    if hasattr(records, "__aiter__"):
+        lines = ndjson_alines(acounted(records, view))
+    else:
+        lines = ndjson_lines(counted(records, view))
+    response = StreamingHttpResponse(lines, content_type=NDJSON_CONTENT_TYPE)
+    if filename:
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
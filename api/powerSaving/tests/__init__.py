@@ -0,0 +1,5 @@
+"""
+powerSaving 테스트. KEPCO OpenAPI 대신 fake_kepco 대역 서버와 임시 응답 캐시를 사용합니다.
+
+    python manage.py test powerSaving
+"""
@@ -0,0 +1,52 @@
+import shutil
+import tempfile
+from unittest import mock
+
+from django.test import TestCase
+
+from .. import cache as cache_module
+from .. import fake_kepco, kepco_client
+from ..cache import ResponseCache
+from ..customers import get_registry
+from ..kepco_client import KepcoClient
+
+DAY_LP_ENDPOINT = "getDayLpData.do"
+
+
+class FakeKepcoTestCase(TestCase):
+    """
+    fake_kepco 서버를 띄우고, 그 서버와 임시 응답 캐시를 쓰는 KepcoClient를 get_client()/get_cache()로 돌려주는 기반 클래스.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = fake_kepco.start(latency=0.01)
+        cls.addClassCleanup(cls.server.server_close)
+        cls.addClassCleanup(cls.server.shutdown)
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, True)
+        self.directory = directory
+        self.cache = ResponseCache(f"{directory}/cache.sqlite3")
+        self.kepco = self.make_client()
+        for target, name, value in ((kepco_client, "_client", self.kepco), (cache_module, "_cache", self.cache)):
+            patcher = mock.patch.object(target, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.server.latency = 0.01
+
+    def make_client(self):
+        """같은 응답 캐시 파일을 쓰는 새 클라이언트 (다른 워커 프로세스의 클라이언트 역할)."""
+        client = KepcoClient(base_url=self.server.base_url, cache=ResponseCache(self.cache.path), backoff_factor=0.01)
+        client.keys.set_rate(5000)
+        self.addCleanup(client.close)
+        return client
+
+    def upstream_calls(self):
+        return self.server.counts["requests"]
+
+    def customers(self):
+        """CSV 순서의 고객 목록 (고객번호 중복 제거)."""
+        return list({row.cust_no: row for row in get_registry().all()}.values())
@@ -0,0 +1,40 @@
+import numpy as np
+
+from .. import fake_kepco
+from .base import FakeKepcoTestCase
+
+
+class AggregateEndpointTests(FakeKepcoTestCase):
+    """/powerSaving/aggregate가 KEPCO 응답으로 그룹/기간 합계와 최대값을 계산하는지 (저장소가 비어 있는 경우)."""
+
+    def test_all_by_day_matches_customer_totals(self):
+        customers = self.customers()
+        totals = sum(
+            np.array([record[f"pwr_qty{hhmm}"] for hhmm in fake_kepco.SLOT_TIMES])
+            for row in customers
+            for record in fake_kepco.day_lp_data(row.cust_no, "20250101")["dayLpDataInfoList"]
+        )
+
+        data = self.client.get("/ninja-api/powerSaving/aggregate?startDate=20250101&endDate=20250101&groupBy=all&bucket=day").json()
+
+        self.assertEqual(data["returnCode"], "ok")
+        self.assertEqual(data["missing"], [])
+        [row] = data["data"]
+        self.assertEqual(row["Period"], "2025-01-01")
+        self.assertEqual(row["Customers"], len(customers))
+        self.assertAlmostEqual(row["Power Usage Sum"], totals.sum(), places=4)
+        self.assertAlmostEqual(row["Power Usage Peak"], totals.max(), places=4)
+        self.assertAlmostEqual(row["Power Usage Avg"], totals.mean(), places=4)
+
+    def test_groups_split_the_total(self):
+        path = "/ninja-api/powerSaving/aggregate?startDate=20250101&endDate=20250102&bucket=month&groupBy="
+        total = self.client.get(path + "all").json()["data"][0]["Power Usage Sum"]
+        teams = self.client.get(path + "team").json()["data"]
+
+        self.assertGreater(len(teams), 1)
+        self.assertAlmostEqual(sum(row["Power Usage Sum"] for row in teams), total, places=4)
+        self.assertEqual(sum(row["Customers"] for row in teams), len(self.customers()))
+
+    def test_invalid_group_by(self):
+        data = self.client.get("/ninja-api/powerSaving/aggregate?groupBy=nothing").json()
+        self.assertEqual(data["returnCode"], "le")
@@ -0,0 +1,76 @@
+import csv
+import os
+
+import numpy as np
+from django.test import override_settings
+
+from .. import fake_kepco
+from ..analysis import DEMAND_FACTOR, contracts
+from ..models import Alert, DayStat
+from ..parsing import slot_totals
+from ..store import ingest, sync_customers
+from .base import FakeKepcoTestCase
+
+DATE = "20250101"
+
+# (고객번호, 국사, 계약전력 / 최대수요전력 비율, 기대하는 고객 알림). 비율이 None이면 계약전력 빈 칸
+ROSTER = [
+    ("0000000101", "수원국사", 2.0, None),
+    ("0000000102", "수원국사", 1.05, "warning"),
+    ("0000000103", "영통국사", 0.8, "critical"),
+    ("0000000104", "영통국사", None, None),
+    ("0000000105", "안양국사", 1.05, "warning"),
+]
+# 국사 계약전력은 소속 고객 계약전력의 합: 수원국사는 여유가 있어 알림 없음,
+# 영통국사는 계약전력이 빈 고객(104)의 사용량도 국사 수요에 더해져 critical
+GUKSA_ALERTS = {"영통국사": "critical", "안양국사": "warning"}
+
+
+def demand(cust_nos):
+    """fake_kepco 값으로 계산한 고객들의 DATE 최대수요전력(kW)."""
+    totals = sum(slot_totals(fake_kepco.day_lp_data(cust_no, DATE)["dayLpDataInfoList"]) for cust_no in cust_nos)
+    return float(np.max(totals)) * DEMAND_FACTOR
+
+
+class ContractAlertTests(FakeKepcoTestCase):
+    """계약전력 컬럼이 있는 고객 목록으로 고객/국사 최대수요전력의 contract_peak 알림을 만드는지."""
+
+    def setUp(self):
+        super().setUp()
+        path = os.path.join(self.directory, "roster.csv")
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["구분", "고객번호", "구분1", "본부명", "센터", "팀", "국사", "계약전력"])
+            for cust_no, guksa, ratio, _ in ROSTER:
+                # 천 단위 쉼표가 있는 값도 읽음
+                contract = f"{demand([cust_no]) * ratio:,.1f}" if ratio else ""
+                writer.writerow(["국사", cust_no, "A", "경기본부", "수원센터", "수원운용팀", guksa, contract])
+        override = override_settings(KEPCO={"CUSTOMER_CSV": path})
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def alerts(self, level):
+        rows = Alert.objects.filter(kind="contract_peak", level=level, date="2025-01-01")
+        key = "guksa" if level == "guksa" else "cust_no"
+        return {getattr(alert, key): alert.severity for alert in rows}
+
+    def test_contracts_from_roster(self):
+        customers, guksas = contracts()
+        self.assertEqual(sorted(customers), [cust_no for cust_no, _, ratio, _ in ROSTER if ratio])
+        self.assertAlmostEqual(guksas[("경기본부", "수원센터", "수원운용팀", "영통국사")], customers["0000000103"])
+
+    def test_ingest_raises_customer_and_guksa_alerts(self):
+        customers = sync_customers()
+        saved, failed = ingest([(customer, DATE) for customer in customers.values()], log=lambda message: None)
+        self.assertEqual(failed, [])
+
+        expected = {cust_no: severity for cust_no, _, _, severity in ROSTER if severity}
+        self.assertEqual(self.alerts("customer"), expected)
+        self.assertEqual(self.alerts("guksa"), GUKSA_ALERTS)
+        critical = Alert.objects.get(kind="contract_peak", level="customer", cust_no="0000000103")
+        self.assertAlmostEqual(critical.value, demand(["0000000103"]), places=4)
+        self.assertEqual(DayStat.objects.filter(date="2025-01-01").count(), len(ROSTER))
+
+    def test_roster_without_contract_column_raises_none(self):
+        with override_settings(KEPCO={}):
+            self.assertEqual(contracts(), ({}, {}))
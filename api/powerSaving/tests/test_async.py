@@ -0,0 +1,34 @@
+from django.test import override_settings
+
+from .base import FakeKepcoTestCase
+
+
+class AsyncEndpointTests(FakeKepcoTestCase):
+    """/powerSaving/async/* 엔드포인트가 동기 엔드포인트와 같은 결과를 돌려주는지."""
+
+    def setUp(self):
+        super().setUp()
+        # 비동기 클라이언트는 이벤트 루프마다 설정의 BASE_URL로 만들어짐
+        override = override_settings(KEPCO={"BASE_URL": self.server.base_url})
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def test_async_matches_sync(self):
+        for query in ("kepcoDailyData?date=20250101", "kepcoDailyRangeData?startDate=20250101&endDate=20250102"):
+            with self.subTest(query=query):
+                expected = self.client.get(f"/ninja-api/powerSaving/{query}").json()
+                before = self.upstream_calls()
+                data = self.client.get(f"/ninja-api/powerSaving/async/{query}").json()
+
+                self.assertEqual(data["returnCode"], "ok")
+                self.assertEqual(data["data"], expected["data"])
+                # 동기 조회가 채운 응답 캐시를 그대로 사용
+                self.assertEqual(self.upstream_calls(), before)
+
+    def test_async_fetches_from_kepco(self):
+        before = self.upstream_calls()
+        data = self.client.get("/ninja-api/powerSaving/async/kepcoDailyData?date=20250103").json()
+
+        self.assertEqual(data["returnCode"], "ok")
+        self.assertEqual(self.upstream_calls() - before, len(self.customers()))
+        self.assertTrue(all(row["Status"] == "ok" for row in data["data"]))
@@ -0,0 +1,58 @@
+from datetime import datetime
+from unittest import mock
+
+from .. import fake_kepco
+from ..cache import TODAY_TTL, YESTERDAY_TTL, ttl_for
+from ..parsing import is_complete_day
+from .base import DAY_LP_ENDPOINT, FakeKepcoTestCase
+
+
+class ResponseCacheTests(FakeKepcoTestCase):
+    """응답 캐시 TTL과 final(하루 96개 구간이 모두 게시된 응답) 처리."""
+
+    def age(self, seconds):
+        """저장된 모든 응답의 fetched_at을 seconds초 앞당깁니다."""
+        self.cache._connect().execute("UPDATE kepco_response SET fetched_at = fetched_at - ?", (seconds,))
+
+    def test_ttl_for(self):
+        now = datetime(2026, 10, 17, 9, 0)
+        self.assertIsNone(ttl_for("20261015", now))
+        self.assertEqual(ttl_for("20261016", now), YESTERDAY_TTL)
+        self.assertEqual(ttl_for("20261017", now), TODAY_TTL)
+        self.assertEqual(ttl_for("202610171200", now), TODAY_TTL)
+
+    def test_today_entry_expires_unless_final(self):
+        today = datetime.now().strftime("%Y%m%d")
+        data = fake_kepco.day_lp_data("0000000001", today)
+        self.cache.set(DAY_LP_ENDPOINT, "0000000001", today, data)
+        self.cache.set(DAY_LP_ENDPOINT, "0000000002", today, data, final=True)
+        self.assertEqual(self.cache.get(DAY_LP_ENDPOINT, "0000000001", today), data)
+
+        self.age(TODAY_TTL + 1)
+
+        self.assertIsNone(self.cache.get(DAY_LP_ENDPOINT, "0000000001", today))
+        self.assertEqual(self.cache.get(DAY_LP_ENDPOINT, "0000000002", today), data)
+
+    def test_old_date_never_expires(self):
+        data = fake_kepco.day_lp_data("0000000001", "20250101")
+        self.cache.set(DAY_LP_ENDPOINT, "0000000001", "20250101", data)
+        self.age(30 * 24 * 3600)
+        self.assertEqual(self.cache.get(DAY_LP_ENDPOINT, "0000000001", "20250101"), data)
+
+    def test_client_marks_complete_day_final(self):
+        today = datetime.now().strftime("%Y%m%d")
+        self.kepco.get_day_lp_data("0000000001", today)
+        partial = fake_kepco.day_lp_data("0000000002", today)
+        del partial["dayLpDataInfoList"][0]["pwr_qty2400"]
+        with mock.patch.object(self.kepco, "get", return_value=partial):
+            self.kepco.get_day_lp_data("0000000002", today)
+
+        final = dict(self.cache._connect().execute("SELECT cust_no, final FROM kepco_response"))
+        self.assertEqual(final, {"0000000001": 1, "0000000002": 0})
+        self.assertFalse(is_complete_day(partial["dayLpDataInfoList"]))
+
+    def test_cached_response_skips_upstream(self):
+        self.kepco.get_day_lp_data("0000000001", "20250101")
+        before = self.upstream_calls()
+        self.kepco.get_day_lp_data("0000000001", "20250101")
+        self.assertEqual(self.upstream_calls(), before)
@@ -0,0 +1,69 @@
+from types import SimpleNamespace
+from unittest import mock
+
+from ..checkpoint import ReportCheckpoint
+from .base import FakeKepcoTestCase
+
+
+class ReportCheckpointTests(FakeKepcoTestCase):
+    """kepco_daily_report.py가 중단된 날짜를 저장된 고객 응답부터 이어서 조회하는지."""
+
+    DATE = "20250101"
+
+    def setUp(self):
+        super().setUp()
+        import kepco_daily_report
+
+        self.report = kepco_daily_report
+        self.checkpoint = ReportCheckpoint(f"{self.directory}/checkpoint.sqlite3")
+
+    def test_resume_fetches_only_missing_customers(self):
+        customers = self.customers()
+        get_day_lp_data = self.kepco.get_day_lp_data
+        calls = []
+
+        def crash_after(limit):
+            def fetch(cust_no, date, use_cache=True):
+                if len(calls) >= limit:
+                    raise RuntimeError("interrupted")
+                calls.append(cust_no)
+                return get_day_lp_data(cust_no, date, use_cache)
+            return fetch
+
+        with mock.patch.object(self.kepco, "get_day_lp_data", side_effect=crash_after(10)):
+            with self.assertRaises(RuntimeError):
+                self.report.fetch_day_lp_data(self.DATE, customers, self.checkpoint)
+        saved = self.checkpoint.load(self.DATE)
+        self.assertEqual(len(saved), len(calls))
+
+        calls.clear()
+        with mock.patch.object(self.kepco, "get_day_lp_data", side_effect=crash_after(len(customers))):
+            fetched = self.report.fetch_day_lp_data(self.DATE, customers, self.checkpoint)
+
+        self.assertEqual(sorted(calls), sorted(row.cust_no for row in customers if row.cust_no not in saved))
+        self.assertEqual([row.cust_no for row, _ in fetched], [row.cust_no for row in customers])
+        self.assertTrue(all(data.get("dayLpDataInfoList") for _, data in fetched))
+
+    def test_completed_day_skipped_only_in_range_mode(self):
+        self.checkpoint.mark_done(self.DATE, ["kepco_daily_report.xlsx"])
+        args = self.report.parse_args(["--start", self.DATE, "--end", self.DATE])
+        self.assertTrue(args.resume)
+        with mock.patch.object(self.report, "generate_reports") as generate:
+            self.assertTrue(self.report.run_day(self.DATE, args, self.checkpoint))
+        generate.assert_not_called()
+
+        self.assertFalse(self.report.parse_args([]).resume)
+        self.assertFalse(self.report.parse_args(["--date", self.DATE]).resume)
+
+    def test_day_not_marked_done_when_email_fails(self):
+        args = SimpleNamespace(force=False, output_dir=None, no_email=False)
+        attachments = [(f"{prefix}.xlsx", b"") for prefix, _, _ in self.report.REPORTS]
+        with mock.patch.object(self.report, "generate_reports", return_value=attachments), \
+                mock.patch.object(self.report, "send_email_with_attachments", return_value=False):
+            self.assertFalse(self.report.run_day(self.DATE, args, self.checkpoint))
+        self.assertFalse(self.checkpoint.is_done(self.DATE))
+
+        with mock.patch.object(self.report, "generate_reports", return_value=attachments), \
+                mock.patch.object(self.report, "send_email_with_attachments", return_value=True):
+            self.assertTrue(self.report.run_day(self.DATE, args, self.checkpoint))
+        self.assertTrue(self.checkpoint.is_done(self.DATE))
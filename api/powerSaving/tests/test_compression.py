@@ -0,0 +1,49 @@
+import gzip
+import json
+
+from django.test import SimpleTestCase
+
+from ..compression import choose_encoding
+from .base import FakeKepcoTestCase
+
+
+class ChooseEncodingTests(SimpleTestCase):
+
+    def test_quality_and_wildcards(self):
+        self.assertEqual(choose_encoding("gzip"), "gzip")
+        self.assertIsNone(choose_encoding(""))
+        self.assertIsNone(choose_encoding("gzip;q=0, identity"))
+        self.assertEqual(choose_encoding("deflate, gzip;q=0.5"), "gzip")
+        self.assertIsNotNone(choose_encoding("*"))
+
+
+class CompressedResponseTests(FakeKepcoTestCase):
+    """Accept-Encoding에 맞춰 JSON / NDJSON 응답을 압축하고 compact 형식이 같은 값을 담는지."""
+
+    PATH = "/ninja-api/powerSaving/kepcoDailyData?date=20250101"
+
+    def test_json_is_gzipped_with_weak_etag(self):
+        plain = self.client.get(self.PATH)
+        compressed = self.client.get(self.PATH, HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertEqual(compressed["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", compressed["Vary"])
+        self.assertEqual(gzip.decompress(compressed.content), plain.content)
+        self.assertEqual(compressed["ETag"], "W/" + plain["ETag"])
+        self.assertEqual(self.client.get(self.PATH, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=compressed["ETag"]).status_code, 304)
+
+    def test_ndjson_stream_is_gzipped(self):
+        path = self.PATH + "&returnType=ndjson"
+        plain = b"".join(self.client.get(path).streaming_content)
+        response = self.client.get(path, HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        lines = gzip.decompress(b"".join(response.streaming_content)).splitlines()
+        self.assertEqual(sorted(lines), sorted(plain.splitlines()))
+
+    def test_compact_layout_matches_json(self):
+        rows = self.client.get(self.PATH).json()["data"]
+        compact = json.loads(self.client.get(self.PATH + "&returnType=compact").content)
+
+        self.assertEqual(compact["columns"], list(rows[0]))
+        self.assertEqual([dict(zip(compact["columns"], values)) for values in compact["data"]], rows)
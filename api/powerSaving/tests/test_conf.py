@@ -0,0 +1,48 @@
+import os
+import tempfile
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, override_settings
+
+from ..cache import ResponseCache
+from ..checkpoint import ReportCheckpoint
+from ..conf import get_settings, load_settings
+from ..customers import get_registry
+from ..kepco_client import KepcoClient
+
+
+class SettingsTests(SimpleTestCase):
+    """settings.KEPCO / KEPCO_* 환경 변수 우선순위와 override_settings 반영."""
+
+    def test_environment_overrides_django_settings(self):
+        with override_settings(KEPCO={"BASE_URL": "http://settings/OpenAPI/", "SERVICE_KEYS": ["a", "b"]}):
+            config = load_settings({"KEPCO_SERVICE_KEYS": "x, y,"})
+        self.assertEqual(config.base_url, "http://settings/OpenAPI")
+        self.assertEqual(config.service_keys, ("x", "y"))
+
+        with self.assertRaises(ImproperlyConfigured):
+            load_settings({"KEPCO_BASE_URL": "ftp://kepco"})
+        with self.assertRaises(ImproperlyConfigured):
+            load_settings({"KEPCO_SERVICE_KEYS": " , "})
+
+    def test_override_settings_reaches_every_setting(self):
+        with tempfile.TemporaryDirectory() as directory:
+            roster = os.path.join(directory, "roster.csv")
+            with open(roster, "w", encoding="utf-8") as f:
+                f.write("구분,고객번호,구분1,본부명,센터,팀,국사\n국사,0000000001,A,본부,센터,팀,국사\n")
+            paths = {
+                "BASE_URL": "http://127.0.0.1:9/OpenAPI",
+                "CUSTOMER_CSV": roster,
+                "CACHE_PATH": os.path.join(directory, "cache.sqlite3"),
+                "CHECKPOINT_PATH": os.path.join(directory, "checkpoint.sqlite3"),
+            }
+            with override_settings(KEPCO=paths):
+                client = KepcoClient()
+                self.addCleanup(client.close)
+                self.assertEqual(client.base_url, paths["BASE_URL"])
+                self.assertEqual([row.cust_no for row in get_registry().all()], ["0000000001"])
+                self.assertEqual(ResponseCache().path, paths["CACHE_PATH"])
+                self.assertEqual(ReportCheckpoint().path, paths["CHECKPOINT_PATH"])
+
+        self.assertNotEqual(get_settings().customer_csv, roster)
+        self.assertNotEqual(get_registry().path, roster)
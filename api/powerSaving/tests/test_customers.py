@@ -0,0 +1,69 @@
+import os
+import shutil
+import tempfile
+
+from django.test import SimpleTestCase
+
+from ..customers import CustomerRegistry, get_registry
+from .base import FakeKepcoTestCase
+
+ROSTER = """구분,고객번호,구분1,본부명,센터,팀,국사
+국사,0000000001,A,경기본부,수원센터,수원운용팀,수원국사
+국사,0000000002,A,경기본부,수원센터,수원운용팀,영통국사
+국사,0000000003,B,경기본부,안양센터,안양운용팀,안양국사
+국사,,B,경기본부,안양센터,안양운용팀,빈고객번호
+국사,0000000004,B,경기본부,안양센터,안양운용팀,평촌국사
+"""
+
+
+class CustomerRegistryTests(SimpleTestCase):
+    """CSV를 한 번 읽어 만든 인덱스로 고객을 CSV 순서대로 찾는지, 파일이 바뀌면 다시 읽는지."""
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, True)
+        self.path = os.path.join(directory, "roster.csv")
+        self.write(ROSTER)
+        self.registry = CustomerRegistry(self.path)
+
+    def write(self, text):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def cust_nos(self, records):
+        return [record.cust_no for record in records]
+
+    def test_filters_keep_csv_order(self):
+        self.assertEqual(self.cust_nos(self.registry.all()), ["0000000001", "0000000002", "0000000003", "0000000004"])
+        self.assertEqual(self.cust_nos(self.registry.filter(team="안양운용팀")), ["0000000003", "0000000004"])
+        self.assertEqual(self.cust_nos(self.registry.filter(guksa="평촌국사, 수원국사")), ["0000000001", "0000000004"])
+        self.assertEqual(self.cust_nos(self.registry.filter(center="수원센터", guksa="영통국사,안양국사")), ["0000000002"])
+        self.assertEqual(self.registry.filter(team="없는팀"), [])
+        self.assertEqual(self.registry.get("0000000003").guksa, "안양국사")
+        self.assertIsNone(self.registry.get("9999999999"))
+
+    def test_reloads_when_file_changes(self):
+        self.assertEqual(len(self.registry.all()), 4)
+        self.write(ROSTER + "국사,0000000005,B,경기본부,안양센터,안양운용팀,의왕국사\n")
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        self.assertEqual(self.registry.get("0000000005").guksa, "의왕국사")
+        self.assertEqual(len(self.registry.filter(team="안양운용팀")), 3)
+
+    def test_get_registry_is_shared_per_path(self):
+        self.assertIs(get_registry(self.path), get_registry(self.path))
+        self.assertIsNot(get_registry(self.path), get_registry())
+
+
+class CustomerFilterEndpointTests(FakeKepcoTestCase):
+
+    def test_team_filter_fetches_only_that_team(self):
+        team = get_registry().all()[0].team
+        expected = [row.cust_no for row in get_registry().filter(team=team)]
+        before = self.upstream_calls()
+
+        data = self.client.get(f"/ninja-api/powerSaving/kepcoDailyData?date=20250101&team={team}").json()
+
+        self.assertEqual([row["Customer Number"] for row in data["data"]], expected)
+        self.assertEqual(self.upstream_calls() - before, len(set(expected)))
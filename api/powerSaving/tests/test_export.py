@@ -0,0 +1,58 @@
+import io
+
+import pandas as pd
+import pyarrow as pa
+from django.test import SimpleTestCase
+from openpyxl import load_workbook
+
+from ..export import write_xlsx
+from .base import FakeKepcoTestCase
+
+
+class XlsxExportTests(SimpleTestCase):
+    """write-only 워크북이 헤더, 값(NaN은 빈 셀)과 표 범위를 기록하는지."""
+
+    def test_write_xlsx(self):
+        df = pd.DataFrame({"Customer Number": ["0000000001", "0000000002"], "Power Usage": [1.5, float("nan")]})
+        output = io.BytesIO()
+        write_xlsx(df, output)
+
+        ws = load_workbook(output).active
+        self.assertEqual([list(row) for row in ws.iter_rows(values_only=True)],
+                         [["Customer Number", "Power Usage"], ["0000000001", 1.5], ["0000000002", None]])
+        self.assertEqual(ws.tables["DataTable"].ref, "A1:B3")
+
+
+class XlsxEndpointTests(FakeKepcoTestCase):
+
+    def test_daily_xlsx_download(self):
+        response = self.client.get("/ninja-api/powerSaving/kepcoDailyData?date=20250101&returnType=xlsx")
+        rows = self.client.get("/ninja-api/powerSaving/kepcoDailyData?date=20250101").json()["data"]
+
+        self.assertIn('filename="kepco_daily_data_20250101.xlsx"', response["Content-Disposition"])
+        ws = load_workbook(io.BytesIO(b"".join(response.streaming_content))).active
+        values = list(ws.iter_rows(values_only=True))
+        self.assertEqual(list(values[0]), list(rows[0]))
+        self.assertEqual([row[0] for row in values[1:]], [row["Customer Number"] for row in rows])
+
+
+class ColumnarEndpointTests(FakeKepcoTestCase):
+    """returnType=csv/parquet/arrow가 json과 같은 행을 돌려주는지."""
+
+    PATH = "/ninja-api/powerSaving/kepcoDailyData?date=20250101"
+
+    def download(self, return_type):
+        response = self.client.get(f"{self.PATH}&returnType={return_type}")
+        self.assertEqual(response.status_code, 200)
+        return io.BytesIO(b"".join(response.streaming_content))
+
+    def test_columnar_formats_match_json(self):
+        expected = pd.DataFrame(self.client.get(self.PATH).json()["data"])
+        frames = {
+            "csv": pd.read_csv(self.download("csv"), dtype={"Customer Number": str}),
+            "parquet": pd.read_parquet(self.download("parquet")),
+            "arrow": pa.ipc.open_stream(self.download("arrow")).read_pandas(),
+        }
+        for return_type, frame in frames.items():
+            with self.subTest(returnType=return_type):
+                pd.testing.assert_frame_equal(frame, expected, check_dtype=False)
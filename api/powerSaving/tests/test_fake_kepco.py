@@ -0,0 +1,71 @@
+import json
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+import requests
+
+from .. import bench, fake_kepco
+from ..customers import get_registry
+from ..parsing import SLOT_TIMES, is_complete_day
+from .base import FakeKepcoTestCase
+
+
+class FakeKepcoServerTests(FakeKepcoTestCase):
+    """대역 서버가 실제 API와 같은 형태로, 같은 요청에 같은 값을 응답하는지."""
+
+    def get(self, path, **params):
+        return requests.get(f"{self.server.base_url}/{path}", params=params, timeout=5)
+
+    def test_day_lp_data_is_a_complete_deterministic_day(self):
+        data = fake_kepco.day_lp_data("0000000001", "20250101", meters=2)
+        records = data["dayLpDataInfoList"]
+
+        self.assertEqual(len(records), 2)
+        self.assertEqual([key[-4:] for key in records[0] if key.startswith("pwr_qty")], list(SLOT_TIMES))
+        self.assertTrue(is_complete_day(records))
+        self.assertEqual(fake_kepco.day_lp_data("0000000001", "20250101", meters=2), data)
+        self.assertNotEqual(fake_kepco.day_lp_data("0000000001", "20250102", meters=2), data)
+
+    def test_endpoints_answer_like_kepco_and_count_calls(self):
+        before = self.upstream_calls()
+        day = self.get("getDayLpData.do", custNo="0000000001", date="20250101")
+        minute = self.get("getMinuteLpData.do", custNo="0000000001", dateTime="202501011200")
+
+        self.assertEqual(day.json(), fake_kepco.day_lp_data("0000000001", "20250101"))
+        self.assertEqual(minute.json()["minuteLpDataInfoList"][0]["mr_hhmi"], "1200")
+        self.assertEqual(self.upstream_calls() - before, 2)
+        self.assertEqual(requests.get(self.server.base_url.rsplit("/", 1)[0] + "/stats", timeout=5).json()["requests"],
+                         self.upstream_calls())
+        self.assertEqual(self.get("unknown.do", custNo="0000000001").status_code, 404)
+
+    def test_error_rate_returns_server_errors(self):
+        self.server.error_rate = 1.0
+        self.addCleanup(setattr, self.server, "error_rate", 0.0)
+        statuses = {self.get("getDayLpData.do", custNo="0000000001", date="20250101").status_code for _ in range(2)}
+        self.assertEqual(statuses, {500, 503})
+
+
+class BenchTests(FakeKepcoTestCase):
+    """bench_kepco 가상 고객 목록과 결과 출력."""
+
+    def test_roster_repeats_template_organisation(self):
+        template = get_registry().all()
+        with tempfile.TemporaryDirectory() as directory:
+            roster = pd.read_csv(bench.write_roster(len(template) + 5, Path(directory) / "roster.csv"), dtype=str)
+
+        self.assertEqual(len(roster), len(template) + 5)
+        self.assertEqual(roster["고객번호"].nunique(), len(roster))
+        self.assertEqual(list(roster["국사"][:len(template)]), [row.guksa for row in template])
+        self.assertEqual(list(roster["국사"][len(template):]), [row.guksa for row in template[:5]])
+
+    def test_summary_and_format_result(self):
+        self.assertEqual(bench._summary(json.dumps({"returnCode": "ok", "data": [1, 2]}).encode()), ("ok", 2))
+        self.assertEqual(bench._summary(b"a,b\n1,2\n"), ("ok", None))
+
+        result = {
+            "case": "report", "customers": 34, "cold_s": 1.0, "warm_s": 0.5, "customers_per_s": 34.0, "calls": 34,
+            "rows": 1, "bytes": 2048, "peak_rss_mb": 100.0, "status": "missing",
+        }
+        self.assertTrue(bench.format_result(result).endswith("missing"))
+        self.assertIn("failed", bench.format_result({"case": "daily", "customers": 34, "status": "failed", "error": ["x"]}))
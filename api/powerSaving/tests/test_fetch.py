@@ -0,0 +1,21 @@
+from .. import fake_kepco
+from ..customers import get_registry
+from .base import FakeKepcoTestCase
+
+
+class RowOrderTests(FakeKepcoTestCase):
+    """고객별 동시 조회(fan-out) 결과가 응답 지연과 관계없이 CSV 순서를 유지하는지."""
+
+    def setUp(self):
+        super().setUp()
+        # 응답 순서가 요청 순서와 달라지도록 지연을 크게 흔듦
+        self.server.latency = 0.02
+        self.server.jitter = 3
+        self.addCleanup(setattr, self.server, "jitter", fake_kepco.DEFAULT_JITTER)
+
+    def test_daily_rows_keep_csv_order(self):
+        response = self.client.get("/ninja-api/powerSaving/kepcoDailyData?date=20250101")
+        data = response.json()
+
+        self.assertEqual(data["returnCode"], "ok")
+        self.assertEqual([row["Customer Number"] for row in data["data"]], [row.cust_no for row in get_registry().all()])
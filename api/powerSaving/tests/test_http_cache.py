@@ -0,0 +1,30 @@
+from ..http_cache import CLOSED_MAX_AGE
+from .base import FakeKepcoTestCase
+
+
+class ConditionalRequestTests(FakeKepcoTestCase):
+    """ETag / If-None-Match(304)와 Cache-Control 처리."""
+
+    def test_etag_and_not_modified(self):
+        path = "/ninja-api/powerSaving/kepcoDailyData?date=20250101"
+        first = self.client.get(path)
+        etag = first["ETag"]
+        self.assertEqual(first.status_code, 200)
+        self.assertTrue(etag)
+
+        second = self.client.get(path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.content, b"")
+
+        other = self.client.get(path, HTTP_IF_NONE_MATCH='"something-else"')
+        self.assertEqual(other.status_code, 200)
+        self.assertEqual(other["ETag"], etag)
+
+    def test_etag_depends_on_format(self):
+        json_etag = self.client.get("/ninja-api/powerSaving/kepcoDailyData?date=20250101")["ETag"]
+        csv_etag = self.client.get("/ninja-api/powerSaving/kepcoDailyData?date=20250101&returnType=csv")["ETag"]
+        self.assertNotEqual(json_etag, csv_etag)
+
+    def test_closed_date_is_cacheable(self):
+        response = self.client.get("/ninja-api/powerSaving/kepcoDailyData?date=20250101")
+        self.assertIn(f"max-age={CLOSED_MAX_AGE}", response["Cache-Control"])
@@ -0,0 +1,83 @@
+import asyncio
+import os
+from datetime import datetime, timedelta
+
+from ..customers import CustomerRegistry
+from ..live import INITIAL_SLOTS, LivePoller, LiveWindow, date_time_param, last_slot
+from .base import FakeKepcoTestCase
+
+ROSTER = """구분,고객번호,구분1,본부명,센터,팀,국사
+국사,0000000001,A,경기본부,수원센터,수원운용팀,수원국사
+국사,0000000002,A,경기본부,수원센터,수원운용팀,영통국사
+"""
+
+
+class LivePollerTests(FakeKepcoTestCase):
+    """폴러가 새 15분 구간만 조회하고, 워커 간에는 leader 하나만 KEPCO를 조회해 같은 seq로 공유하는지."""
+
+    NOW = datetime(2025, 1, 1, 12, 5)
+
+    def setUp(self):
+        super().setUp()
+        path = os.path.join(self.directory, "roster.csv")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(ROSTER)
+        self.registry = CustomerRegistry(path)
+
+    def poller(self, client=None):
+        # 스레드는 시작하지 않고 poll_once로 회차를 직접 실행 (leader 임대와 feed는 임시 응답 캐시 파일에 있음)
+        return LivePoller(client=client or self.kepco, registry=self.registry)
+
+    def test_slot_helpers(self):
+        self.assertEqual(last_slot(self.NOW), datetime(2025, 1, 1, 12, 0))
+        self.assertEqual(date_time_param(datetime(2025, 1, 2, 0, 0)), "202501012400")
+        self.assertEqual(date_time_param(datetime(2025, 1, 1, 12, 15)), "202501011215")
+
+    def test_polls_only_new_slots(self):
+        poller = self.poller()
+        before = self.upstream_calls()
+
+        self.assertEqual(poller.poll_once(self.NOW), 2 * INITIAL_SLOTS)
+        self.assertEqual(self.upstream_calls() - before, 2 * INITIAL_SLOTS)
+        self.assertEqual(poller.poll_once(self.NOW), 0)
+        self.assertEqual(self.upstream_calls() - before, 2 * INITIAL_SLOTS)
+
+        self.assertEqual(poller.poll_once(self.NOW + timedelta(minutes=15)), 2)
+        seq, records, truncated = poller.window.since(0, {"0000000002"})
+        self.assertEqual(seq, 2)
+        self.assertFalse(truncated)
+        self.assertEqual([record["Time"] for record in records], ["1115", "1130", "1145", "1200", "1215"])
+
+    def test_followers_share_leader_rows_and_seq(self):
+        leader = self.poller()
+        follower = self.poller(self.make_client())
+        before = self.upstream_calls()
+
+        leader.poll_once(self.NOW)
+        self.assertEqual(follower.poll_once(self.NOW), 0)
+
+        self.assertEqual(self.upstream_calls() - before, 2 * INITIAL_SLOTS)
+        self.assertEqual(follower.window.since(0), leader.window.since(0))
+
+
+class LiveWindowTests(FakeKepcoTestCase):
+    """구독 창의 long-poll 대기와 동기 엔드포인트의 비동기 경로 안내."""
+
+    def test_collect_waits_for_matching_customer(self):
+        window = LiveWindow()
+        record = {"Customer Number": "0000000001", "Time": "1200"}
+
+        async def collect():
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.05, window.publish, [(datetime.now(), {**record, "Customer Number": "0000000002"})])
+            loop.call_later(0.1, window.publish, [(datetime.now(), record)])
+            return await window.acollect(0, {"0000000001"}, timeout=5)
+
+        self.assertEqual(asyncio.run(collect()), (2, [record], False))
+        self.assertEqual(asyncio.run(window.acollect(2, timeout=0.01)), (2, [], False))
+
+    def test_sync_live_data_redirects_to_async(self):
+        response = self.client.get("/ninja-api/powerSaving/liveData?since=3&team=수원운용팀")
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(response["Location"].startswith("/ninja-api/powerSaving/async/liveData?"))
+        self.assertIn("since=3", response["Location"])
@@ -0,0 +1,21 @@
+from .base import FakeKepcoTestCase
+
+
+class MetricsTests(FakeKepcoTestCase):
+    """Server-Timing 헤더와 /metrics 지표."""
+
+    def test_server_timing_lists_stages_and_kepco_calls(self):
+        response = self.client.get("/ninja-api/powerSaving/kepcoDailyData?date=20250104")
+        timing = response["Server-Timing"]
+
+        for name in ("fetch", "frame", "serialize", "total"):
+            self.assertRegex(timing, rf"\b{name};dur=[0-9.]+")
+        self.assertIn(f'desc="{len(self.customers())} calls"', timing)
+
+    def test_metrics_endpoint_exposes_counters(self):
+        self.client.get("/ninja-api/powerSaving/kepcoDailyData?date=20250104")
+        body = self.client.get("/metrics").content.decode()
+
+        self.assertIn("# TYPE kepco_upstream_seconds histogram", body)
+        self.assertRegex(body, r'powersaving_request_seconds_count\{view="[^"]+",status="200"\} [1-9]')
+        self.assertRegex(body, r'powersaving_stage_seconds_count\{view="[^"]+",stage="fetch"\} [1-9]')
@@ -0,0 +1,54 @@
+import math
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from .. import fake_kepco
+from ..parsing import SLOT_TIMES, daily_total, interval_frame, is_complete_day, lp_matrix, slot_totals
+
+
+def baseline_total(day_lp_data):
+    """기존 api.py의 per-key 합계 (int/float 값만 더함)."""
+    return sum(
+        value for record in day_lp_data for key, value in record.items()
+        if key.startswith("pwr_qty") and isinstance(value, (int, float))
+    )
+
+
+class LpMatrixTests(SimpleTestCase):
+    """pwr_qtyHHMM 값 행렬 변환이 기존 isinstance(value, (int, float)) 합계와 같은지."""
+
+    MIXED = [
+        {"meterNo": "M1", "pwr_qty0015": 1, "pwr_qty0030": "1.5", "pwr_qty0045": None, "pwr_qty0100": 2.5},
+        {"meterNo": "M2", "pwr_qty0015": "n/a", "pwr_qty0030": 3.0, "pwr_qty0045": 4},
+    ]
+
+    def test_mixed_record_keeps_only_numbers(self):
+        meters, times, values = lp_matrix(self.MIXED)
+
+        self.assertEqual(meters, ["M1", "M2"])
+        self.assertEqual(times, ["0015", "0030", "0045", "0100"])
+        np.testing.assert_array_equal(values, [[1, np.nan, np.nan, 2.5], [np.nan, 3.0, 4, np.nan]])
+        self.assertEqual(daily_total(self.MIXED), baseline_total(self.MIXED))
+
+    def test_numeric_strings_are_ignored_without_other_non_numbers(self):
+        # 다른 값이 모두 float로 변환되는 레코드에서도 "1.5"는 숫자로 세지 않음
+        records = [{"meterNo": "M1", "pwr_qty0015": "1.5", "pwr_qty0030": None, "pwr_qty0045": 2}]
+        self.assertTrue(math.isnan(lp_matrix(records)[2][0, 0]))
+        self.assertEqual(daily_total(records), baseline_total(records))
+
+    def test_interval_frame_drops_missing_values(self):
+        frame = interval_frame(self.MIXED)
+        self.assertEqual(list(zip(frame["MeterNo"], frame["Time"], frame["Power Usage"])),
+                         [("M1", "0015", 1.0), ("M1", "0100", 2.5), ("M2", "0030", 3.0), ("M2", "0045", 4.0)])
+
+    def test_slot_totals_and_complete_day(self):
+        records = fake_kepco.day_lp_data("0000000001", "20250101", meters=2)["dayLpDataInfoList"]
+        totals = slot_totals(records)
+
+        self.assertEqual(len(totals), len(SLOT_TIMES))
+        self.assertAlmostEqual(float(totals.sum()), baseline_total(records))
+        self.assertTrue(is_complete_day(records))
+        self.assertFalse(is_complete_day(self.MIXED))
+        self.assertFalse(is_complete_day([]))
+        self.assertTrue(np.isnan(slot_totals(self.MIXED)[SLOT_TIMES.index("2400")]))
@@ -0,0 +1,43 @@
+from unittest import mock
+
+from .. import fake_kepco, planner
+from ..customers import get_registry
+from ..planner import RangeTooLarge, plan_range
+from .base import DAY_LP_ENDPOINT, FakeKepcoTestCase
+
+
+class RangePlanTests(FakeKepcoTestCase):
+    """kepcoDailyRangeData의 (고객, 날짜) 작업 계획과 결과 순서."""
+
+    DATES = ["20250101", "20250102", "20250103"]
+
+    def test_plan_dedups_customers_and_skips_cached_calls(self):
+        cust_nos = [row.cust_no for row in get_registry().all()]
+        self.cache.set(DAY_LP_ENDPOINT, cust_nos[0], self.DATES[0], fake_kepco.day_lp_data(cust_nos[0], self.DATES[0]))
+
+        plan = plan_range(cust_nos + cust_nos[:2], self.DATES, cache=self.cache)
+
+        unique = list(dict.fromkeys(cust_nos))
+        self.assertEqual(plan.fetch_keys, [(cust_no, date) for date in self.DATES for cust_no in unique])
+        self.assertEqual(plan.upstream_calls, len(plan.fetch_keys) - 1)
+
+    def test_plan_rejects_too_many_days_or_calls(self):
+        with self.assertRaises(RangeTooLarge):
+            plan_range(["0000000001"], [f"2025{i:04d}" for i in range(planner.MAX_RANGE_DAYS + 1)])
+        with mock.patch.object(planner, "MAX_FETCH_CALLS", 2), self.assertRaises(RangeTooLarge):
+            plan_range(["0000000001", "0000000002"], self.DATES)
+
+        data = self.client.get("/ninja-api/powerSaving/kepcoDailyRangeData?startDate=20250101&endDate=20250601").json()
+        self.assertEqual(data["returnCode"], "le")
+
+    def test_range_rows_are_date_then_csv_order(self):
+        self.server.latency = 0.02
+        self.server.jitter = 3
+        self.addCleanup(setattr, self.server, "jitter", fake_kepco.DEFAULT_JITTER)
+
+        response = self.client.get("/ninja-api/powerSaving/kepcoDailyRangeData?startDate=20250101&endDate=20250103")
+        data = response.json()
+
+        expected = [(date, row.cust_no) for date in ("2025-01-01", "2025-01-02", "2025-01-03") for row in get_registry().all()]
+        self.assertEqual(data["returnCode"], "ok")
+        self.assertEqual([(row["Date"], row["Customer Number"]) for row in data["data"]], expected)
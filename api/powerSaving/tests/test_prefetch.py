@@ -0,0 +1,38 @@
+from unittest import mock
+
+from .. import fake_kepco
+from ..prefetch import prefetch_day, yesterday
+from .base import FakeKepcoTestCase
+
+
+class PrefetchTests(FakeKepcoTestCase):
+    """prefetch_day가 어제 응답을 캐시에 채우고, 완성된 고객은 다음 회차에서 건너뛰며 빈 구간은 gap으로 남기는지."""
+
+    def test_prefetch_warms_cache_for_daily_request(self):
+        cust_nos = list(dict.fromkeys(row.cust_no for row in self.customers()))
+        fetched, gaps = prefetch_day(yesterday())
+        self.assertEqual((fetched, gaps), (len(cust_nos), {}))
+
+        before = self.upstream_calls()
+        data = self.client.get("/ninja-api/powerSaving/kepcoDailyData").json()
+        self.assertEqual(data["returnCode"], "ok")
+        self.assertEqual(self.upstream_calls(), before)
+
+        # final로 캐시된 고객은 다시 조회하지 않음
+        self.assertEqual(prefetch_day(yesterday()), (0, {}))
+
+    def test_incomplete_customer_is_a_gap_until_complete(self):
+        date = yesterday()
+        cust_no = self.customers()[0].cust_no
+        partial = fake_kepco.day_lp_data(cust_no, date)
+        del partial["dayLpDataInfoList"][0]["pwr_qty2400"]
+        get = self.kepco.get
+
+        def get_partial(endpoint, params):
+            return partial if params["custNo"] == cust_no else get(endpoint, params)
+
+        with mock.patch.object(self.kepco, "get", side_effect=get_partial):
+            fetched, gaps = prefetch_day(date)
+        self.assertEqual(gaps, {cust_no: "incomplete"})
+
+        self.assertEqual(prefetch_day(date), (1, {}))
@@ -0,0 +1,42 @@
+import io
+
+from openpyxl import load_workbook
+
+from .base import FakeKepcoTestCase
+
+
+class ReportGenerationTests(FakeKepcoTestCase):
+    """kepco_daily_report.py가 고객별 한 번의 조회로 두 보고서를 프로세스 풀에서 만드는지."""
+
+    DATE = "20250101"
+
+    def setUp(self):
+        super().setUp()
+        import kepco_daily_report
+
+        self.report = kepco_daily_report
+
+    def test_both_reports_from_one_fetch(self):
+        customers = self.customers()
+        before = self.upstream_calls()
+        with self.report.report_pool() as pool:
+            attachments = self.report.generate_reports(self.DATE, customers, pool=pool)
+
+        self.assertEqual(self.upstream_calls() - before, len(customers))
+        self.assertEqual([name.split(f"_{self.DATE}_")[0] for name, _ in attachments],
+                         [prefix for prefix, _, _ in self.report.REPORTS])
+        daily, min15 = (load_workbook(io.BytesIO(content)).active for _, content in attachments)
+        self.assertEqual(daily.max_row, len(customers) + 1)
+        self.assertEqual(min15.max_row, len(customers) * 96 + 1)
+        self.assertEqual([cell.value for cell in min15[1]], self.report.INTERVAL_COLUMNS)
+
+    def test_failed_customer_is_reported_in_status(self):
+        customers = self.customers()[:3]
+        fetched = [(customers[0], RuntimeError("boom")), (customers[1], {"dayLpDataInfoList": []}),
+                   (customers[2], self.kepco.get_day_lp_data(customers[2].cust_no, self.DATE))]
+
+        daily = self.report.daily_report_frame(self.DATE, fetched)
+        min15 = self.report.min15_report_frame(self.DATE, fetched)
+
+        self.assertEqual(list(daily["Status"]), ["error: boom", "no data", "ok"])
+        self.assertEqual(set(min15["Customer Number"]), {customers[2].cust_no})
@@ -0,0 +1,63 @@
+from unittest import mock
+
+import pandas as pd
+
+from .. import fake_kepco
+from ..aggregation import aggregate, interval_long
+from ..parsing import slot_totals
+from ..planner import plan_range
+from ..rollups import rollup_aggregate
+from ..store import ingest, load_days, sync_customers
+from .base import FakeKepcoTestCase
+
+
+class RollupTests(FakeKepcoTestCase):
+    """저장소(LoadProfile) 롤업 집계가 15분 원본 집계와 같은지, complete가 아닌 날짜는 KEPCO에서 다시 가져오는지."""
+
+    DATES = ["20250101", "20250102", "20250103"]
+
+    def setUp(self):
+        super().setUp()
+        customers = sync_customers()
+        self.tasks = [(customer, date) for date in self.DATES for customer in customers.values()]
+        saved, failed = ingest(self.tasks, log=lambda message: None)
+        self.assertEqual(failed, [])
+
+    def raw_aggregate(self, customers, group_by, bucket):
+        stored = load_days([row.cust_no for row in customers], self.DATES)
+        days = [
+            (row, date, slot_totals(stored[(row.cust_no, date)]["dayLpDataInfoList"]))
+            for date in self.DATES for row in customers
+        ]
+        return aggregate(interval_long(days), group_by, bucket)
+
+    def test_rollups_match_raw_aggregation(self):
+        customers = self.customers()
+        for group_by in ("all", "team", "customer"):
+            for bucket in ("hour", "day", "month"):
+                with self.subTest(group_by=group_by, bucket=bucket):
+                    rollup = rollup_aggregate(customers, self.DATES, group_by, bucket)
+                    self.assertIsNotNone(rollup)
+                    raw = self.raw_aggregate(customers, group_by, bucket)
+                    pd.testing.assert_frame_equal(
+                        rollup.reset_index(drop=True), raw.reset_index(drop=True), check_dtype=False, check_exact=False,
+                    )
+
+    def test_aggregate_endpoint_uses_store_without_kepco(self):
+        before = self.upstream_calls()
+        data = self.client.get("/ninja-api/powerSaving/aggregate?startDate=20250101&endDate=20250103&groupBy=team&bucket=day").json()
+        self.assertEqual(data["returnCode"], "ok")
+        self.assertEqual(data["missing"], [])
+        self.assertEqual(self.upstream_calls(), before)
+
+    def test_incomplete_day_is_fetched_again(self):
+        customer, date = self.tasks[0]
+        partial = fake_kepco.day_lp_data(customer.cust_no, date)
+        del partial["dayLpDataInfoList"][0]["pwr_qty1200"]
+        with mock.patch.object(self.kepco, "get_day_lp_data", return_value=partial):
+            ingest([(customer, date)], log=lambda message: None)
+
+        self.assertNotIn((customer.cust_no, date), load_days([customer.cust_no], [date]))
+        plan = plan_range([row.cust_no for row in self.customers()], self.DATES)
+        self.assertEqual(plan.fetch_keys, [(customer.cust_no, date)])
+        self.assertIsNone(rollup_aggregate(self.customers(), self.DATES, "team", "day"))
@@ -0,0 +1,56 @@
+import threading
+import time
+
+from .base import FakeKepcoTestCase
+
+
+class SingleFlightTests(FakeKepcoTestCase):
+    """같은 (endpoint, custNo, date)의 동시 cache miss가 KEPCO 호출 하나를 공유하는지 (스레드와 워커 간)."""
+
+    def fetch_concurrently(self, clients, n):
+        barrier = threading.Barrier(n)
+        results = [None] * n
+
+        def run(i):
+            barrier.wait()
+            results[i] = clients[i % len(clients)].get_day_lp_data("0000000001", "20250101")
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_concurrent_misses_make_one_call(self):
+        self.server.latency = 0.2
+        before = self.upstream_calls()
+
+        results = self.fetch_concurrently([self.kepco], 16)
+
+        self.assertEqual(self.upstream_calls() - before, 1)
+        self.assertTrue(all(result == results[0] for result in results))
+
+    def test_concurrent_misses_across_workers_make_one_call(self):
+        self.server.latency = 0.2
+        before = self.upstream_calls()
+
+        # 클라이언트마다 프로세스 내부 single-flight가 따로 있으므로 워커 간 조회 임대로 합쳐져야 함
+        results = self.fetch_concurrently([self.kepco, self.make_client(), self.make_client()], 12)
+
+        self.assertEqual(self.upstream_calls() - before, 1)
+        self.assertTrue(all(result == results[0] for result in results))
+        self.assertEqual(self.cache._connect().execute("SELECT COUNT(*) FROM kepco_lease").fetchone()[0], 0)
+
+    def test_other_keys_do_not_wait(self):
+        self.server.latency = 0.3
+        started = time.monotonic()
+        threads = [
+            threading.Thread(target=self.make_client().get_day_lp_data, args=(f"00000000{i:02d}", "20250101"))
+            for i in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertLess(time.monotonic() - started, 8 * 0.3)
@@ -0,0 +1,49 @@
+from unittest import mock
+
+from django.db import DatabaseError
+
+from .. import fake_kepco
+from ..models import LoadProfile, StoredDay
+from ..parsing import SLOT_TIMES
+from ..store import ingest, load_days, save_days, sync_customers
+from .base import FakeKepcoTestCase
+
+
+class LoadProfileStoreTests(FakeKepcoTestCase):
+    """ingest가 KEPCO 응답을 LoadProfile에 저장하고 load_days가 같은 응답 형태로 돌려주는지."""
+
+    DATE = "20250101"
+
+    def setUp(self):
+        super().setUp()
+        self.customers = list(sync_customers().values())[:2]
+        self.tasks = [(customer, self.DATE) for customer in self.customers]
+
+    def test_ingest_round_trips_kepco_response(self):
+        saved, failed = ingest(self.tasks, log=lambda message: None)
+
+        self.assertEqual(failed, [])
+        self.assertEqual(saved, len(self.tasks) * len(SLOT_TIMES))
+        stored = load_days([c.cust_no for c in self.customers], [self.DATE])
+        for customer in self.customers:
+            expected = fake_kepco.day_lp_data(customer.cust_no, self.DATE)["dayLpDataInfoList"]
+            records = stored[(customer.cust_no, self.DATE)]["dayLpDataInfoList"]
+            self.assertEqual(records, [{key: record[key] for key in record if key not in ("custNo", "mr_ymd")}
+                                       for record in expected])
+
+    def test_ingest_again_updates_rows_in_place(self):
+        ingest(self.tasks, log=lambda message: None)
+        ingest(self.tasks, log=lambda message: None)
+
+        self.assertEqual(LoadProfile.objects.count(), len(self.tasks) * len(SLOT_TIMES))
+        self.assertEqual(StoredDay.objects.filter(complete=True).count(), len(self.tasks))
+
+    def test_save_days_is_atomic(self):
+        items = [(customer, self.DATE, fake_kepco.day_lp_data(customer.cust_no, self.DATE)) for customer in self.customers]
+        with mock.patch.object(StoredDay.objects, "bulk_create", side_effect=DatabaseError("fail")):
+            with self.assertRaises(DatabaseError):
+                save_days(items)
+
+        self.assertFalse(LoadProfile.objects.exists())
+        self.assertEqual(save_days(items), len(items) * len(SLOT_TIMES))
+        self.assertEqual(StoredDay.objects.count(), len(items))
@@ -0,0 +1,31 @@
+import json
+
+from .base import FakeKepcoTestCase
+
+
+def rounded(rows):
+    # json은 DataFrame.to_json(소수 10자리), ndjson은 json.dumps로 직렬화하므로 float 끝자리만 다를 수 있음
+    return [{key: round(value, 6) if isinstance(value, float) else value for key, value in row.items()} for row in rows]
+
+
+class NdjsonTests(FakeKepcoTestCase):
+    """returnType=ndjson이 json과 같은 레코드를 한 줄에 하나씩 스트리밍하는지."""
+
+    def lines(self, path):
+        response = self.client.get(path)
+        self.assertTrue(response.streaming)
+        self.assertTrue(response["Content-Type"].startswith("application/x-ndjson"))
+        return [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+
+    def test_daily_ndjson_matches_json(self):
+        path = "/ninja-api/powerSaving/kepcoDailyData?date=20250101"
+        rows = self.client.get(path).json()["data"]
+        streamed = self.lines(path + "&returnType=ndjson")
+
+        key = lambda row: row["Customer Number"]
+        self.assertEqual(rounded(sorted(streamed, key=key)), rounded(sorted(rows, key=key)))
+
+    def test_range_ndjson_matches_json(self):
+        path = "/ninja-api/powerSaving/kepcoDailyRangeData?startDate=20250101&endDate=20250102"
+        rows = self.client.get(path).json()["data"]
+        self.assertEqual(rounded(self.lines(path + "&returnType=ndjson")), rounded(rows))
@@ -0,0 +1,82 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from ..customers import get_registry
+from ..kepco_client import KepcoAPIError
+from ..throttle import CircuitBreaker, CircuitOpenError, KeyPool, TokenBucket
+from .base import FakeKepcoTestCase
+
+
+class ThrottleTests(SimpleTestCase):
+    """호출 속도 제한과 circuit breaker 상태 변화."""
+
+    def test_throttled_bucket_slows_down_and_recovers(self):
+        bucket = TokenBucket(rate=10, burst=2, min_rate=1, decrease=0.5, increase=1)
+        self.assertEqual((bucket._take(), bucket._take()), (0, 0))
+        self.assertGreater(bucket._take(), 0)
+
+        bucket.throttled(retry_after=5)
+        self.assertEqual(bucket.rate, 5)
+        self.assertGreater(bucket._take(), 4)
+        for _ in range(10):
+            bucket.succeeded()
+        self.assertEqual(bucket.rate, 10)
+
+    def test_key_pool_spreads_calls_over_keys(self):
+        pool = KeyPool({key: TokenBucket(rate=1, burst=1) for key in ("a", "b")})
+        self.assertEqual(sorted([pool._take()[0], pool._take()[0]]), ["a", "b"])
+        self.assertIsNone(pool._take()[0])
+
+    def test_breaker_opens_after_failures_and_half_opens(self):
+        breaker = CircuitBreaker("kepco", failure_threshold=2, reset_timeout=30)
+        breaker.record_failure()
+        breaker.before_call()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, "open")
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.opened_at -= 31
+        self.assertEqual(breaker.state, "half-open")
+        breaker.before_call()
+        # half-open에서는 시험 호출 한 건만 통과
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record_success()
+        self.assertEqual(breaker.state, "closed")
+
+
+class CustomerStatusTests(FakeKepcoTestCase):
+    """한 고객의 조회가 실패해도 다른 고객의 결과는 그대로 반환하고 실패한 고객은 Status에 오류를 기록하는지."""
+
+    def test_failing_customer_gets_error_status(self):
+        failing = get_registry().all()[3].cust_no
+        get = self.kepco.get
+
+        def flaky(endpoint, params):
+            if params["custNo"] == failing:
+                raise KepcoAPIError(503)
+            return get(endpoint, params)
+
+        with mock.patch.object(self.kepco, "get", side_effect=flaky):
+            data = self.client.get("/ninja-api/powerSaving/kepcoDailyData?date=20250101").json()
+
+        self.assertEqual(data["returnCode"], "ok")
+        rows = {row["Customer Number"]: row for row in data["data"]}
+        self.assertTrue(rows[failing]["Status"].startswith("error:"))
+        self.assertIsNone(rows[failing]["Power Usage"])
+        others = [row for cust_no, row in rows.items() if cust_no != failing]
+        self.assertTrue(all(row["Status"] == "ok" and row["Power Usage"] is not None for row in others))
+
+    def test_retries_take_a_rate_limit_token_each(self):
+        errors = iter([True, True])
+        acquire = self.kepco.keys.acquire
+        before = self.upstream_calls()
+        with mock.patch.object(self.server, "roll_error", side_effect=lambda: next(errors, False)), \
+                mock.patch.object(self.kepco.keys, "acquire", side_effect=acquire) as tokens:
+            data = self.kepco.get_day_lp_data("0000000001", "20250102")
+
+        self.assertTrue(data["dayLpDataInfoList"])
+        self.assertEqual(self.upstream_calls() - before, 3)
+        self.assertEqual(tokens.call_count, 3)
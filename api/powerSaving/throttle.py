@@ -0,0 +1,238 @@
+"""
+KEPCO OpenAPI 호출 속도 제한(token bucket)과 circuit breaker.
+
+KEPCO는 짧은 시간에 호출이 몰리면 429/503으로 응답을 제한합니다.
+KepcoClient / AsyncKepcoClient는 호출마다 (호스트, 서비스 키)별 TokenBucket에서 토큰을 받아 호출하며,
+제한 응답을 받으면 그 키의 호출 속도를 절반으로 줄이고(Retry-After가 있으면 그 시간 동안 멈춤)
+성공할 때마다 조금씩 다시 올립니다 (AIMD).
+서비스 키가 여러 개이면 KeyPool이 토큰이 있는 키를 돌아가며 골라 호출을 키들에 나눕니다.
+
+연속 FAILURE_THRESHOLD회 실패(통신 오류, 5xx, 재시도 후에도 429)하면 circuit이 열려
+RESET_TIMEOUT 초 동안은 KEPCO를 호출하지 않고 바로 CircuitOpenError를 발생시킵니다.
+이후 한 건을 시험 호출(half-open)해 성공하면 다시 닫힙니다.
+속도와 circuit 상태는 프로세스(gunicorn 워커)마다 따로 유지됩니다.
+"""
+import asyncio
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+# 워커당 최대 호출 속도(초당 호출 수)와 버스트 크기
+MAX_RATE = 20.0
+BURST = 16
+# 제한 응답 후 최소 호출 속도, 감소 비율, 성공 1건당 증가량
+MIN_RATE = 1.0
+RATE_DECREASE = 0.5
+RATE_INCREASE = 0.2
+# Retry-After 최대 대기(초)
+MAX_RETRY_AFTER = 60
+
+# 호출 속도를 줄이는 응답 상태 코드
+THROTTLE_STATUSES = (429, 503)
+
+# circuit breaker: 연속 실패 횟수, 열린 상태 유지 시간(초)
+FAILURE_THRESHOLD = 5
+RESET_TIMEOUT = 30
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """circuit이 열려 KEPCO를 호출하지 않은 경우. 기존 requests.RequestException 처리에 그대로 잡힙니다."""
+
+    def __init__(self, host, retry_in):
+        super().__init__(f"KEPCO circuit open for {host} (retry in {retry_in:.0f}s)")
+        self.retry_in = retry_in
+
+
+def retry_after_seconds(value):
+    """Retry-After 헤더 값(초)을 float로 반환합니다. 없거나 날짜 형식이면 None."""
+    try:
+        return min(max(float(value), 0.0), MAX_RETRY_AFTER)
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """호출 속도(rate)가 제한 응답에 따라 바뀌는 스레드 안전 token bucket."""
+
+    def __init__(self, rate=MAX_RATE, burst=BURST, min_rate=MIN_RATE,
+                 decrease=RATE_DECREASE, increase=RATE_INCREASE):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.decrease = decrease
+        self.increase = increase
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _take(self):
+        """토큰을 하나 가져오면 0을, 아니면 다시 시도할 때까지 기다릴 시간(초)을 반환합니다."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if now < self.paused_until:
+                return self.paused_until - now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self):
+        """토큰을 받을 때까지 기다립니다."""
+        while (wait := self._take()) > 0:
+            time.sleep(wait)
+
+    async def aacquire(self):
+        """acquire()의 비동기 버전."""
+        while (wait := self._take()) > 0:
+            await asyncio.sleep(wait)
+
+    def throttled(self, retry_after=None):
+        """제한 응답을 받은 경우: 호출 속도를 줄이고 retry_after 초 동안 토큰을 주지 않습니다."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self.tokens = 0.0
+            if retry_after:
+                self.paused_until = max(self.paused_until, time.monotonic() + retry_after)
+
+    def succeeded(self):
+        """정상 응답을 받은 경우: 호출 속도를 max_rate까지 조금씩 올립니다."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+
+class KeyPool:
+    """서비스 키별 TokenBucket 묶음. 토큰이 있는 키를 돌아가며 골라 호출을 여러 키에 나눕니다."""
+
+    def __init__(self, limiters):
+        # {서비스 키: TokenBucket}
+        self.limiters = dict(limiters)
+        self._keys = list(self.limiters)
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def _take(self):
+        """토큰을 받은 키와 0을, 모든 키에 토큰이 없으면 (None, 가장 짧은 대기 시간)을 반환합니다."""
+        with self._lock:
+            start = self._next
+            self._next = (start + 1) % len(self._keys)
+        waits = []
+        for offset in range(len(self._keys)):
+            key = self._keys[(start + offset) % len(self._keys)]
+            wait = self.limiters[key]._take()
+            if wait == 0:
+                return key, 0
+            waits.append(wait)
+        return None, min(waits)
+
+    def acquire(self):
+        """토큰을 받을 때까지 기다리고 사용할 서비스 키를 반환합니다."""
+        while True:
+            key, wait = self._take()
+            if key is not None:
+                return key
+            time.sleep(wait)
+
+    async def aacquire(self):
+        """acquire()의 비동기 버전."""
+        while True:
+            key, wait = self._take()
+            if key is not None:
+                return key
+            await asyncio.sleep(wait)
+
+    def set_rate(self, rate):
+        """모든 키의 최대/현재 호출 속도를 rate로 바꿉니다."""
+        for limiter in self.limiters.values():
+            with limiter._lock:
+                limiter.rate = limiter.max_rate = rate
+
+
+class CircuitBreaker:
+    """연속 실패 시 일정 시간 호출을 막는 circuit breaker (closed → open → half-open)."""
+
+    def __init__(self, host, failure_threshold=FAILURE_THRESHOLD, reset_timeout=RESET_TIMEOUT):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.trial_started = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            if self.opened_at is None:
+                return "closed"
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                return "open"
+            return "half-open"
+
+    def before_call(self):
+        """호출 전에 확인합니다. 열려 있으면 CircuitOpenError를 발생시킵니다 (half-open이면 한 건만 통과)."""
+        with self._lock:
+            if self.opened_at is None:
+                return
+            now = time.monotonic()
+            remaining = self.opened_at + self.reset_timeout - now
+            if remaining > 0:
+                raise CircuitOpenError(self.host, remaining)
+            # 시험 호출이 결과 없이 끝난 경우(취소 등)를 대비해 reset_timeout이 지나면 다시 허용
+            if self.trial_started is not None and now - self.trial_started < self.reset_timeout:
+                raise CircuitOpenError(self.host, self.trial_started + self.reset_timeout - now)
+            self.trial_started = now
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_started = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            # half-open 시험 호출이 실패하면 바로 다시 열림
+            if self.trial_started is not None or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self.trial_started = None
+
+    def stats(self):
+        return {"state": self.state, "failures": self.failures}
+
+
+_limiters = {}
+_breakers = {}
+_registry_lock = threading.Lock()
+
+
+def _host(base_url):
+    return urlsplit(base_url).netloc or base_url
+
+
+def get_limiter(base_url, service_key):
+    """base_url 호스트와 서비스 키의 프로세스 전역 TokenBucket을 반환합니다."""
+    key = (_host(base_url), service_key)
+    with _registry_lock:
+        if key not in _limiters:
+            _limiters[key] = TokenBucket()
+        return _limiters[key]
+
+
+def get_key_pool(base_url, service_keys):
+    """base_url 호스트에서 service_keys에 호출을 나누는 KeyPool을 반환합니다."""
+    return KeyPool((key, get_limiter(base_url, key)) for key in service_keys)
+
+
+def get_breaker(base_url):
+    """base_url 호스트의 프로세스 전역 CircuitBreaker를 반환합니다."""
+    host = _host(base_url)
+    with _registry_lock:
+        if host not in _breakers:
+            _breakers[host] = CircuitBreaker(host)
+        return _breakers[host]